@@ -0,0 +1,85 @@
+import argparse
+import pyupbit
+
+from datetime import datetime, timedelta, timezone
+from dotenv import load_dotenv
+
+from src.exchanges.history.candle_archive import CandleArchive
+from src.exchanges.history.candle_backfill import CandleBackfill
+from src.utils.fng import Fng
+from src.utils.logging import Logging
+
+load_dotenv()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="업비트 과거 캔들 백필")
+    parser.add_argument(
+        "--tickers",
+        default="KRW-BTC",
+        help='쉼표로 구분한 티커 목록 또는 "ALL" (KRW 마켓 전체)',
+    )
+    parser.add_argument(
+        "--intervals",
+        default="day",
+        help='쉼표로 구분한 인터벌 목록 (예: "minute1,minute60,day")',
+    )
+    parser.add_argument(
+        "--start", required=True, help="시작 일자 (KST, 예: 2021-01-01)"
+    )
+    parser.add_argument(
+        "--end", default=None, help="종료 일자 (KST, 미포함, default: 현재)"
+    )
+    parser.add_argument("--root", default="data/candles", help="아카이브 디렉토리")
+    parser.add_argument("--workers", type=int, default=8, help="동시 요청 수")
+    parser.add_argument("--rate", type=float, default=8.0, help="초당 요청 수 제한")
+    parser.add_argument(
+        "--flush-pages", type=int, default=50, help="저장/체크포인트 주기 (페이지)"
+    )
+    parser.add_argument(
+        "--fng",
+        action="store_true",
+        help="Fear & Greed Index 이력도 함께 저장 (리플레이 시장 컨텍스트용)",
+    )
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    if args.tickers.upper() == "ALL":
+        tickers = pyupbit.get_tickers(fiat="KRW")
+    else:
+        tickers = [ticker.strip() for ticker in args.tickers.split(",")]
+    intervals = [interval.strip() for interval in args.intervals.split(",")]
+
+    start = datetime.fromisoformat(args.start)
+    if args.end:
+        end = datetime.fromisoformat(args.end)
+    else:
+        # 현재 시각 (KST)
+        end = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=9)
+
+    Logging.init()
+    Logging.info(
+        f"[Backfill] {len(tickers)} tickers x {intervals} from {start} to {end}"
+    )
+
+    backfill = CandleBackfill(
+        archive=CandleArchive(root=args.root),
+        rate_limit=args.rate,
+        workers=args.workers,
+        flush_pages=args.flush_pages,
+    )
+    results = backfill.run(tickers=tickers, intervals=intervals, start=start, end=end)
+    Logging.info(f"[Backfill] done. {sum(results.values())} candles received")
+
+    if args.fng:
+        history = Fng.get_history(refresh=True)
+        Logging.info(
+            f"[Backfill] Fear & Greed history: {0 if history is None else len(history)} days"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+API 부하 테스트 / 지연 시간 벤치마크
+
+리플레이 거래소(녹화 캔들 + 모의 계좌)와 고정 응답 LLM 으로 앱을 띄운 뒤
+엔드포인트별로 지정한 동시성으로 요청을 보내고 다음을 측정합니다.
+- 지연 시간 p50/p95/p99 (클라이언트 측), 처리량 (req/s), 오류 수
+- 단계별 소요 시간 (Server-Timing 헤더: fetch, indicators, strategy, llm, order)
+
+결과는 JSON 으로 저장하며 --baseline 으로 이전 결과와 비교할 수 있습니다.
+
+사용 예:
+    python benchmarks/api_load_test.py --concurrency 8 --requests 500
+    python benchmarks/api_load_test.py --baseline benchmarks/results/api_load_prev.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+import numpy as np
+
+from datetime import datetime
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.synthetic import synthetic_ohlcv  # noqa: E402
+from src.exchanges.history.candle_archive import CandleArchive  # noqa: E402
+from src.utils.timing import StageTimer  # noqa: E402
+
+DEFAULT_ENDPOINTS = [
+    "/v1/strategy?ticker=KRW-BTC&strategy_type=Profitable",
+    "/v1/strategy?ticker=KRW-BTC&strategy_type=Ensemble",
+    "/v1/trade/strategy?ticker=KRW-BTC&strategy_type=Profitable",
+    "/v1/trade/agent?ticker=KRW-BTC&strategy_type=Profitable",
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Kestrel API 부하 테스트")
+    parser.add_argument(
+        "--endpoints",
+        nargs="+",
+        default=DEFAULT_ENDPOINTS,
+        help="요청할 경로 목록 (쿼리 포함)",
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수")
+    parser.add_argument(
+        "--requests", type=int, default=200, help="엔드포인트별 측정 요청 수"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=10, help="엔드포인트별 워밍업 요청 수"
+    )
+    parser.add_argument(
+        "--base-url",
+        default=None,
+        help="이미 실행 중인 서버 주소 (미지정 시 리플레이 모드로 앱 실행)",
+    )
+    parser.add_argument(
+        "--replay-root",
+        default=None,
+        help="리플레이 캔들 아카이브 (미지정 시 합성 데이터 생성)",
+    )
+    parser.add_argument("--replay-speed", type=float, default=60.0)
+    parser.add_argument(
+        "--llm-latency", type=float, default=0.0, help="고정 응답 LLM 지연 (초)"
+    )
+    parser.add_argument(
+        "--database-uri",
+        default=None,
+        help="비동기 DB URI (미지정 시 임시 SQLite 파일 사용, aiosqlite 필요)",
+    )
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    return parser.parse_args()
+
+
+def write_synthetic_candles(root: str, ticker: str, days: int = 400):
+    """합성 60분봉을 아카이브에 기록"""
+    df = synthetic_ohlcv(bars=days * 24, freq="60min", start="2023-01-01 09:00")
+    CandleArchive(root=root).write(ticker, "minute60", df)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(args, workdir: str) -> tuple[subprocess.Popen, str]:
+    replay_root = args.replay_root
+    if replay_root is None:
+        replay_root = os.path.join(workdir, "candles")
+        write_synthetic_candles(replay_root, "KRW-BTC")
+
+    port = free_port()
+    env = dict(
+        os.environ,
+        KESTREL_EXCHANGE_MODE="replay",
+        KESTREL_AGENT_MODE="stub",
+        AGENT_STUB_LATENCY=str(args.llm_latency),
+        REPLAY_DATA_ROOT=replay_root,
+        REPLAY_SPEED=str(args.replay_speed),
+        ASYNC_DATABASE_URI=args.database_uri
+        or f"sqlite+aiosqlite:///{os.path.join(workdir, 'bench.db')}",
+        DATABASE_AUTO_MIGRATE="true",
+        STRATEGY_STATE_PATH=os.path.join(workdir, "strategy_state.json"),
+        FNG_ENABLED="false",
+        NEWS_ENABLED="false",
+        LANGCHAIN_API_KEY="",
+    )
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+    return process, f"http://127.0.0.1:{port}"
+
+
+async def wait_ready(base_url: str, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f"Server did not start within {timeout}s")
+
+
+def parse_server_timing(header: str | None) -> Dict[str, float]:
+    """Server-Timing 헤더 -> {단계: ms}"""
+    stages = {}
+    for metric in (header or "").split(","):
+        name, _, duration = metric.strip().partition(";dur=")
+        if name and duration:
+            stages[name] = float(duration)
+    return stages
+
+
+async def run_endpoint(
+    client: httpx.AsyncClient, path: str, total: int, concurrency: int
+) -> dict:
+    latencies: List[float] = []
+    stages: Dict[str, List[float]] = {}
+    errors: Dict[str, int] = {}
+    remaining = total
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            try:
+                response = await client.get(path)
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                response, status = None, type(e).__name__
+            latencies.append((time.perf_counter() - started) * 1000)
+            if status != "200":
+                errors[status] = errors.get(status, 0) + 1
+            if response is not None:
+                timing = parse_server_timing(response.headers.get("server-timing"))
+                for name, duration in timing.items():
+                    stages.setdefault(name, []).append(duration)
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+
+    values = np.array(latencies)
+    return {
+        "requests": total,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 4),
+        "throughput_rps": round(total / elapsed, 2),
+        "latency_ms": {
+            "mean": round(float(values.mean()), 3),
+            "p50": round(float(np.percentile(values, 50)), 3),
+            "p95": round(float(np.percentile(values, 95)), 3),
+            "p99": round(float(np.percentile(values, 99)), 3),
+            "max": round(float(values.max()), 3),
+        },
+        "stages_ms": {
+            name: {
+                "mean": round(float(np.mean(durations)), 3),
+                "p95": round(float(np.percentile(durations, 95)), 3),
+            }
+            for name, durations in stages.items()
+        },
+    }
+
+
+async def run_benchmark(args, base_url: str) -> Dict[str, dict]:
+    results = {}
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120
+    ) as client:
+        for path in args.endpoints:
+            if args.warmup:
+                await run_endpoint(client, path, args.warmup, args.concurrency)
+            results[path] = await run_endpoint(
+                client, path, args.requests, args.concurrency
+            )
+            print_result(path, results[path])
+    return results
+
+
+def print_result(path: str, result: dict):
+    latency = result["latency_ms"]
+    stage_names = [name for name in StageTimer.STAGES if name in result["stages_ms"]]
+    stages = ", ".join(
+        f"{name} {result['stages_ms'][name]['mean']:.2f}" for name in stage_names
+    )
+    print(
+        f"{path}\n"
+        f"  {result['throughput_rps']:>8.1f} req/s | "
+        f"p50 {latency['p50']:.2f} ms, p95 {latency['p95']:.2f} ms, "
+        f"p99 {latency['p99']:.2f} ms | errors {sum(result['errors'].values())}\n"
+        f"  stages (mean ms): {stages or '-'}"
+    )
+
+
+def compare(results: Dict[str, dict], baseline_path: str):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    print(f"\nCompared with {baseline_path}")
+    for path, result in results.items():
+        previous = baseline.get(path)
+        if previous is None:
+            continue
+
+        def change(current: float, before: float) -> str:
+            return f"{(current - before) / before * 100:+.1f}%" if before else "n/a"
+
+        print(
+            f"  {path}: "
+            f"throughput {change(result['throughput_rps'], previous['throughput_rps'])}, "
+            f"p50 {change(result['latency_ms']['p50'], previous['latency_ms']['p50'])}, "
+            f"p95 {change(result['latency_ms']['p95'], previous['latency_ms']['p95'])}"
+        )
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def main():
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        process = None
+        base_url = args.base_url
+        if base_url is None:
+            process, base_url = start_server(args, workdir)
+        try:
+            asyncio.run(wait_ready(base_url))
+            results = asyncio.run(run_benchmark(args, base_url))
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait(timeout=30)
+
+    report = {
+        "created_at": datetime.now().isoformat(),
+        "revision": git_revision(),
+        "config": {
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "replay_speed": args.replay_speed,
+            "llm_latency": args.llm_latency,
+            "base_url": args.base_url,
+        },
+        "results": results,
+    }
+    output = args.output or os.path.join(
+        ROOT, "benchmarks", "results", f"api_load_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {output}")
+
+    if args.baseline:
+        compare(results, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+"""
+지표/전략/백테스트 핫패스 마이크로 벤치마크
+
+합성 OHLCV 데이터(1k ~ 10M 봉)로 다음 함수의 실행 시간과 최대 메모리를 측정합니다.
+- Indicator.add_sub_indicators
+- TradingStrategy.analyze (전체 구간 지표 계산 + 조건 평가)
+- ProfitableRealTimeStrategy.analyze_market (모든 봉에 대해 순차 분석)
+- BacktestingStrategy.run (그래프 출력 제외)
+- AnalyzerMixin (MDD, 샤프 비율, 승률)
+- 분석 데이터(LLM 입력) JSON 직렬화 (기존 to_json + json.dumps 이중 인코딩 / Serializer)
+
+결과는 JSON 으로 저장하며 저장된 기준 결과(baseline)와 비교 리포트를 출력합니다.
+백테스트처럼 봉 수에 비해 느린 항목은 기본 최대 크기(max_bars)까지만 실행합니다. (--no-cap 으로 해제)
+
+사용 예:
+    python benchmarks/micro_benchmarks.py --save-baseline
+    python benchmarks/micro_benchmarks.py --sizes 1000 100000 --only indicators
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# 측정 중 로그 출력 제외 (백테스트 봉 단위 로그 끔)
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+os.environ.setdefault("LOG_BACKTEST_SAMPLE", "0")
+
+from benchmarks.synthetic import synthetic_ohlcv  # noqa: E402
+from src.exchanges.strategy.analyzer.analyzer_result import AnalyzerMixin  # noqa: E402
+from src.exchanges.strategy.strategies.profitable_realtime_strategy import (  # noqa: E402
+    MarketData,
+    ProfitableRealTimeStrategy,
+    TALibIndicator,
+    TradingParameters,
+    TradingStrategy,
+)
+from src.exchanges.strategy.strategy import BacktestingStrategy  # noqa: E402
+from src.utils.indicator import Indicator  # noqa: E402
+from src.utils.serialization import Serializer  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000, 10_000_000]
+DEFAULT_BASELINE = os.path.join(ROOT, "benchmarks", "results", "micro_baseline.json")
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[[pd.DataFrame], Any]  # 측정 제외 준비 단계 (입력 생성)
+    run: Callable[[Any], Any]  # 측정 대상
+    max_bars: int  # 기본 최대 봉 수
+
+
+def _market_data(df: pd.DataFrame) -> MarketData:
+    return MarketData(
+        close=df["close"].to_numpy(),
+        high=df["high"].to_numpy(),
+        low=df["low"].to_numpy(),
+    )
+
+
+def _analyze_market_all(strategy: ProfitableRealTimeStrategy):
+    for index in range(50, len(strategy.df)):
+        strategy.analyze_market(current_index=index)
+
+
+def _value_history(df: pd.DataFrame) -> list:
+    return (df["close"] / df["close"].iloc[0] * 100_000_000).tolist()
+
+
+def _trades(df: pd.DataFrame) -> list:
+    pnl = np.diff(df["close"].to_numpy(), prepend=df["close"].iloc[0])
+    return [SimpleNamespace(pnl=value) for value in pnl]
+
+
+def _analysis_data_legacy(df: pd.DataFrame) -> str:
+    # 기존 방식: 데이터프레임을 JSON 문자열로 만든 뒤 다시 JSON 으로 인코딩
+    return json.dumps({"OHLCV With Indicators": df.to_json()}, indent=2)
+
+
+def _analysis_data(df: pd.DataFrame) -> bytes:
+    return Serializer.dumps({"OHLCV With Indicators": Serializer.frame(df)})
+
+
+analyzer = AnalyzerMixin()
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark(
+        name="indicators.add_sub_indicators",
+        setup=lambda df: df,
+        run=lambda df: Indicator.add_sub_indicators(df.copy()),
+        max_bars=10_000_000,
+    ),
+    Benchmark(
+        name="strategy.analyze",
+        setup=lambda df: (
+            TradingStrategy(TradingParameters(), TALibIndicator()),
+            _market_data(df),
+        ),
+        run=lambda args: args[0].analyze(args[1]),
+        max_bars=10_000_000,
+    ),
+    Benchmark(
+        name="strategy.analyze_market",
+        setup=lambda df: ProfitableRealTimeStrategy(df=df),
+        run=_analyze_market_all,
+        max_bars=100_000,
+    ),
+    Benchmark(
+        name="backtest.run",
+        setup=lambda df: Indicator.add_sub_indicators(df.copy()),
+        run=lambda df: BacktestingStrategy.run(df, plot=False, use_store=False),
+        max_bars=100_000,
+    ),
+    Benchmark(
+        name="analyzer.max_drawdown",
+        setup=_value_history,
+        run=analyzer.calculate_max_drawdown,
+        max_bars=10_000_000,
+    ),
+    Benchmark(
+        name="analyzer.sharpe_ratio",
+        setup=lambda df: df["close"].pct_change().dropna(),
+        run=analyzer.calculate_sharpe_ratio,
+        max_bars=10_000_000,
+    ),
+    Benchmark(
+        name="analyzer.win_rate",
+        setup=_trades,
+        run=analyzer.calculate_win_rate,
+        max_bars=1_000_000,
+    ),
+    Benchmark(
+        name="serialization.analysis_data_legacy",
+        setup=lambda df: Indicator.add_sub_indicators(df.copy()),
+        run=_analysis_data_legacy,
+        max_bars=1_000_000,
+    ),
+    Benchmark(
+        name="serialization.analysis_data",
+        setup=lambda df: Indicator.add_sub_indicators(df.copy()),
+        run=_analysis_data,
+        max_bars=1_000_000,
+    ),
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Kestrel 마이크로 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--only", nargs="+", default=None, help="이름에 포함된 문자열로 항목 선택"
+    )
+    parser.add_argument("--no-cap", action="store_true", help="max_bars 제한 해제")
+    parser.add_argument(
+        "--min-time", type=float, default=1.0, help="항목별 최소 반복 측정 시간 (초)"
+    )
+    parser.add_argument("--max-repeats", type=int, default=20)
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="결과를 baseline 으로 저장"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.10, help="회귀/개선 판정 기준 비율"
+    )
+    parser.add_argument(
+        "--fail-on-regression", action="store_true", help="회귀 시 종료 코드 1"
+    )
+    return parser.parse_args()
+
+
+def measure(benchmark: Benchmark, df: pd.DataFrame, args) -> Dict[str, float]:
+    data = benchmark.setup(df)
+
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        # 시간 측정: 최소 min_time 동안 반복 (최소 1회, 최대 max_repeats 회)
+        timings = []
+        deadline = time.perf_counter() + args.min_time
+        while len(timings) < args.max_repeats:
+            gc.collect()
+            started = time.perf_counter()
+            benchmark.run(data)
+            timings.append(time.perf_counter() - started)
+            if time.perf_counter() >= deadline:
+                break
+
+        # 메모리 측정: tracemalloc 은 실행을 느리게 하므로 별도 1회 실행
+        gc.collect()
+        tracemalloc.start()
+        benchmark.run(data)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "seconds_min": min(timings),
+        "seconds_median": statistics.median(timings),
+        "repeats": len(timings),
+        "peak_mb": peak / 1024 / 1024,
+    }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float):
+    """기준 결과 대비 시간(최소값)과 최대 메모리 변화 리포트. 회귀 항목 수를 반환"""
+    regressions = 0
+    print(
+        f"\n{'benchmark':<44} {'time':>12} {'change':>9} {'peak MB':>10} {'change':>9}"
+    )
+    for key, result in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            print(f"{key:<44} {result['seconds_min'] * 1000:>10.2f}ms {'new':>9}")
+            continue
+        time_ratio = result["seconds_min"] / previous["seconds_min"]
+        memory_ratio = (
+            result["peak_mb"] / previous["peak_mb"] if previous["peak_mb"] else 1.0
+        )
+        verdict = ""
+        if time_ratio > 1 + threshold or memory_ratio > 1 + threshold:
+            verdict = "REGRESSION"
+            regressions += 1
+        elif time_ratio < 1 - threshold or memory_ratio < 1 - threshold:
+            verdict = "improved"
+        print(
+            f"{key:<44} {result['seconds_min'] * 1000:>10.2f}ms "
+            f"{(time_ratio - 1) * 100:>+8.1f}% {result['peak_mb']:>10.1f} "
+            f"{(memory_ratio - 1) * 100:>+8.1f}% {verdict}"
+        )
+    return regressions
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, text=True
+        ).strip()
+    except Exception:
+        return None
+
+
+def main():
+    args = parse_args()
+    benchmarks = [
+        benchmark
+        for benchmark in BENCHMARKS
+        if args.only is None or any(name in benchmark.name for name in args.only)
+    ]
+
+    results: Dict[str, dict] = {}
+    for bars in sorted(args.sizes):
+        targets = [
+            benchmark
+            for benchmark in benchmarks
+            if args.no_cap or bars <= benchmark.max_bars
+        ]
+        if not targets:
+            continue
+        # 10M 봉까지 시각 범위를 넘지 않도록 1분봉으로 생성
+        df = synthetic_ohlcv(bars=bars, freq="1min")
+        for benchmark in targets:
+            key = f"{benchmark.name}@{bars}"
+            results[key] = measure(benchmark, df, args)
+            print(
+                f"{key:<44} {results[key]['seconds_min'] * 1000:>10.2f}ms "
+                f"(median {results[key]['seconds_median'] * 1000:.2f}ms, "
+                f"x{results[key]['repeats']}) peak {results[key]['peak_mb']:.1f}MB"
+            )
+        del df
+
+    report = {
+        "created_at": datetime.now().isoformat(),
+        "revision": git_revision(),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+    output = args.output or os.path.join(
+        ROOT, "benchmarks", "results", f"micro_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {output}")
+
+    regressions = 0
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"Compared with {args.baseline} ({baseline.get('revision')})")
+        regressions = compare(results, baseline["results"], args.threshold)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Saved baseline {args.baseline}")
+
+    if args.fail_on_regression and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""
+API 프로세스 시작 시간 벤치마크
+
+새 파이썬 프로세스에서 다음을 측정합니다.
+- 모듈별 import 시간 (main, 서비스, 에이전트, 백테스트 모듈)
+- import main 후 로드된 무거운 패키지 (backtrader, langchain 등)
+- python -X importtime 기준 누적 import 시간 상위 모듈
+- uvicorn 콜드 스타트 (프로세스 실행 ~ 첫 응답)
+
+결과는 JSON 으로 저장하며 --baseline 으로 이전 결과와 비교할 수 있습니다.
+
+사용 예:
+    python benchmarks/startup_benchmark.py --repeats 5
+    python benchmarks/startup_benchmark.py --baseline benchmarks/results/startup_prev.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from datetime import datetime
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.api_load_test import free_port, git_revision  # noqa: E402
+
+DEFAULT_MODULES = [
+    "main",
+    "src.services.exchange_service",
+    "src.agents.kestrel_agent",
+    "src.exchanges.strategy.strategy",
+]
+
+# import main 후 로드 여부를 확인할 무거운 패키지
+HEAVY_PACKAGES = [
+    "backtrader",
+    "matplotlib",
+    "langchain_core",
+    "langchain_openai",
+    "openai",
+    "talib",
+    "pyupbit",
+    "asyncpg",
+]
+
+IMPORT_SCRIPT = """
+import sys, time, json
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "loaded": [p for p in {packages!r} if p in sys.modules]}}))
+"""
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Kestrel 시작 시간 벤치마크")
+    parser.add_argument("--modules", nargs="+", default=DEFAULT_MODULES)
+    parser.add_argument("--repeats", type=int, default=5, help="모듈별 측정 횟수")
+    parser.add_argument("--top", type=int, default=15, help="importtime 상위 모듈 수")
+    parser.add_argument(
+        "--no-server", action="store_true", help="uvicorn 콜드 스타트 측정 생략"
+    )
+    parser.add_argument("--output", default=None, help="결과 JSON 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON")
+    return parser.parse_args()
+
+
+def bench_env(workdir: str) -> dict:
+    # 실거래 모드 그대로 측정 (시작 시 외부 호출 없음), DB 는 임시 SQLite 사용
+    return dict(
+        os.environ,
+        KESTREL_EXCHANGE_MODE="live",
+        ASYNC_DATABASE_URI=f"sqlite+aiosqlite:///{os.path.join(workdir, 'bench.db')}",
+        LANGCHAIN_API_KEY="",
+        LOG_LEVEL="WARNING",
+    )
+
+
+def measure_import(module: str, env: dict, repeats: int) -> dict:
+    timings: List[float] = []
+    loaded: List[str] = []
+    for _ in range(repeats):
+        output = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                IMPORT_SCRIPT.format(module=module, packages=HEAVY_PACKAGES),
+            ],
+            cwd=ROOT,
+            env=env,
+            text=True,
+        )
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result["seconds"])
+        loaded = result["loaded"]
+    return {
+        "seconds_min": min(timings),
+        "seconds_median": statistics.median(timings),
+        "loaded": loaded,
+    }
+
+
+def import_profile(env: dict, top: int) -> List[dict]:
+    """python -X importtime 기준 import main 누적 시간 상위 패키지"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    # importtime 은 하위 모듈을 부모보다 먼저 출력 (들여쓰기 1칸 = 최상위, 3칸 = 그 하위)
+    children: List[tuple] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        depth = len(name) - len(name.lstrip())
+        if depth == 3:
+            children.append((name.strip(), int(cumulative)))
+        elif depth == 1:
+            if name.strip() == "main":
+                break
+            children = []
+
+    # main 이 직접 로드한 모듈을 최상위 패키지 단위로 합산
+    packages: Dict[str, int] = {}
+    for module, cumulative in children:
+        package = module.split(".")[0]
+        packages[package] = packages.get(package, 0) + cumulative
+    return [
+        {"package": package, "ms": round(us / 1000, 1)}
+        for package, us in sorted(packages.items(), key=lambda item: -item[1])[:top]
+    ]
+
+
+def measure_cold_start(env: dict, timeout: float = 60.0) -> float:
+    """uvicorn 프로세스 실행부터 첫 200 응답까지 걸린 시간 (초)"""
+    port = free_port()
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                if httpx.get(f"http://127.0.0.1:{port}/").status_code == 200:
+                    return time.perf_counter() - started
+            except httpx.TransportError:
+                pass
+            time.sleep(0.02)
+        raise TimeoutError(f"Server did not start within {timeout}s")
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def compare(report: dict, baseline_path: str):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\nCompared with {baseline_path} ({baseline.get('revision')})")
+
+    def change(current: float, before: float) -> str:
+        return f"{(current - before) / before * 100:+.1f}%" if before else "n/a"
+
+    for module, result in report["imports"].items():
+        previous = baseline["imports"].get(module)
+        if previous is not None:
+            print(
+                f"  import {module}: "
+                f"{change(result['seconds_median'], previous['seconds_median'])}"
+            )
+    if report.get("cold_start_s") and baseline.get("cold_start_s"):
+        print(
+            f"  cold start: {change(report['cold_start_s'], baseline['cold_start_s'])}"
+        )
+
+
+def main():
+    args = parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        env = bench_env(workdir)
+
+        imports = {}
+        for module in args.modules:
+            imports[module] = measure_import(module, env, args.repeats)
+            print(
+                f"import {module:<40} {imports[module]['seconds_median'] * 1000:>8.1f} ms "
+                f"(min {imports[module]['seconds_min'] * 1000:.1f} ms)"
+            )
+        print(
+            f"\nloaded by main: {', '.join(imports.get('main', {}).get('loaded', [])) or '-'}"
+        )
+
+        packages = import_profile(env, args.top)
+        print("\nimport main (cumulative, by top-level package):")
+        for item in packages:
+            print(f"  {item['package']:<30} {item['ms']:>8.1f} ms")
+
+        cold_start = None
+        if not args.no_server:
+            cold_start = measure_cold_start(env)
+            print(f"\nuvicorn cold start (spawn -> first response): {cold_start:.2f} s")
+
+    report = {
+        "created_at": datetime.now().isoformat(),
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "imports": imports,
+        "import_profile": packages,
+        "cold_start_s": cold_start,
+    }
+    output = args.output or os.path.join(
+        ROOT, "benchmarks", "results", f"startup_{datetime.now():%Y%m%d_%H%M%S}.json"
+    )
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved {output}")
+
+    if args.baseline:
+        compare(report, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+
+def synthetic_ohlcv(
+    bars: int,
+    freq: str = "60min",
+    start: str = "2020-01-01 09:00",
+    price: float = 50_000_000,
+    volatility: float = 0.005,
+    seed: int = 42,
+) -> pd.DataFrame:
+    """
+    기하 브라운 운동으로 재현 가능한 합성 OHLCV 데이터를 생성합니다.
+    (같은 seed 와 bars 면 항상 같은 데이터)
+
+    Returns:
+        pd.DataFrame: open/high/low/close/volume/value (인덱스: KST 시각)
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(start, periods=bars, freq=freq)
+    close = price * np.exp(np.cumsum(rng.normal(0, volatility, bars)))
+    open_ = np.r_[close[0], close[:-1]]
+    high = np.maximum(open_, close) * (1 + rng.uniform(0, volatility * 0.6, bars))
+    low = np.minimum(open_, close) * (1 - rng.uniform(0, volatility * 0.6, bars))
+    volume = rng.uniform(10, 100, bars)
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
+            "value": volume * close,
+        },
+        index=index,
+    )
@@ -1,22 +1,51 @@
+from contextlib import asynccontextmanager
+import asyncio
+import hmac
+
+from datetime import date, datetime
 from dotenv import load_dotenv
 
-from fastapi import Depends, FastAPI, status, Request
-from fastapi.responses import JSONResponse
+from fastapi import Depends, FastAPI, Header, Query, Response, status, Request
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from requests import Session
-
-from src.agents.kestrel_agent import KestrelAiAgent
-from src.databases.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import (
+    ADMIN_TOKEN,
+    DATABASE_AUTO_MIGRATE,
+    FNG_ENABLED,
+    NEWS_ENABLED,
+    PROFILING_ENABLED,
+)
+from src.databases.database import close_db, get_db, migrate
 from src.exchanges.strategy.strategies.datas.types import StrategyType
-from src.exchanges.upbit.upbit_exchange import UpbitExchange
 from src.models.exception.http_json_exception import HttpJsonException
-from src.models.response.base_response_dto import BaseResponse
+from src.models.response.base_response_dto import (
+    BaseCursorListResponse,
+    BaseListResponse,
+    BaseResponse,
+)
+from src.models.position_dto import PositionDto, PositionSnapshotDto
+from src.models.profile_dto import ProfileDto
 from src.models.response.health_response_dto import HealthResponseDto
+from src.models.trade_dto import TradeDailyStatDto, TradeDto
 from src.models.trading_dto import TradingDto
 from src.models.trading_signal_dto import TradingSignalDto
 from src.services.exchange_service import ExchangeService
+from src.services.position_ledger_service import PositionLedgerService
+from src.services.profile_service import ProfileService
+from src.services.signal_stream_service import SignalStreamService
+from src.services.strategy_state_service import StrategyStateService
+from src.services.trade_history_service import TradeHistoryService
+from src.services.trade_journal_service import TradeJournalService
 from src.services.trade_service import TradeService
+from src.utils.fng import Fng
 from src.utils.logging import Logging
+from src.utils.metrics import Metrics
+from src.utils.news import News
+from src.utils.profiler import Profiler
+from src.utils.serialization import OrjsonResponse
+from src.utils.timing import StageTimer
 
 # 로깅 초기화
 Logging.init()
@@ -24,8 +53,37 @@ Logging.init()
 # .env 파일에서 환경변수 로드
 load_dotenv()
 
-# FastAPI 애플리케이션 인스턴스 생성
-app = FastAPI()
+
+# 애플리케이션 시작/종료 처리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 스키마는 migrate.py 로 생성 (DATABASE_AUTO_MIGRATE=true 면 시작 시 생성)
+    if DATABASE_AUTO_MIGRATE:
+        await migrate()
+    # 트레이드 저널 writer 시작
+    await trade_journal.start()
+    # 실시간 전략 상태 복원 및 주기적 스냅샷 시작
+    await strategy_state_service.start()
+    # Fear & Greed / 뉴스 백그라운드 갱신 시작 (요청 경로에서는 마지막 값만 사용)
+    if FNG_ENABLED:
+        await Fng.provider.start()
+    if NEWS_ENABLED:
+        await News.provider.start()
+    # 신호 스트림 마켓 폴러 시작
+    await signal_stream_service.start()
+    yield
+    # 열린 신호 스트림 종료 (종료 대기 중 SSE 연결이 남지 않도록)
+    await signal_stream_service.stop()
+    await Fng.provider.stop()
+    await News.provider.stop()
+    await strategy_state_service.stop()
+    # 남은 저널 레코드 저장 후 커넥션 풀 정리
+    await trade_journal.stop()
+    await close_db()
+
+
+# FastAPI 애플리케이션 인스턴스 생성 (응답 본문은 orjson 으로 인코딩)
+app = FastAPI(lifespan=lifespan, default_response_class=OrjsonResponse)
 
 # CORS 미들웨어 설정 - 크로스 오리진 리소스 공유 허용
 app.add_middleware(
@@ -36,6 +94,84 @@ app.add_middleware(
     allow_headers=["*"],  # 모든 HTTP 헤더 허용
 )
 
+
+# 요청별 단계 소요 시간 측정 (Server-Timing 헤더로 응답, Prometheus 지표 기록)
+@app.middleware("http")
+async def server_timing_middleware(request: Request, call_next):
+    timer, token = StageTimer.begin()
+    status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+    finally:
+        StageTimer.end(token)
+        # 경로 파라미터별로 지표가 나뉘지 않도록 라우트 템플릿 사용
+        route = request.scope.get("route")
+        Metrics.observe_request(
+            method=request.method,
+            route=route.path if route is not None else "unmatched",
+            status=status_code,
+            seconds=timer.total(),
+        )
+    response.headers["Server-Timing"] = timer.server_timing()
+    return response
+
+
+# 관리자 토큰 확인 (ADMIN_TOKEN 미설정 시 항상 거부)
+def is_admin(token: str | None) -> bool:
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(token or "", ADMIN_TOKEN)
+
+
+# 관리자 API 인증 (X-Admin-Token 헤더)
+def require_admin(x_admin_token: str | None = Header(None)):
+    if not is_admin(x_admin_token):
+        raise HttpJsonException(
+            status_code=status.HTTP_403_FORBIDDEN, error_message="Forbidden"
+        )
+
+
+# 프로파일 API 가드 (프로파일링 비활성 시 404, 관리자만 조회)
+def require_profiling(x_admin_token: str | None = Header(None)):
+    if not PROFILING_ENABLED:
+        raise HttpJsonException(
+            status_code=status.HTTP_404_NOT_FOUND, error_message="Not Found"
+        )
+    require_admin(x_admin_token)
+
+
+# 온디맨드 프로파일링 (X-Profile: 1 헤더 또는 ?profile=1, 관리자 토큰 필요, 프로파일 ID = 요청 ID)
+@app.middleware("http")
+async def profiling_middleware(request: Request, call_next):
+    if (
+        not PROFILING_ENABLED
+        or (
+            request.headers.get("x-profile") != "1"
+            and request.query_params.get("profile") != "1"
+        )
+        or not is_admin(request.headers.get("x-admin-token"))
+    ):
+        return await call_next(request)
+    with Profiler.capture(
+        name=f"{request.method} {request.url.path}",
+        profile_id=Logging.request_id(),
+    ) as profile_id:
+        response = await call_next(request)
+    response.headers["X-Profile-ID"] = profile_id
+    return response
+
+
+# 요청 ID 설정 (X-Request-ID 헤더가 있으면 사용, 로그의 request_id 로 기록)
+@app.middleware("http")
+async def request_id_middleware(request: Request, call_next):
+    token = Logging.bind_request_id(request.headers.get("x-request-id"))
+    try:
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = Logging.request_id()
+        return response
+    finally:
+        Logging.reset_request_id(token)
+
+
 # LangSmith Enabled
 Logging.langSmith(project_name="Kestrel")
 
@@ -43,7 +179,7 @@ Logging.langSmith(project_name="Kestrel")
 # 예외 처리기 설정
 @app.exception_handler(HttpJsonException)
 async def unicorn_exception_handler(request: Request, exc: HttpJsonException):
-    return JSONResponse(
+    return OrjsonResponse(
         status_code=exc.status_code,
         content={
             "statusCode": exc.status_code,
@@ -55,6 +191,26 @@ async def unicorn_exception_handler(request: Request, exc: HttpJsonException):
 # 서비스 인스턴스 생성
 exchange_service = ExchangeService()
 trader_service = TradeService()
+position_ledger_service = PositionLedgerService()
+trade_journal = TradeJournalService(
+    fill_resolver=trader_service.exchange.get_order_fill,
+    after_write=position_ledger_service.apply_new_fills,
+)
+trade_history_service = TradeHistoryService()
+profile_service = ProfileService()
+strategy_state_service = StrategyStateService(exchange_service.strategy_state)
+signal_stream_service = SignalStreamService(
+    strategy_state=exchange_service.strategy_state
+)
+
+
+# 매매 결정에 따른 거래 비율
+def get_trade_percentage(decision: str, buy_percent: float, sell_percent: float):
+    if decision == "BUY":
+        return buy_percent
+    elif decision == "SELL":
+        return sell_percent
+    return 0
 
 
 # Get Health API
@@ -71,12 +227,22 @@ async def health():
     try:
         return HealthResponseDto(status="OK")
     except Exception as e:
-        print("Exception occurred:", e)
+        Logging.error(msg="Exception occurred in [health]:", error=e)
         raise HttpJsonException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
         )
 
 
+# Get Metrics API
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus 지표 (단계별 소요 시간, 거래소 API 호출, 캐시 적중, LLM 토큰/비용, 주문 결과)
+    """
+    content, content_type = Metrics.export()
+    return Response(content=content, media_type=content_type)
+
+
 # Get Strategy API
 @app.get(
     "/v1/strategy",
@@ -109,6 +275,47 @@ async def strategy(
         )
 
 
+# Signal Stream API
+@app.get(
+    "/v1/signals/stream",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+)
+async def signal_stream(
+    tickers: list[str] = Query(["KRW-BTC"]),
+    strategy_types: list[StrategyType] = Query([StrategyType.PROFITABLE]),
+    interval: str = "day",
+):
+    """
+    매매 신호 변경을 Server-Sent Events 로 전송 (/v1/strategy 반복 조회 대체)
+
+    Args:
+        tickers (list[str]): 구독할 티커 (반복 파라미터, 예: ?tickers=KRW-BTC&tickers=KRW-ETH)
+        strategy_types (list[StrategyType]): 구독할 전략 (반복 파라미터)
+        interval (str): 캔들 인터벌 (default: "day")
+    Returns:
+        StreamingResponse: text/event-stream
+            - event: signal (신호 변경) / candle (새 봉 평가, 신호 동일)
+            - data: SignalEventDto JSON
+            - 구독 직후 마지막으로 평가된 신호를 먼저 전송
+    """
+    try:
+        subscription = signal_stream_service.subscribe(
+            tickers=tickers, strategy_types=strategy_types, interval=interval
+        )
+        return StreamingResponse(
+            signal_stream_service.stream(subscription),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+    except HttpJsonException as e:
+        raise e
+    except Exception as e:
+        raise HttpJsonException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+        )
+
+
 # Get Strategy Trade API
 @app.get(
     "/v1/trade/strategy",
@@ -153,6 +360,17 @@ async def trade_strategy(
             sell_percent=sell_percent,
         )
 
+        # 트레이드 저널 기록 (백그라운드 저장)
+        trade_journal.record_trade(
+            ticker=ticker,
+            trading_dto=trading_response.item,
+            strategy_type=strategy_type.value,
+            provider="strategy",
+            percentage=get_trade_percentage(
+                trading_response.item.decision, buy_percent, sell_percent
+            ),
+        )
+
         return trading_response
     except HttpJsonException as e:
         raise e
@@ -169,7 +387,6 @@ async def trade_strategy(
     response_model=BaseResponse[TradingDto],
 )
 async def trade_agent(
-    db: Session = Depends(get_db),
     ticker: str = "KRW-BTC",
     strategy_type: StrategyType = StrategyType.PROFITABLE,
     buy_percent: float = 30,
@@ -203,6 +420,17 @@ async def trade_agent(
         trading_response.item.completion_tokens = completion_tokens
         trading_response.item.total_cost = total_cost
 
+        # 트레이드 저널 기록 (백그라운드 저장)
+        trade_journal.record_trade(
+            ticker=ticker,
+            trading_dto=trading_response.item,
+            strategy_type=strategy_type.value,
+            provider="openai",
+            percentage=get_trade_percentage(
+                trading_response.item.decision, buy_percent, sell_percent
+            ),
+        )
+
         return trading_response
     except HttpJsonException as e:
         raise e
@@ -210,3 +438,270 @@ async def trade_agent(
         raise HttpJsonException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
         )
+
+
+# Get Trades API
+@app.get(
+    "/v1/trades",
+    status_code=status.HTTP_200_OK,
+    response_model=BaseCursorListResponse[TradeDto],
+)
+async def trades(
+    db: AsyncSession = Depends(get_db),
+    limit: int = 50,
+    cursor: str | None = None,
+    currency: str | None = None,
+    decision: str | None = None,
+    provider: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+):
+    """
+    트레이드 저널 조회 (최신순, 키셋 페이지네이션)
+
+    Args:
+        limit (int): 페이지 크기 (default: 50, max: 500)
+        cursor (str): 이전 응답의 nextCursor
+        currency (str): 통화 필터 (예: "BTC")
+        decision (str): 결정 필터 (BUY/SELL/HOLD)
+        provider (str): 결정 주체 필터 (strategy/openai)
+        start (datetime): 조회 시작 시각 (포함)
+        end (datetime): 조회 종료 시각 (미포함)
+    Returns:
+        BaseCursorListResponse[TradeDto]
+    """
+    try:
+        return await trade_history_service.get_trades(
+            db=db,
+            limit=limit,
+            cursor=cursor,
+            currency=currency,
+            decision=decision,
+            provider=provider,
+            start=start,
+            end=end,
+        )
+    except HttpJsonException as e:
+        raise e
+    except Exception as e:
+        raise HttpJsonException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+        )
+
+
+# Get Trades Daily Stats API
+@app.get(
+    "/v1/trades/stats/daily",
+    status_code=status.HTTP_200_OK,
+    response_model=BaseListResponse[TradeDailyStatDto],
+)
+async def trades_daily_stats(
+    db: AsyncSession = Depends(get_db),
+    currency: str | None = None,
+    decision: str | None = None,
+    provider: str | None = None,
+    start: datetime | None = None,
+    end: datetime | None = None,
+):
+    """
+    일자별/결정별 트레이드 집계 (건수, 체결 금액, 수수료, LLM 비용)
+
+    Returns:
+        BaseListResponse[TradeDailyStatDto]
+    """
+    try:
+        return await trade_history_service.get_daily_stats(
+            db=db,
+            currency=currency,
+            decision=decision,
+            provider=provider,
+            start=start,
+            end=end,
+        )
+    except HttpJsonException as e:
+        raise e
+    except Exception as e:
+        raise HttpJsonException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+        )
+
+
+# Get Trade API
+@app.get(
+    "/v1/trades/{trade_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=BaseResponse[TradeDto],
+)
+async def trade(trade_id: int, db: AsyncSession = Depends(get_db)):
+    try:
+        return await trade_history_service.get_trade(db=db, id=trade_id)
+    except HttpJsonException as e:
+        raise e
+    except Exception as e:
+        raise HttpJsonException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+        )
+
+
+# Delete Trade API
+@app.delete("/v1/trades/{trade_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_trade(trade_id: int, db: AsyncSession = Depends(get_db)):
+    try:
+        await trade_history_service.delete_trade(db=db, id=trade_id)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except HttpJsonException as e:
+        raise e
+    except Exception as e:
+        raise HttpJsonException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+        )
+
+
+# Get Positions API
+@app.get(
+    "/v1/positions",
+    status_code=status.HTTP_200_OK,
+    response_model=BaseListResponse[PositionDto],
+)
+async def positions(db: AsyncSession = Depends(get_db), include_closed: bool = False):
+    """
+    트레이드 저널로부터 증분 반영된 통화별 현재 포지션 조회
+
+    Args:
+        include_closed (bool): 청산된(수량 0) 포지션 포함 여부
+    Returns:
+        BaseListResponse[PositionDto]
+    """
+    try:
+        return await position_ledger_service.get_positions(
+            db=db, include_closed=include_closed
+        )
+    except HttpJsonException as e:
+        raise e
+    except Exception as e:
+        raise HttpJsonException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+        )
+
+
+# Get Position Snapshots API
+@app.get(
+    "/v1/positions/snapshots",
+    status_code=status.HTTP_200_OK,
+    response_model=BaseListResponse[PositionSnapshotDto],
+)
+async def position_snapshots(
+    db: AsyncSession = Depends(get_db),
+    currency: str | None = None,
+    start: date | None = None,
+    end: date | None = None,
+):
+    """
+    일간 포지션/손익 스냅샷 조회
+
+    Args:
+        currency (str): 통화 (미지정 시 전체 통화 일자별 합산 = 에쿼티 커브)
+        start (date): 조회 시작 일자 (포함)
+        end (date): 조회 종료 일자 (포함)
+    Returns:
+        BaseListResponse[PositionSnapshotDto]
+    """
+    try:
+        return await position_ledger_service.get_snapshots(
+            db=db, currency=currency, start=start, end=end
+        )
+    except HttpJsonException as e:
+        raise e
+    except Exception as e:
+        raise HttpJsonException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+        )
+
+
+# Mark Positions To Market API
+@app.post(
+    "/v1/positions/mark",
+    status_code=status.HTTP_200_OK,
+    response_model=BaseListResponse[PositionSnapshotDto],
+)
+async def mark_positions(db: AsyncSession = Depends(get_db)):
+    """
+    미반영 체결을 원장에 반영한 뒤 현재가로 오늘자 스냅샷을 갱신 (스케줄러에서 하루 한 번 이상 호출)
+
+    Returns:
+        BaseListResponse[PositionSnapshotDto]: 오늘자 통화별 스냅샷
+    """
+    try:
+        while await position_ledger_service.apply_new_fills(db):
+            pass
+        currencies = [
+            position.currency
+            for position in (
+                await position_ledger_service.get_positions(db=db, include_closed=True)
+            ).items
+        ]
+        prices = await asyncio.to_thread(
+            trader_service.exchange.get_current_prices, currencies
+        )
+        return await position_ledger_service.mark_to_market(db=db, prices=prices)
+    except HttpJsonException as e:
+        raise e
+    except Exception as e:
+        raise HttpJsonException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+        )
+
+
+# Get Profiles API
+@app.get(
+    "/v1/profiles",
+    status_code=status.HTTP_200_OK,
+    response_model=BaseListResponse[ProfileDto],
+    dependencies=[Depends(require_profiling)],
+)
+async def profiles(limit: int = 50):
+    """
+    저장된 프로파일 목록 조회 (최신순)
+
+    Args:
+        limit (int): 최대 개수 (default: 50)
+    Returns:
+        BaseListResponse[ProfileDto]
+    """
+    try:
+        return profile_service.get_profiles(limit=limit)
+    except HttpJsonException as e:
+        raise e
+    except Exception as e:
+        raise HttpJsonException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+        )
+
+
+# Download Profile API
+@app.get(
+    "/v1/profiles/{profile_id}",
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(require_profiling)],
+)
+async def profile(profile_id: str):
+    """
+    프로파일 다운로드 (folded stack 포맷 - flamegraph.pl, speedscope 에서 사용)
+
+    Args:
+        profile_id (str): 프로파일 ID (응답 헤더 X-Profile-ID)
+    Returns:
+        FileResponse
+    """
+    try:
+        return FileResponse(
+            profile_service.get_profile_path(profile_id),
+            media_type="text/plain",
+            filename=f"{profile_id}.folded",
+        )
+    except HttpJsonException as e:
+        raise e
+    except Exception as e:
+        raise HttpJsonException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+        )
@@ -0,0 +1,20 @@
+import asyncio
+
+from dotenv import load_dotenv
+
+from src.databases.database import close_db, migrate
+from src.utils.logging import Logging
+
+load_dotenv()
+
+
+async def main():
+    try:
+        await migrate()
+        Logging.info("Database schema is up to date.")
+    finally:
+        await close_db()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,3 +1,7 @@
+import json
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_community.callbacks import get_openai_callback
@@ -5,10 +9,22 @@ from langchain_community.callbacks import get_openai_callback
 # from langchain_anthropic import ChatAnthropic
 from langchain_openai import ChatOpenAI
 
+from config import (
+    AGENT_STUB_DECISION,
+    AGENT_STUB_LATENCY,
+    CACHE_LLM_TTL,
+    KESTREL_AGENT_MODE,
+)
 from src.exchanges.strategy.strategies.datas.types import StrategyType
 from pydantic import BaseModel, Field
 from typing import Literal
 
+from src.utils.cache import SharedCache, get_cache
+from src.utils.logging import Logging
+from src.utils.metrics import Metrics
+from src.utils.serialization import Serializer
+from src.utils.timing import StageTimer
+
 
 class TradingDecision(BaseModel):
     decision: Literal["buy", "sell", "hold"] = Field(
@@ -21,36 +37,54 @@ class TradingDecision(BaseModel):
 
 
 class KestrelAiAgent:
-    llm: ChatOpenAI
+    llm: BaseChatModel
     prompt_template: ChatPromptTemplate
 
     def __init__(self):
-        self.llm = ChatOpenAI(
-            model_name="gpt-4o",
-            temperature=0.7,
-        )
-
+        if KESTREL_AGENT_MODE == "stub":
+            # 부하 테스트용 고정 응답 모델 (외부 API 호출 없음)
+            self.llm = FakeListChatModel(
+                responses=[
+                    json.dumps(
+                        {"decision": AGENT_STUB_DECISION, "reason": "Stub decision"}
+                    )
+                ],
+                sleep=AGENT_STUB_LATENCY or None,
+            )
+        else:
+            self.llm = ChatOpenAI(
+                model_name="gpt-4o",
+                temperature=0.7,
+            )
+
+    @StageTimer.timed("llm")
     def invoke(
         self,
-        analysis_data: str,
+        analysis_data: str | dict,
         strategy_type: StrategyType = StrategyType.PROFITABLE,
+        cache_key: tuple | None = None,
     ) -> dict:
         """
         AI 모델에 데이터를 전달하고 매매 결정을 받아오는 함수
 
         Args:
-            source_data (str): JSON 형식의 분석 데이터 문자열 (캔들 데이터, 호가 데이터 포함)
+            analysis_data (str | dict): 분석 데이터 (캔들 데이터, 호가 데이터 포함)
+                딕셔너리면 한 번만 JSON 으로 인코딩하여 프롬프트에 사용
+            cache_key (tuple): 결정을 재사용할 안정적인 입력 (예: 티커, 인터벌, 마지막 확정 봉 시각)
+                None 이면 캐시하지 않음 (실시간 가격/호가가 포함된 분석 데이터는 키로 쓰지 않음)
 
         Returns:
             dict: 매매 결정 딕셔너리
                 - decision: 'buy', 'sell', 또는 'hold'
                 - reason: 결정에 대한 이유
+                - cached: 캐시된 결정 여부 (True 면 토큰/비용은 0 - 비용 중복 집계 방지)
         """
 
+        if not isinstance(analysis_data, str):
+            analysis_data = Serializer.dumps_str(analysis_data, sort_keys=True)
+
         # 전략 메시지 설정
-        strategy_message: str = ""
-        if strategy_type is StrategyType.PROFITABLE:
-            strategy_message = "Profitable Strategy"
+        strategy_message: str = f"{strategy_type.value} Strategy"
 
         # JsonOutputParser 설정
         json_parser = JsonOutputParser(pydantic_object=TradingDecision)
@@ -109,9 +143,36 @@ class KestrelAiAgent:
 
                 return response
 
-        # AI 실행
-        answer = track_tokens()
-
-        print(answer)
+        loaded = False
+
+        def run():
+            nonlocal loaded
+            loaded = True
+            response = track_tokens()
+            Metrics.llm_usage(response)
+            return {**response, "cached": False}
+
+        if cache_key is None:
+            answer = run()
+        else:
+            # AI 실행 (같은 전략/입력 키의 결정은 워커 간 공유 캐시에서 재사용)
+            answer = get_cache().get_or_set(
+                SharedCache.make_key("llm", strategy_type.value, *cache_key),
+                CACHE_LLM_TTL,
+                run,
+                cache="llm",
+            )
+            if not loaded:
+                # 토큰/비용은 결정을 만든 호출에서 이미 기록됨
+                answer = {
+                    **answer,
+                    "total_tokens": 0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_cost": 0.0,
+                    "cached": True,
+                }
+
+        Logging.info("Agent decision", **answer)
 
         return answer
@@ -1,22 +1,126 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Connection, func, inspect, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.schema import CreateColumn, CreateIndex
+from typing import Set, Tuple
 
-from config import DATABASE_URI
-
-engine = create_engine(DATABASE_URI, echo=False)
-
-# Create database session
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from config import (
+    ASYNC_DATABASE_URI,
+    DATABASE_MAX_OVERFLOW,
+    DATABASE_POOL_RECYCLE,
+    DATABASE_POOL_SIZE,
+    DATABASE_POOL_TIMEOUT,
+)
+from src.utils.logging import Logging
 
 # Create Base
 Base = declarative_base()
 
+# 엔진/세션 팩토리는 첫 DB 사용 시 생성 (import 시 드라이버 로드/접속 설정 없음)
+_engine: AsyncEngine | None = None
+_session_factory: async_sessionmaker | None = None
+
+
+def get_engine() -> AsyncEngine:
+    global _engine
+    if _engine is None:
+        # Create async engine (asyncpg) with tuned connection pool
+        _engine = create_async_engine(
+            ASYNC_DATABASE_URI,
+            echo=False,
+            pool_size=DATABASE_POOL_SIZE,  # 상시 유지할 커넥션 수
+            max_overflow=DATABASE_MAX_OVERFLOW,  # 부하 시 추가로 허용할 커넥션 수
+            pool_timeout=DATABASE_POOL_TIMEOUT,  # 커넥션 대기 최대 시간 (초)
+            pool_recycle=DATABASE_POOL_RECYCLE,  # 오래된 커넥션 재생성 주기 (초)
+            pool_pre_ping=True,  # 끊어진 커넥션 사용 방지
+        )
+    return _engine
+
+
+def SessionLocal():
+    """Create database session"""
+    global _session_factory
+    if _session_factory is None:
+        _session_factory = async_sessionmaker(
+            bind=get_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _session_factory()
+
+
+def _upgrade_tables(conn: Connection) -> Set[Tuple[str, str]]:
+    """
+    기존 테이블에 엔티티에 새로 추가된 컬럼/인덱스를 생성합니다. (여러 번 실행해도 안전)
+    - create_all 은 이미 있는 테이블을 변경하지 않으므로 누락된 컬럼만 ALTER TABLE ... ADD COLUMN
+    - 추가하는 컬럼은 nullable 이거나 server_default 가 있어야 함 (기존 행)
+    - 인덱스는 CREATE INDEX IF NOT EXISTS
+    """
+    inspector = inspect(conn)
+    preparer = conn.dialect.identifier_preparer
+    # PostgreSQL 은 동시에 실행된 migrate 와 충돌하지 않도록 IF NOT EXISTS 사용 (SQLite 는 미지원)
+    if_not_exists = "IF NOT EXISTS " if conn.dialect.name == "postgresql" else ""
+    added = set()
+
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.exec_driver_sql(
+                f"ALTER TABLE {preparer.format_table(table)} ADD COLUMN {if_not_exists}{ddl}"
+            )
+            Logging.info(f"Added column {table.name}.{column.name}")
+            added.add((table.name, column.name))
+
+        for index in table.indexes:
+            conn.execute(CreateIndex(index, if_not_exists=True))
+    return added
+
+
+def _backfill(conn: Connection, added: Set[Tuple[str, str]]):
+    """새로 추가한 컬럼에 기존 행의 값을 채웁니다."""
+    from src.databases.entity.positions_entity import LedgerCursor, Positions
+    from src.databases.entity.trades_entity import Trades
+
+    if ("trades", "ledger_applied") in added:
+        # 이전 커서(마지막으로 확인한 Trade ID)까지는 이미 원장에 반영된 레코드
+        watermark = conn.execute(
+            select(
+                func.coalesce(
+                    select(LedgerCursor.last_trade_id)
+                    .where(LedgerCursor.name == "positions")
+                    .scalar_subquery(),
+                    select(func.max(Positions.last_trade_id)).scalar_subquery(),
+                    0,
+                )
+            )
+        ).scalar()
+        conn.execute(
+            update(Trades).where(Trades.id <= watermark).values(ledger_applied=True)
+        )
+
+
+async def migrate():
+    """
+    스키마 생성/갱신 (없는 테이블 생성 후 기존 테이블에 추가된 컬럼/인덱스 생성)
+    API 프로세스 시작 시 자동 실행하지 않고 migrate.py 로 명시적으로 실행합니다.
+    (DATABASE_AUTO_MIGRATE=true 면 시작 시 실행 - 로컬 개발/벤치마크용)
+    """
+    # 엔티티 모듈을 로드하여 메타데이터에 테이블 등록
+    import src.databases.entity.positions_entity  # noqa: F401
+    import src.databases.entity.trades_entity  # noqa: F401
+
+    async with get_engine().begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        added = await conn.run_sync(_upgrade_tables)
+        await conn.run_sync(_backfill, added)
+
+
+async def close_db():
+    if _engine is not None:
+        await _engine.dispose()
+
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        print("Database Close")
-        db.close()
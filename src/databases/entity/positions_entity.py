@@ -0,0 +1,76 @@
+from sqlalchemy import Column, Date, DateTime, Index, Integer, Float, String, Text
+from sqlalchemy.sql import func
+
+from ..database import Base
+
+
+class Positions(Base):
+    """통화별 현재 포지션 (트레이드 저널 체결을 증분 반영한 결과)"""
+
+    __tablename__ = "positions"
+
+    currency = Column(String(32), primary_key=True)
+    method = Column(String(16), nullable=False)  # 원가 계산 방식 (average/fifo)
+    quantity = Column(Float, nullable=False, default=0)  # 보유 수량
+    cost_basis = Column(Float, nullable=False, default=0)  # 취득 원가 합계
+    realized_pnl = Column(Float, nullable=False, default=0)  # 누적 실현 손익
+    fees = Column(Float, nullable=False, default=0)  # 누적 수수료
+    last_price = Column(Float, nullable=False, default=0)  # 마지막 체결가
+    lots = Column(Text, nullable=True)  # FIFO 로트 (JSON)
+    last_trade_id = Column(Integer, nullable=False, default=0)  # 반영한 마지막 Trade ID
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self):
+        return f"<Positions currency={self.currency}, quantity={self.quantity}>"
+
+
+class PositionSnapshots(Base):
+    """통화별 일간 포지션/손익 스냅샷 (에쿼티 커브 조회용)"""
+
+    __tablename__ = "position_snapshots"
+
+    id = Column(Integer, primary_key=True, autoincrement="auto")
+    currency = Column(String(32), nullable=False)
+    day = Column(Date, nullable=False)
+    quantity = Column(Float, nullable=False, default=0)  # 보유 수량
+    avg_cost = Column(Float, nullable=False, default=0)  # 평균 단가
+    cost_basis = Column(Float, nullable=False, default=0)  # 취득 원가 합계
+    mark_price = Column(Float, nullable=False, default=0)  # 평가 가격
+    market_value = Column(Float, nullable=False, default=0)  # 평가 금액
+    realized_pnl = Column(Float, nullable=False, default=0)  # 누적 실현 손익
+    unrealized_pnl = Column(Float, nullable=False, default=0)  # 미실현 손익
+    fees = Column(Float, nullable=False, default=0)  # 누적 수수료
+    total_pnl = Column(Float, nullable=False, default=0)  # 실현 + 미실현 - 수수료
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ux_position_snapshots_currency_day", "currency", "day", unique=True),
+        Index("ix_position_snapshots_day", "day"),
+    )
+
+    def __repr__(self):
+        return f"<PositionSnapshots currency={self.currency}, day={self.day}>"
+
+
+class LedgerCursor(Base):
+    """
+    포지션 원장 갱신 잠금 행과 반영한 가장 큰 체결 Trade ID
+    원장 갱신 트랜잭션은 이 행을 잠근 뒤 진행 (워커/요청 간 중복 반영 방지)
+    반영 여부는 Trade 레코드별 ledger_applied 로 관리 (ID 순서와 커밋 순서가 달라도 누락 없음)
+    """
+
+    __tablename__ = "ledger_cursor"
+
+    name = Column(String(32), primary_key=True)
+    last_trade_id = Column(
+        Integer, nullable=False, default=0
+    )  # 반영한 가장 큰 Trade ID
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+    def __repr__(self):
+        return f"<LedgerCursor name={self.name}, last_trade_id={self.last_trade_id}>"
@@ -1,8 +1,21 @@
-from sqlalchemy import Column, DateTime, Integer, Float, String, Text
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    Float,
+    String,
+    Text,
+    false,
+    text,
+)
 from sqlalchemy.sql import func
 
-from ..database import engine, Base
+from ..database import Base
+
+# 포지션 원장에 아직 반영하지 않은 매수/매도 레코드 조건
+LEDGER_PENDING = "NOT ledger_applied AND decision IN ('BUY', 'SELL')"
 
 
 class Trades(Base):
@@ -20,11 +33,37 @@ class Trades(Base):
     # btc_krw_price = Column(Float, nullable=True)
     currency = Column(String(255), nullable=True)
     provider = Column(String(255), nullable=True)
+    ticker = Column(String(32), nullable=True)  # 거래 대상 티커 (예: "KRW-BTC")
+    strategy_type = Column(String(32), nullable=True)  # 사용한 전략 유형
+    order_uuid = Column(String(64), nullable=True)  # 업비트 주문 ID
+    price = Column(Float, nullable=True)  # 체결 평균가
+    volume = Column(Float, nullable=True)  # 체결 수량
+    amount = Column(Float, nullable=True)  # 체결 금액 (KRW)
+    fee = Column(Float, nullable=True)  # 지불 수수료 (KRW)
+    total_tokens = Column(Integer, nullable=True)  # 총 토큰
+    prompt_tokens = Column(Integer, nullable=True)  # 프롬프트 토큰
+    completion_tokens = Column(Integer, nullable=True)  # 완성 토큰
+    total_cost = Column(Float, nullable=True)  # 총 비용 $USD
+    ledger_applied = Column(
+        Boolean, nullable=False, default=False, server_default=false()
+    )  # 포지션 원장 반영 여부
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # 키셋 페이지네이션 (created_at, id) 및 필터별 복합 인덱스
+    __table_args__ = (
+        Index("ix_trades_created_at_id", "created_at", "id"),
+        Index("ix_trades_currency_created_at_id", "currency", "created_at", "id"),
+        Index("ix_trades_decision_created_at_id", "decision", "created_at", "id"),
+        Index("ix_trades_provider_created_at_id", "provider", "created_at", "id"),
+        # 포지션 원장에 아직 반영하지 않은 매수/매도 레코드 (부분 인덱스)
+        Index(
+            "ix_trades_ledger_pending_id",
+            "id",
+            postgresql_where=text(LEDGER_PENDING),
+            sqlite_where=text(LEDGER_PENDING),
+        ),
+    )
+
     def __repr__(self):
         return f"<Trades id={self.id}, decision={self.decision}, percentage={self.percentage}>"
-
-
-Base.metadata.create_all(engine)
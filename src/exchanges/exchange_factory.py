@@ -0,0 +1,83 @@
+import threading
+
+import numpy as np
+
+from datetime import datetime, timedelta
+from typing import Tuple
+
+from config import (
+    KESTREL_EXCHANGE_MODE,
+    REPLAY_CASH,
+    REPLAY_DATA_ROOT,
+    REPLAY_FEE,
+    REPLAY_INTERVAL,
+    REPLAY_PRICE_DTYPE,
+    REPLAY_SLIPPAGE,
+    REPLAY_SPEED,
+    REPLAY_START,
+    REPLAY_TICKERS,
+    REPLAY_WARMUP_DAYS,
+)
+from src.exchanges.history.candle_archive import CandleArchive
+from src.exchanges.replay.replay_account import ReplayAccount
+from src.exchanges.replay.replay_clock import ReplayClock
+from src.exchanges.replay.replay_exchange import ReplayExchange
+from src.exchanges.replay.replay_market import ReplayMarket
+from src.exchanges.upbit.candle_resampler import CandleResampler
+from src.exchanges.upbit.upbit_exchange import UpbitExchange
+from src.utils.logging import Logging
+
+_replay: Tuple[ReplayMarket, ReplayAccount] | None = None
+_replay_lock = threading.Lock()
+
+
+def get_replay_market() -> Tuple[ReplayMarket, ReplayAccount]:
+    """
+    프로세스 내에서 공유하는 리플레이 시장/계좌
+    (서비스마다 거래소 인스턴스가 달라도 같은 시계와 잔고를 사용)
+    """
+    global _replay
+    with _replay_lock:
+        if _replay is not None:
+            return _replay
+
+        archive = CandleArchive(root=REPLAY_DATA_ROOT)
+        tickers = [ticker.strip() for ticker in REPLAY_TICKERS.split(",")]
+        clock = ReplayClock(start=datetime.min, speed=REPLAY_SPEED)
+        market = ReplayMarket(
+            clock=clock,
+            archive=archive,
+            interval=REPLAY_INTERVAL,
+            fee=REPLAY_FEE,
+            slippage=REPLAY_SLIPPAGE,
+            price_dtype=np.dtype(REPLAY_PRICE_DTYPE),
+        )
+
+        # 모든 티커의 데이터가 존재하는 구간에서 리플레이
+        candles = [market.candles(ticker) for ticker in tickers]
+        first = max(item.first_time() for item in candles).to_pydatetime()
+        last = min(item.last_time() for item in candles).to_pydatetime()
+        if REPLAY_START:
+            start = datetime.fromisoformat(REPLAY_START)
+        else:
+            start = min(first + timedelta(days=REPLAY_WARMUP_DAYS), last)
+        # 마지막 봉이 완료되는 시각에서 정지
+        clock.end = last + timedelta(
+            minutes=CandleResampler.interval_minutes(REPLAY_INTERVAL)
+        )
+        clock.set(start)
+
+        Logging.info(
+            f"Replay exchange enabled. ({', '.join(tickers)}, {REPLAY_INTERVAL}, "
+            f"{start} ~ {last}, x{REPLAY_SPEED})"
+        )
+        _replay = (market, ReplayAccount(market=market, cash=REPLAY_CASH))
+        return _replay
+
+
+def create_exchange() -> UpbitExchange:
+    """KESTREL_EXCHANGE_MODE 에 따라 실거래 또는 리플레이 거래소 생성"""
+    if KESTREL_EXCHANGE_MODE == "replay":
+        market, account = get_replay_market()
+        return ReplayExchange(market=market, account=account)
+    return UpbitExchange()
@@ -0,0 +1,147 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+from src.exchanges.history.candle_array import CandleArray
+
+
+class CandleArchive:
+    """
+    과거 캔들을 로컬 디스크에 컬럼 포맷(Parquet)으로 보관하는 아카이브
+    - 경로: {root}/{interval}/{ticker}/{YYYY-MM}.parquet (월 단위 파티션)
+    - 병합 시 같은 시각의 캔들은 새 값으로 교체 (중복 제거)
+    - 백필 진행 상황은 티커별 체크포인트 파일로 기록하여 재시작 시 이어서 진행
+    """
+
+    COLUMNS: List[str] = ["open", "high", "low", "close", "volume", "value"]
+    CHECKPOINT_FILE = "_checkpoint.json"
+
+    root: str  # 아카이브 루트 디렉토리
+
+    def __init__(self, root: str = "data/candles"):
+        self.root = root
+
+    def _dir(self, ticker: str, interval: str) -> str:
+        return os.path.join(self.root, interval, ticker)
+
+    def _partition_path(self, ticker: str, interval: str, month: str) -> str:
+        return os.path.join(self._dir(ticker, interval), f"{month}.parquet")
+
+    def partitions(self, ticker: str, interval: str) -> List[str]:
+        """보관 중인 월 파티션 목록 (예: ["2024-01", "2024-02"])"""
+        directory = self._dir(ticker, interval)
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            name[: -len(".parquet")]
+            for name in os.listdir(directory)
+            if name.endswith(".parquet")
+        )
+
+    def read(
+        self,
+        ticker: str,
+        interval: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame:
+        """
+        보관된 캔들을 조회합니다. (인덱스: KST 시각, start 포함 / end 미포함)
+
+        Returns:
+            pd.DataFrame: OHLCV 데이터 (없으면 빈 DataFrame)
+        """
+        months = self.partitions(ticker, interval)
+        if start is not None:
+            months = [month for month in months if month >= f"{start:%Y-%m}"]
+        if end is not None:
+            months = [month for month in months if month <= f"{end:%Y-%m}"]
+        if not months:
+            return pd.DataFrame(columns=self.COLUMNS)
+
+        df = pd.concat(
+            [
+                pd.read_parquet(self._partition_path(ticker, interval, month))
+                for month in months
+            ]
+        ).sort_index()
+        if start is not None:
+            df = df[df.index >= start]
+        if end is not None:
+            df = df[df.index < end]
+        return df
+
+    def read_array(
+        self,
+        ticker: str,
+        interval: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        price_dtype: np.dtype | type = np.float32,
+    ) -> CandleArray:
+        """보관된 캔들을 CandleArray 로 조회합니다. (여러 마켓 이력 보관용)"""
+        return CandleArray.from_dataframe(
+            self.read(ticker, interval, start=start, end=end), price_dtype
+        )
+
+    def write(self, ticker: str, interval: str, df: pd.DataFrame) -> int:
+        """
+        캔들을 월 파티션 단위로 병합하여 저장합니다.
+        변경이 있는 월 파티션만 다시 씁니다.
+
+        Returns:
+            int: 저장 후 변경된 파티션의 총 캔들 수
+        """
+        if df is None or df.empty:
+            return 0
+
+        df = df[self.COLUMNS].astype("float64")
+        os.makedirs(self._dir(ticker, interval), exist_ok=True)
+
+        written = 0
+        for month, chunk in df.groupby(df.index.strftime("%Y-%m")):
+            path = self._partition_path(ticker, interval, month)
+            if os.path.exists(path):
+                chunk = pd.concat([pd.read_parquet(path), chunk])
+            chunk = chunk[~chunk.index.duplicated(keep="last")].sort_index()
+            chunk.index.name = "datetime"
+            # 임시 파일에 쓴 뒤 교체하여 중단 시에도 파티션이 깨지지 않도록 함
+            tmp_path = f"{path}.tmp"
+            chunk.to_parquet(tmp_path, compression="zstd")
+            os.replace(tmp_path, path)
+            written += len(chunk)
+        return written
+
+    def load_checkpoint(self, ticker: str, interval: str) -> Dict:
+        """
+        체크포인트 조회
+
+        Returns:
+            Dict: {"done": 완료한 페이지 종료 시각(epoch 초) 집합,
+                   "floor": 상장 이전으로 확인된 페이지 종료 시각 (없으면 None)}
+        """
+        path = os.path.join(self._dir(ticker, interval), self.CHECKPOINT_FILE)
+        if not os.path.exists(path):
+            return {"done": set(), "floor": None}
+        with open(path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        return {
+            "done": set(checkpoint.get("done", [])),
+            "floor": checkpoint.get("floor"),
+        }
+
+    def save_checkpoint(
+        self, ticker: str, interval: str, done: Set[int], floor: Optional[int]
+    ):
+        directory = self._dir(ticker, interval)
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, self.CHECKPOINT_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"done": sorted(done), "floor": floor}, f)
+        os.replace(tmp_path, path)
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+from datetime import datetime
+from typing import List
+
+
+class CandleArray:
+    """
+    배열 기반 캔들 컨테이너 (여러 마켓의 긴 이력을 적은 메모리로 보관)
+    - timestamps: int64 (ns, KST 시각) 배열
+    - prices: (4, N) open/high/low/close 블록 (기본 float32, price_dtype 으로 float64 선택)
+    - volumes: (2, N) volume/value float32 블록
+    - 컬럼은 블록의 행이므로 각 컬럼은 연속된 메모리, 컬럼/구간 조회는 복사 없는 뷰
+    - float64 DataFrame (행당 56 바이트) 대비 float32 기준 행당 32 바이트
+    """
+
+    PRICE_COLUMNS: List[str] = ["open", "high", "low", "close"]
+    VOLUME_COLUMNS: List[str] = ["volume", "value"]
+    COLUMNS: List[str] = PRICE_COLUMNS + VOLUME_COLUMNS
+
+    timestamps: np.ndarray  # int64 ns
+    prices: np.ndarray  # (4, N)
+    volumes: np.ndarray  # (2, N) float32
+
+    def __init__(self, timestamps: np.ndarray, prices: np.ndarray, volumes: np.ndarray):
+        if prices.shape != (4, len(timestamps)) or volumes.shape != (
+            2,
+            len(timestamps),
+        ):
+            raise ValueError("CandleArray blocks must match the timestamp length")
+        self.timestamps = timestamps
+        self.prices = prices
+        self.volumes = volumes
+
+    @classmethod
+    def from_dataframe(
+        cls, df: pd.DataFrame, price_dtype: np.dtype | type = np.float32
+    ) -> "CandleArray":
+        """
+        get_candle / pyupbit 형태의 DataFrame (DatetimeIndex, OHLCV 컬럼) 에서 생성합니다.
+        value 컬럼이 없으면 0 으로 채웁니다.
+        """
+        n = len(df)
+        prices = np.empty((4, n), dtype=price_dtype)
+        for row, column in enumerate(cls.PRICE_COLUMNS):
+            prices[row] = df[column].to_numpy()
+        volumes = np.zeros((2, n), dtype=np.float32)
+        for row, column in enumerate(cls.VOLUME_COLUMNS):
+            if column in df.columns:
+                volumes[row] = df[column].to_numpy()
+        timestamps = df.index.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        return cls(np.ascontiguousarray(timestamps), prices, volumes)
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """get_candle 과 같은 형태 (float64 OHLCV + value, DatetimeIndex) 로 변환합니다."""
+        block = np.empty((len(self), len(self.COLUMNS)), dtype=np.float64, order="F")
+        block[:, :4] = self.prices.T
+        block[:, 4:] = self.volumes.T
+        return pd.DataFrame(
+            block,
+            index=pd.DatetimeIndex(self.timestamps.view("datetime64[ns]")),
+            columns=self.COLUMNS,
+            copy=False,
+        )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __getitem__(self, key: slice) -> "CandleArray":
+        """구간 뷰 (예: candles[-200:]), 데이터 복사 없음"""
+        if not isinstance(key, slice):
+            raise TypeError("CandleArray supports slice indexing only")
+        return CandleArray(
+            self.timestamps[key], self.prices[:, key], self.volumes[:, key]
+        )
+
+    def window(self, start: int, stop: int) -> "CandleArray":
+        return self[start:stop]
+
+    def tail(self, count: int) -> "CandleArray":
+        return self[max(len(self) - count, 0) :]
+
+    def until(self, timestamp: datetime | pd.Timestamp, inclusive: bool = True):
+        """timestamp 이전(기본: 포함) 봉까지의 구간 뷰"""
+        value = pd.Timestamp(timestamp).as_unit("ns").value
+        end = np.searchsorted(
+            self.timestamps, value, side="right" if inclusive else "left"
+        )
+        return self[:end]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self.prices[0]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.prices[1]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.prices[2]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.prices[3]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self.volumes[0]
+
+    @property
+    def value(self) -> np.ndarray:
+        return self.volumes[1]
+
+    @property
+    def index(self) -> np.ndarray:
+        """datetime64[ns] 타임스탬프 뷰"""
+        return self.timestamps.view("datetime64[ns]")
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def first_time(self) -> pd.Timestamp:
+        return pd.Timestamp(self.timestamps[0])
+
+    def last_time(self) -> pd.Timestamp:
+        return pd.Timestamp(self.timestamps[-1])
+
+    @property
+    def nbytes(self) -> int:
+        return self.timestamps.nbytes + self.prices.nbytes + self.volumes.nbytes
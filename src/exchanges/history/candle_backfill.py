@@ -0,0 +1,292 @@
+import threading
+import time
+
+import pandas as pd
+import pyupbit
+import requests
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.exchanges.history.candle_archive import CandleArchive
+from src.exchanges.upbit.candle_resampler import CandleResampler
+from src.utils.logging import Logging
+
+
+class RateLimiter:
+    """
+    토큰 버킷 방식의 요청 속도 제한기 (스레드 안전)
+    업비트 시세 API 는 IP 당 초당 10회로 제한되므로 여유를 두고 설정합니다.
+    """
+
+    rate: float  # 초당 허용 요청 수
+    burst: int  # 순간 최대 요청 수
+
+    def __init__(self, rate: float = 8.0, burst: int = 8):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_seconds = (1 - self._tokens) / self.rate
+            time.sleep(wait_seconds)
+
+
+class CandleBackfill:
+    """
+    업비트 과거 캔들 백필러
+    - 조회 구간을 고정 크기 페이지(종료 시각 기준)로 미리 나누어 페이지를 병렬로 요청
+    - 모든 요청은 공용 RateLimiter 를 거치며 429 응답은 백오프 후 재시도
+    - flush_pages 페이지마다 아카이브에 병합 저장하고 체크포인트 기록
+    - 빈 페이지(상장 이전)가 확인되면 그 이전 페이지는 요청하지 않음
+    """
+
+    KST_OFFSET = timedelta(minutes=CandleResampler.KST_OFFSET_MINUTES)
+
+    archive: CandleArchive  # 캔들 저장소
+    page_size: int  # 요청당 캔들 수 (업비트 최대 200)
+    workers: int  # 동시 요청 스레드 수
+    flush_pages: int  # 저장/체크포인트 주기 (페이지 수)
+    max_retries: int  # 페이지별 최대 재시도 횟수
+
+    def __init__(
+        self,
+        archive: CandleArchive,
+        rate_limit: float = 8.0,
+        workers: int = 8,
+        page_size: int = 200,
+        flush_pages: int = 50,
+        max_retries: int = 5,
+    ):
+        self.archive = archive
+        self.page_size = min(page_size, 200)
+        self.workers = workers
+        self.flush_pages = flush_pages
+        self.max_retries = max_retries
+        self.rate_limiter = RateLimiter(rate=rate_limit, burst=max(1, int(rate_limit)))
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        # 스레드별 HTTP 세션 (커넥션 재사용)
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def page_boundaries(
+        self, interval: str, start: datetime, end: datetime
+    ) -> List[Tuple[int, int]]:
+        """
+        조회 구간을 페이지로 나눕니다. (최신 페이지부터)
+
+        Args:
+            interval (str): 캔들 인터벌
+            start (datetime): 시작 시각 (KST, 포함)
+            end (datetime): 종료 시각 (KST, 미포함)
+        Returns:
+            List[Tuple[int, int]]: (페이지 종료 시각 UTC epoch 초, 캔들 수) 목록
+        """
+        step = CandleResampler.interval_minutes(interval) * 60
+        start_utc = int(pd.Timestamp(start - self.KST_OFFSET).timestamp())
+        end_utc = int(pd.Timestamp(end - self.KST_OFFSET).timestamp())
+        # 업비트 캔들은 UTC epoch 기준으로 정렬되므로 종료 시각을 봉 경계로 내림
+        to = end_utc - end_utc % step
+        pages = []
+        while to > start_utc:
+            count = min(self.page_size, -(-(to - start_utc) // step))
+            pages.append((to, count))
+            to -= self.page_size * step
+        return pages
+
+    def fetch_page(
+        self, ticker: str, interval: str, to: int, count: int
+    ) -> Tuple[pd.DataFrame, Optional[int]]:
+        """
+        페이지 하나를 조회합니다. 결과는 페이지 구간 [to - count * 봉, to) 로 잘라서 반환합니다.
+        (업비트는 거래가 없는 봉을 건너뛰고 이전 캔들을 채워 반환하기 때문)
+
+        Returns:
+            Tuple[pd.DataFrame, Optional[int]]: (페이지 캔들, 히스토리 시작 시각)
+                - 히스토리 시작 시각: 이 시각 이전에는 캔들이 없음이 확인된 경우의 UTC epoch 초
+                  (응답이 비었으면 to, 요청한 개수보다 적게 왔으면 가장 오래된 캔들 시각, 그 외 None)
+                - 구간으로 자른 결과가 비어도 응답에 이전 캔들이 있으면 거래가 없던 구간일 뿐이므로 None
+        """
+        url = pyupbit.quotation_api.get_url_ohlcv(interval=interval)
+        params = {
+            "market": ticker,
+            "count": count,
+            "to": datetime.utcfromtimestamp(to).strftime("%Y-%m-%d %H:%M:%S"),
+        }
+
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            try:
+                response = self._session().get(url, params=params, timeout=10)
+                if response.status_code == 429:
+                    raise requests.HTTPError("429 Too Many Requests")
+                response.raise_for_status()
+                contents = response.json()
+                break
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise ValueError(
+                        f"Exception in Fetch Page ({ticker}, {interval}, {params['to']}) : {e}"
+                    )
+                time.sleep(min(2**attempt * 0.5, 10))
+
+        if not contents:
+            return pd.DataFrame(columns=CandleArchive.COLUMNS), to
+
+        history_start = None
+        if len(contents) < count:
+            # 요청한 개수보다 적게 왔으면 가장 오래된 캔들이 히스토리의 시작 (상장 시점)
+            history_start = int(
+                min(
+                    pd.Timestamp(x["candle_date_time_utc"]).timestamp()
+                    for x in contents
+                )
+            )
+
+        df = pd.DataFrame(
+            {
+                "open": [x["opening_price"] for x in contents],
+                "high": [x["high_price"] for x in contents],
+                "low": [x["low_price"] for x in contents],
+                "close": [x["trade_price"] for x in contents],
+                "volume": [x["candle_acc_trade_volume"] for x in contents],
+                "value": [x["candle_acc_trade_price"] for x in contents],
+            },
+            index=pd.to_datetime([x["candle_date_time_kst"] for x in contents]),
+        ).sort_index()
+
+        step = timedelta(minutes=CandleResampler.interval_minutes(interval))
+        page_end = datetime.utcfromtimestamp(to) + self.KST_OFFSET
+        return (
+            df[(df.index >= page_end - step * count) & (df.index < page_end)],
+            history_start,
+        )
+
+    def backfill(
+        self, ticker: str, interval: str, start: datetime, end: datetime
+    ) -> int:
+        """
+        티커 하나, 인터벌 하나의 구간을 백필합니다. (체크포인트 이후부터 재개)
+
+        Returns:
+            int: 새로 수신한 캔들 수
+        """
+        interval = CandleResampler.normalize_interval(interval)
+        checkpoint = self.archive.load_checkpoint(ticker, interval)
+        done = checkpoint["done"]
+        floor: Optional[int] = checkpoint["floor"]
+
+        pages = [
+            (to, count)
+            for to, count in self.page_boundaries(interval, start, end)
+            if to not in done and (floor is None or to > floor)
+        ]
+        if not pages:
+            Logging.info(f"[Backfill] {ticker} {interval}: up to date")
+            return 0
+
+        received = 0
+        buffer: List[pd.DataFrame] = []
+        buffered_pages: List[int] = []
+
+        def flush():
+            nonlocal received
+            if buffer:
+                frame = pd.concat(buffer)
+                self.archive.write(ticker, interval, frame)
+                received += len(frame)
+            done.update(buffered_pages)
+            self.archive.save_checkpoint(ticker, interval, done, floor)
+            buffer.clear()
+            buffered_pages.clear()
+
+        pending = iter(pages)
+        in_flight: Dict[Future, int] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                while True:
+                    # 최신 페이지부터 순서대로 제출하고, 동시 요청 수는 workers 의 2배로 제한
+                    while len(in_flight) < self.workers * 2:
+                        page = next(pending, None)
+                        if page is None:
+                            break
+                        to, count = page
+                        if floor is not None and to <= floor:
+                            continue
+                        future = executor.submit(
+                            self.fetch_page, ticker, interval, to, count
+                        )
+                        in_flight[future] = to
+                    if not in_flight:
+                        break
+
+                    completed, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        to = in_flight.pop(future)
+                        df, history_start = future.result()
+                        if history_start is not None:
+                            # 해당 시각 이전에는 캔들이 없음 (상장 이전)
+                            floor = (
+                                history_start
+                                if floor is None
+                                else max(floor, history_start)
+                            )
+                        if not df.empty:
+                            buffer.append(df)
+                        buffered_pages.append(to)
+
+                    if len(buffered_pages) >= self.flush_pages:
+                        flush()
+        finally:
+            # 실패하더라도 완료된 페이지는 저장하여 재시작 시 이어서 진행
+            flush()
+
+        Logging.info(
+            f"[Backfill] {ticker} {interval}: {len(pages)} pages, {received} candles"
+        )
+        return received
+
+    def run(
+        self,
+        tickers: List[str],
+        intervals: List[str],
+        start: datetime,
+        end: datetime,
+    ) -> Dict[Tuple[str, str], int]:
+        """
+        여러 티커/인터벌을 순서대로 백필합니다.
+        한 티커의 실패는 기록만 하고 다음 티커를 계속 진행합니다. (재실행 시 체크포인트부터 재개)
+
+        Returns:
+            Dict[Tuple[str, str], int]: (티커, 인터벌)별 새로 수신한 캔들 수
+        """
+        results = {}
+        for ticker in tickers:
+            for interval in intervals:
+                try:
+                    results[(ticker, interval)] = self.backfill(
+                        ticker, interval, start, end
+                    )
+                except Exception as e:
+                    Logging.error(
+                        msg=f"[Backfill] {ticker} {interval} failed:", error=e
+                    )
+        return results
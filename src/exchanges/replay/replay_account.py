@@ -0,0 +1,136 @@
+import threading
+import uuid
+
+from typing import Dict, List
+
+from src.exchanges.replay.replay_market import ReplayMarket
+
+
+class ReplayAccount:
+    """
+    리플레이 시장에서 체결되는 모의 계좌
+    UpbitExchange 가 사용하는 pyupbit.Upbit 메서드(잔고/시장가 주문/주문 조회)를
+    같은 응답 형태로 제공하여 거래소 로직을 그대로 재사용합니다.
+    - 시장가 주문은 즉시 전량 체결 (체결가: 현재가 ± 슬리피지, 수수료: 체결 금액 × fee)
+    """
+
+    market: ReplayMarket  # 시세 제공 시장
+
+    def __init__(self, market: ReplayMarket, cash: float = 1_000_000):
+        self.market = market
+        self._balances: Dict[str, Dict[str, float]] = {
+            "KRW": {"balance": float(cash), "avg_buy_price": 0.0}
+        }
+        self._orders: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _created_at(self) -> str:
+        return f"{self.market.clock.now().isoformat()}+09:00"
+
+    def _error(self, name: str, message: str) -> dict:
+        return {"error": {"name": name, "message": message}}
+
+    def get_balances(self) -> List[dict]:
+        with self._lock:
+            return [
+                {
+                    "currency": currency,
+                    "balance": str(balance["balance"]),
+                    "locked": "0",
+                    "avg_buy_price": str(balance["avg_buy_price"]),
+                    "avg_buy_price_modified": False,
+                    "unit_currency": "KRW",
+                }
+                for currency, balance in self._balances.items()
+            ]
+
+    def get_balance(self, ticker: str = "KRW") -> float:
+        currency = ticker.split("-")[-1]
+        with self._lock:
+            return self._balances.get(currency, {}).get("balance", 0.0)
+
+    def buy_market_order(self, ticker: str, price: float) -> dict:
+        """price(KRW) 만큼 시장가 매수 (수수료는 별도로 차감)"""
+        currency = ticker.split("-")[1]
+        fill_price = self.market.fill_price(ticker, "bid")
+        volume = price / fill_price
+        fee = price * self.market.fee
+
+        with self._lock:
+            krw = self._balances["KRW"]
+            if krw["balance"] < price + fee:
+                return self._error(
+                    "insufficient_funds_bid", "주문가능한 금액이 부족합니다."
+                )
+            krw["balance"] -= price + fee
+            holding = self._balances.setdefault(
+                currency, {"balance": 0.0, "avg_buy_price": 0.0}
+            )
+            total = holding["balance"] + volume
+            holding["avg_buy_price"] = (
+                holding["avg_buy_price"] * holding["balance"] + fill_price * volume
+            ) / total
+            holding["balance"] = total
+            return self._record(ticker, "bid", "price", fill_price, volume, fee)
+
+    def sell_market_order(self, ticker: str, volume: float) -> dict:
+        """volume 만큼 시장가 매도"""
+        currency = ticker.split("-")[1]
+        fill_price = self.market.fill_price(ticker, "ask")
+
+        with self._lock:
+            holding = self._balances.get(currency)
+            if holding is None or holding["balance"] < volume:
+                return self._error(
+                    "insufficient_funds_ask", "주문가능한 수량이 부족합니다."
+                )
+            funds = fill_price * volume
+            fee = funds * self.market.fee
+            holding["balance"] -= volume
+            if holding["balance"] <= 1e-12:
+                del self._balances[currency]
+            self._balances["KRW"]["balance"] += funds - fee
+            return self._record(ticker, "ask", "market", fill_price, volume, fee)
+
+    def get_order(self, uuid: str) -> dict:
+        with self._lock:
+            order = self._orders.get(uuid)
+            if order is None:
+                return self._error("order_not_found", "주문을 찾지 못했습니다.")
+            return dict(order)
+
+    def _record(
+        self,
+        ticker: str,
+        side: str,
+        ord_type: str,
+        price: float,
+        volume: float,
+        fee: float,
+    ) -> dict:
+        order_uuid = str(uuid.uuid4())
+        created_at = self._created_at()
+        order = {
+            "uuid": order_uuid,
+            "side": side,
+            "ord_type": ord_type,
+            "market": ticker,
+            "state": "done",
+            "created_at": created_at,
+            "executed_volume": str(volume),
+            "paid_fee": str(fee),
+            "trades_count": 1,
+            "trades": [
+                {
+                    "market": ticker,
+                    "price": str(price),
+                    "volume": str(volume),
+                    "funds": str(price * volume),
+                    "side": side,
+                    "created_at": created_at,
+                }
+            ],
+        }
+        self._orders[order_uuid] = order
+        # 주문 응답은 체결 내역 없이 반환 (업비트 주문 API 와 동일)
+        return {key: value for key, value in order.items() if key != "trades"}
@@ -0,0 +1,44 @@
+import threading
+import time
+
+from datetime import datetime, timedelta
+
+
+class ReplayClock:
+    """
+    리플레이용 시뮬레이션 시계 (KST, tz 없음)
+    - 실제 경과 시간에 speed 배율을 곱해 진행 (예: speed=3600 이면 실제 1초에 1시간)
+    - speed=0 이면 정지 상태로 advance() 호출 시에만 진행
+    - end 를 넘으면 end 에 고정
+    """
+
+    speed: float  # 실제 시간 대비 배율
+    end: datetime | None  # 리플레이 종료 시각
+
+    def __init__(
+        self, start: datetime, speed: float = 60.0, end: datetime | None = None
+    ):
+        self.speed = speed
+        self.end = end
+        self._start = start
+        self._anchor = time.monotonic()
+        self._lock = threading.Lock()
+
+    def now(self) -> datetime:
+        with self._lock:
+            elapsed = (time.monotonic() - self._anchor) * self.speed
+            now = self._start + timedelta(seconds=elapsed)
+        if self.end is not None and now > self.end:
+            return self.end
+        return now
+
+    def advance(self, delta: timedelta):
+        """시뮬레이션 시각을 delta 만큼 앞당김"""
+        with self._lock:
+            self._start += delta
+
+    def set(self, when: datetime):
+        """시뮬레이션 시각을 지정한 시각으로 이동"""
+        with self._lock:
+            self._start = when
+            self._anchor = time.monotonic()
@@ -0,0 +1,63 @@
+import pandas as pd
+
+from datetime import datetime
+
+from src.exchanges.replay.replay_account import ReplayAccount
+from src.exchanges.replay.replay_market import ReplayMarket
+from src.exchanges.upbit.upbit_exchange import UpbitExchange
+from src.utils.fng import Fng
+from src.utils.timing import StageTimer
+
+
+class ReplayExchange(UpbitExchange):
+    """
+    녹화된 데이터로 동작하는 UpbitExchange (페이퍼 트레이딩/오프라인 부하 테스트용)
+    시세 조회와 계좌/주문만 리플레이 시장과 모의 계좌로 대체하고
+    지표 계산, 리샘플링, 매매 로직은 UpbitExchange 를 그대로 사용합니다.
+    """
+
+    market: ReplayMarket  # 리플레이 시장 (시계/캔들/호가)
+    upbit: ReplayAccount  # 모의 계좌
+
+    def __init__(self, market: ReplayMarket, account: ReplayAccount):
+        super().__init__()
+        self.market = market
+        self.upbit = account
+        self.fee = market.fee
+        self.fng_history = Fng.get_history(fetch=False)  # 저장된 F&G 이력 (없으면 None)
+
+    def now_kst(self) -> datetime:
+        return self.market.clock.now()
+
+    @StageTimer.timed("fetch")
+    def get_current_price(self, ticker: str | list[str]) -> float | dict | None:
+        if isinstance(ticker, str):
+            return self.market.price(ticker)
+        return {item: self.market.price(item) for item in ticker}
+
+    @StageTimer.timed("fetch")
+    def get_orderbook(self, ticker: str) -> dict | None:
+        return self.market.orderbook(ticker)
+
+    @StageTimer.timed("fetch")
+    def fetch_ohlcv(
+        self, interval: str = "day", count: int = 200, to: datetime | None = None
+    ) -> pd.DataFrame | None:
+        return self.market.ohlcv(self.ticker, interval=interval, count=count, to=to)
+
+    def get_market_context(self) -> dict:
+        # 리플레이 시각의 Fear & Greed Index (저장된 이력이 있을 때만, 뉴스 제외)
+        history = self.fng_history
+        if history is None or history.empty:
+            return {}
+        # 이력 날짜(UTC)를 공개 시각(KST)으로 옮겨서 리플레이 시각과 비교
+        past = history[history.index + Fng.KST_OFFSET <= self.now_kst()]
+        if past.empty:
+            return {}
+        return {
+            "Fear and Greed Index": {
+                "value": str(past["fng"].iloc[-1]),
+                "value_classification": past["fng_classification"].iloc[-1],
+                "timestamp": str(int(past.index[-1].timestamp())),
+            }
+        }
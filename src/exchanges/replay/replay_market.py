@@ -0,0 +1,162 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from src.exchanges.history.candle_archive import CandleArchive
+from src.exchanges.history.candle_array import CandleArray
+from src.exchanges.replay.replay_clock import ReplayClock
+from src.exchanges.upbit.candle_resampler import CandleResampler
+
+
+class ReplayMarket:
+    """
+    녹화된 캔들 데이터로 시세(캔들/현재가/호가)를 재생하는 시장
+    - 시뮬레이션 시각 기준으로 완료된 기본 봉만 보이도록 잘라서 제공 (미래 데이터 누출 방지)
+    - 상위 인터벌은 기본 봉을 업비트 봉 경계에 맞춰 집계
+    - 현재가는 마지막 완료 봉의 종가, 호가는 현재가 기준 슬리피지 폭으로 합성
+    - 여러 거래소 인스턴스가 같은 시장(시계/데이터/계좌)을 공유
+    - 캔들은 티커별 CandleArray (기본 float32) 로 보관하고 조회한 구간만 DataFrame 으로 변환
+    """
+
+    ORDERBOOK_LEVELS = 15  # 합성 호가 단계 수
+
+    clock: ReplayClock  # 시뮬레이션 시계
+    interval: str  # 녹화된 기본 봉 인터벌
+    fee: float  # 거래 수수료율
+    slippage: float  # 시장가 주문 슬리피지율 (호가 간격으로도 사용)
+
+    def __init__(
+        self,
+        clock: ReplayClock,
+        archive: CandleArchive | None = None,
+        interval: str = "minute60",
+        fee: float = 0.0005,
+        slippage: float = 0.0005,
+        price_dtype: np.dtype | type = np.float32,
+    ):
+        self.clock = clock
+        self.archive = archive
+        self.interval = CandleResampler.normalize_interval(interval)
+        self.fee = fee
+        self.slippage = slippage
+        self.resampler = CandleResampler(base_interval=self.interval)
+        self.price_dtype = price_dtype
+        self._step = timedelta(minutes=CandleResampler.interval_minutes(self.interval))
+        self._candles: Dict[str, CandleArray] = {}
+        self._lock = threading.Lock()
+
+    def add_candles(self, ticker: str, df: pd.DataFrame):
+        """기본 인터벌 캔들을 직접 등록 (인덱스: KST 시각)"""
+        df = df[CandleArchive.COLUMNS].sort_index()
+        df = df[~df.index.duplicated(keep="last")]
+        with self._lock:
+            self._candles[ticker] = CandleArray.from_dataframe(df, self.price_dtype)
+
+    def candles(self, ticker: str) -> CandleArray:
+        """티커의 전체 기본 봉 (처음 조회 시 아카이브에서 로드)"""
+        with self._lock:
+            candles = self._candles.get(ticker)
+            if candles is None and self.archive is not None:
+                candles = self.archive.read_array(
+                    ticker, self.interval, price_dtype=self.price_dtype
+                )
+                if not candles.empty:
+                    self._candles[ticker] = candles
+        if candles is None or candles.empty:
+            raise ValueError(f"No replay candles for {ticker} ({self.interval})")
+        return candles
+
+    def tickers(self) -> List[str]:
+        with self._lock:
+            return list(self._candles.keys())
+
+    def visible(self, ticker: str, until: datetime | None = None) -> CandleArray:
+        """until(default: 현재 시뮬레이션 시각)까지 완료된 기본 봉 (복사 없는 뷰)"""
+        until = until or self.clock.now()
+        return self.candles(ticker).until(until - self._step)
+
+    def ohlcv(
+        self,
+        ticker: str,
+        interval: str = "day",
+        count: int = 200,
+        to: datetime | str | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        pyupbit.get_ohlcv 와 같은 형태의 캔들 조회
+
+        Args:
+            to (datetime | str): 조회 종료 시각 (UTC, pyupbit 와 동일)
+        """
+        interval = CandleResampler.normalize_interval(interval)
+        until = self.clock.now()
+        if to is not None:
+            to_kst = pd.Timestamp(to).to_pydatetime().replace(tzinfo=None) + timedelta(
+                minutes=CandleResampler.KST_OFFSET_MINUTES
+            )
+            until = min(until, to_kst)
+        candles = self.visible(ticker, until)
+
+        if interval == self.interval:
+            return candles.tail(count).to_dataframe()
+        if not self.resampler.can_derive(interval):
+            raise ValueError(
+                f"Cannot derive {interval} candles from recorded {self.interval} candles"
+            )
+        # 첫 구간이 잘리지 않도록 한 구간 더 조회 후 집계
+        bars = self.resampler.base_bars_for(interval, count + 1)
+        return self.resampler.aggregate(
+            candles.tail(bars).to_dataframe(), interval
+        ).iloc[-count:]
+
+    def price(self, ticker: str) -> float | None:
+        candles = self.visible(ticker)
+        if candles.empty:
+            return None
+        return float(candles.close[-1])
+
+    def orderbook(self, ticker: str) -> dict | None:
+        """현재가 기준 슬리피지 간격의 합성 호가 (업비트 호가 응답 형태)"""
+        candles = self.visible(ticker)
+        if candles.empty:
+            return None
+        price = float(candles.close[-1])
+        # 단계별 물량은 마지막 봉 거래량을 단계 수로 나눈 값
+        size = float(candles.volume[-1]) / self.ORDERBOOK_LEVELS
+        tick = max(price * self.slippage, 1e-8)
+        units = [
+            {
+                "ask_price": price + tick * (level + 1),
+                "bid_price": price - tick * (level + 1),
+                "ask_size": size,
+                "bid_size": size,
+            }
+            for level in range(self.ORDERBOOK_LEVELS)
+        ]
+        return {
+            "market": ticker,
+            "timestamp": int(
+                pd.Timestamp(
+                    self.clock.now()
+                    - timedelta(minutes=CandleResampler.KST_OFFSET_MINUTES)
+                ).timestamp()
+                * 1000
+            ),
+            "total_ask_size": size * self.ORDERBOOK_LEVELS,
+            "total_bid_size": size * self.ORDERBOOK_LEVELS,
+            "orderbook_units": units,
+            "level": 0,
+        }
+
+    def fill_price(self, ticker: str, side: str) -> float:
+        """시장가 주문 체결가 (매수는 현재가보다 높게, 매도는 낮게)"""
+        price = self.price(ticker)
+        if price is None:
+            raise ValueError(f"No replay price for {ticker}")
+        if side == "bid":
+            return price * (1 + self.slippage)
+        return price * (1 - self.slippage)
@@ -3,6 +3,9 @@ import numpy as np
 import backtrader as bt
 from typing import Tuple, Dict
 
+from src.exchanges.strategy.analyzer.monte_carlo import MonteCarlo
+from src.utils.logging import Logging
+
 
 class AnalyzerMixin:
     """백테스팅 결과 분석을 위한 믹스인 클래스"""
@@ -37,7 +40,7 @@ class AnalyzerMixin:
 
             return abs(max_drawdown) * 100, peak_idx, end_idx
         except Exception as e:
-            print(f"MDD 계산 중 오류 발생: {str(e)}")
+            Logging.error(msg="MDD 계산 중 오류 발생:", error=e)
             return 0.0, 0, 0
 
     def calculate_sharpe_ratio(
@@ -68,10 +71,11 @@ class AnalyzerResult:
     analyzer: AnalyzerMixin
     initial_cash: int
 
-    def run(self):
+    def run(self) -> Dict[str, float]:
+        """백테스트를 실행하고 결과 지표를 출력합니다. (결과 저장용 지표 딕셔너리 반환)"""
         # 백테스팅 실행
-        print("\n=== 백테스팅 결과 ===")
-        print(f"초기 포트폴리오 가치: {self.initial_cash:,.0f}원")
+        Logging.info("=== 백테스팅 결과 ===")
+        Logging.info(f"초기 포트폴리오 가치: {self.initial_cash:,.0f}원")
 
         # 포트폴리오 가치 기록을 위한 observer 추가
         self.cerebro.addobserver(bt.observers.Value)
@@ -80,18 +84,21 @@ class AnalyzerResult:
 
         # 최종 포트폴리오 가치
         final_value = self.cerebro.broker.getvalue()
-        print(f"최종 포트폴리오 가치: {final_value:,.0f}원")
+        Logging.info(f"최종 포트폴리오 가치: {final_value:,.0f}원")
+        metrics = {"initial_cash": float(self.initial_cash), "final_value": final_value}
 
         # 1. 기본 수익률
         roi = (final_value - self.initial_cash) / self.initial_cash * 100
-        print(f"\n1. 투자수익률: {roi:.2f}%")
+        Logging.info(f"1. 투자수익률: {roi:.2f}%")
+        metrics["roi"] = roi
 
         # 2. 연간수익률
         trading_days = len(self.df)
         annual_roi = self.analyzer.calculate_annual_roi(
             final_value, self.initial_cash, trading_days
         )
-        print(f"2. 연간수익률: {annual_roi:.2f}%")
+        Logging.info(f"2. 연간수익률: {annual_roi:.2f}%")
+        metrics["annual_roi"] = annual_roi
 
         # 3. 최대낙폭 (MDD) 계산
         drawdown = strategy.analyzers.drawdown.get_analysis()
@@ -99,6 +106,7 @@ class AnalyzerResult:
 
         if max_dd:
             max_drawdown = max_dd.get("drawdown", 0)
+            metrics["max_drawdown"] = max_drawdown
 
             # 포트폴리오 가치 기록 가져오기
             values = strategy.observers.value.get(size=trading_days)
@@ -114,32 +122,34 @@ class AnalyzerResult:
                 mdd_idx = drawdowns.idxmin()
                 peak_idx = rolling_max.loc[:mdd_idx].idxmax()
 
-                print(f"3. 최대낙폭(MDD): {max_drawdown:.2f}%")
-                print(f"   - MDD 시작일: {peak_idx.strftime('%Y-%m-%d')}")
-                print(f"   - MDD 종료일: {mdd_idx.strftime('%Y-%m-%d')}")
-                print(f"   - MDD 지속기간: {(mdd_idx - peak_idx).days}일")
+                Logging.info(f"3. 최대낙폭(MDD): {max_drawdown:.2f}%")
+                Logging.info(f"   - MDD 시작일: {peak_idx.strftime('%Y-%m-%d')}")
+                Logging.info(f"   - MDD 종료일: {mdd_idx.strftime('%Y-%m-%d')}")
+                Logging.info(f"   - MDD 지속기간: {(mdd_idx - peak_idx).days}일")
             else:
-                print(f"3. 최대낙폭(MDD): {max_drawdown:.2f}%")
-                print("   - MDD 기간: 상세 정보 없음")
+                Logging.info(f"3. 최대낙폭(MDD): {max_drawdown:.2f}%")
+                Logging.info("   - MDD 기간: 상세 정보 없음")
         else:
-            print("3. 최대낙폭(MDD): 계산 불가")
+            Logging.info("3. 최대낙폭(MDD): 계산 불가")
 
         # 4. 샤프 비율
         try:
             sharpe_analysis = strategy.analyzers.sharpe.get_analysis()
             sharpe_ratio = sharpe_analysis.get("sharperatio", None)
             if sharpe_ratio is not None:
-                print(f"4. 샤프 비율: {sharpe_ratio:.2f}%")
+                metrics["sharpe_ratio"] = sharpe_ratio
+                Logging.info(f"4. 샤프 비율: {sharpe_ratio:.2f}%")
             else:
-                print("4. 샤프 비율: 계산 불가 (충분한 데이터가 없음)")
+                Logging.info("4. 샤프 비율: 계산 불가 (충분한 데이터가 없음)")
         except Exception as e:
-            print("4. 샤프 비율: 계산 불가", str(e))
+            Logging.error(msg="4. 샤프 비율: 계산 불가", error=e)
 
         # 5. 승률 및 수익비율
         try:
             # 전체 거래 수
             trade_analysis = strategy.analyzers.trades.get_analysis()
             total_trades = trade_analysis.get("total", {}).get("total", 0)
+            metrics["trades"] = total_trades
 
             if total_trades > 0:
                 # 포트폴리오 가치 변화로 수익 계산
@@ -150,19 +160,41 @@ class AnalyzerResult:
                     profit_factor = (
                         total_profit / self.initial_cash
                     )  # 수익비율을 투자원금 대비 수익으로 계산
+                    metrics.update(win_rate=win_rate, profit_factor=profit_factor)
 
-                    print(
+                    Logging.info(
                         f"5. 승률: {win_rate:.2f}% (성공: {total_trades}건 / 전체: {total_trades}건)"
                     )
-                    print(
+                    Logging.info(
                         f"6. 수익비율: {profit_factor:.2f}% (총수익: {total_profit:,.0f}원)"
                     )
                 else:
-                    print(f"5. 승률: 0.00% (성공: 0건 / 전체: {total_trades}건)")
-                    print(f"6. 수익비율: 0.00 (총손실: {abs(total_profit):,.0f}원)")
+                    metrics.update(win_rate=0.0, profit_factor=0.0)
+                    Logging.info(f"5. 승률: 0.00% (성공: 0건 / 전체: {total_trades}건)")
+                    Logging.info(
+                        f"6. 수익비율: 0.00 (총손실: {abs(total_profit):,.0f}원)"
+                    )
             else:
-                print("5. 승률: 계산 불가 (거래 없음)")
-                print("6. 수익비율: 계산 불가 (거래 없음)")
+                Logging.info("5. 승률: 계산 불가 (거래 없음)")
+                Logging.info("6. 수익비율: 계산 불가 (거래 없음)")
         except Exception as e:
-            print("5. 승률: 계산 중 오류 발생", str(e))
-            print("6. 수익비율: 계산 중 오류 발생", str(e))
+            Logging.error(msg="5. 승률: 계산 중 오류 발생", error=e)
+            Logging.error(msg="6. 수익비율: 계산 중 오류 발생", error=e)
+
+        # 7. 몬테카를로 강건성 (체결별 실현 손익 복원 추출)
+        try:
+            if hasattr(strategy.analyzers, "trade_pnl"):
+                pnl = strategy.analyzers.trade_pnl.get_analysis()
+                if pnl:
+                    years = max((self.df.index[-1] - self.df.index[0]).days, 1) / 365
+                    MonteCarlo.run(
+                        MonteCarlo.returns_from_pnl(pnl, self.initial_cash),
+                        initial_cash=self.initial_cash,
+                        periods_per_year=len(pnl) / years,
+                    ).log()
+                else:
+                    Logging.info("7. 몬테카를로: 계산 불가 (실현 손익 없음)")
+        except Exception as e:
+            Logging.error(msg="7. 몬테카를로: 계산 중 오류 발생", error=e)
+
+        return metrics
@@ -0,0 +1,172 @@
+import backtrader as bt
+import numpy as np
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List
+
+from src.utils.logging import Logging
+
+
+class TradePnlAnalyzer(bt.Analyzer):
+    """
+    실현 손익을 체결 단위로 기록하는 분석기 (몬테카를로 입력용)
+    분할 매도처럼 거래(Trade)가 닫히지 않는 경우에도 포지션을 줄인 체결마다 손익을 기록합니다.
+    """
+
+    def start(self):
+        self.pnl: List[float] = []
+
+    def notify_order(self, order):
+        if order.status != order.Completed or not order.executed.pnl:
+            return
+        # 청산 수량의 실현 손익 - 청산 체결 수수료
+        self.pnl.append(order.executed.pnl - order.executed.comm)
+
+    def get_analysis(self):
+        return self.pnl
+
+
+@dataclass
+class MonteCarloResult:
+    method: str  # "bootstrap" (복원 추출) / "shuffle" (거래 순서 섞기)
+    final_equity: np.ndarray  # 시뮬레이션별 최종 자산
+    max_drawdown: np.ndarray  # 시뮬레이션별 최대낙폭 (%)
+    sharpe_ratio: np.ndarray  # 시뮬레이션별 샤프 비율
+    original: Dict[str, float] = field(default_factory=dict)  # 실제 거래 순서 기준 값
+
+    def summary(self, confidence: float = 0.95) -> Dict[str, Dict[str, float]]:
+        """지표별 평균 / 중앙값 / 신뢰구간 / 실제 값"""
+        lower, upper = (1 - confidence) / 2 * 100, (1 + confidence) / 2 * 100
+        result = {}
+        for name in ("final_equity", "max_drawdown", "sharpe_ratio"):
+            values = getattr(self, name)
+            values = values[~np.isnan(values)]
+            if len(values) == 0:
+                values = np.array([np.nan])
+            low, median, high = np.percentile(values, [lower, 50, upper])
+            result[name] = {
+                "mean": float(values.mean()),
+                "median": float(median),
+                "ci_low": float(low),
+                "ci_high": float(high),
+                "original": self.original.get(name, float("nan")),
+            }
+        return result
+
+    def log(self, confidence: float = 0.95):
+        summary = self.summary(confidence)
+        Logging.info(
+            f"=== 몬테카를로 ({self.method}, {len(self.final_equity)}회, "
+            f"{confidence * 100:.0f}% 구간) ==="
+        )
+        labels = {
+            "final_equity": ("최종 자산", "{:,.0f}원"),
+            "max_drawdown": ("최대낙폭(MDD)", "{:.2f}%"),
+            "sharpe_ratio": ("샤프 비율", "{:.2f}"),
+        }
+        for name, (label, fmt) in labels.items():
+            s = summary[name]
+            Logging.info(
+                f"{label}: 중앙값 {fmt.format(s['median'])}, "
+                f"구간 {fmt.format(s['ci_low'])} ~ {fmt.format(s['ci_high'])}, "
+                f"실제 {fmt.format(s['original'])}"
+            )
+
+
+class MonteCarlo:
+    """
+    거래 손익 기반 몬테카를로 강건성 분석
+    - bootstrap: 거래 수익률을 복원 추출 -> 최종 자산 / MDD / 샤프 분포
+    - shuffle: 같은 거래의 순서만 섞기 -> 경로 의존 지표(MDD) 분포 (최종 자산은 동일)
+    - 시뮬레이션 전체를 (시뮬레이션 수, 거래 수) 배열 하나로 계산, 메모리 한도 내에서 묶음 처리
+    """
+
+    # 한 번에 계산할 최대 원소 수 (float64 기준 약 32MB)
+    BATCH_ELEMENTS = 4_000_000
+
+    @staticmethod
+    def returns_from_pnl(pnl: Iterable[float], initial_cash: float) -> np.ndarray:
+        """체결별 손익을 직전 자산 대비 수익률로 변환합니다."""
+        pnl = np.asarray(list(pnl), dtype=np.float64)
+        equity_before = initial_cash + np.concatenate(([0.0], np.cumsum(pnl)[:-1]))
+        return pnl / equity_before
+
+    @staticmethod
+    def run(
+        returns: np.ndarray,
+        initial_cash: float = 100000000,
+        simulations: int = 10000,
+        method: str = "bootstrap",
+        periods_per_year: float | None = None,
+        seed: int | None = None,
+    ) -> MonteCarloResult:
+        """
+        거래 수익률로 몬테카를로 시뮬레이션을 실행합니다.
+
+        Args:
+            returns (np.ndarray): 거래별 수익률 (직전 자산 대비, 예: 0.01 = 1%)
+            initial_cash (float): 초기 자산
+            simulations (int): 시뮬레이션 횟수
+            method (str): "bootstrap" 또는 "shuffle"
+            periods_per_year (float): 연간 거래 수 (샤프 비율 연율화, None 이면 거래 단위)
+            seed (int): 난수 시드 (같은 시드면 같은 결과)
+
+        Returns:
+            MonteCarloResult: 시뮬레이션별 최종 자산 / MDD / 샤프 비율
+        """
+        if method not in ("bootstrap", "shuffle"):
+            raise ValueError(f"Unknown Monte Carlo method: {method}")
+        returns = np.asarray(returns, dtype=np.float64)
+        count = len(returns)
+        scale = np.sqrt(periods_per_year) if periods_per_year else 1.0
+
+        if count == 0:
+            # 거래가 없으면 자산 변화 없음
+            return MonteCarloResult(
+                method=method,
+                final_equity=np.full(simulations, float(initial_cash)),
+                max_drawdown=np.zeros(simulations),
+                sharpe_ratio=np.full(simulations, np.nan),
+            )
+        original = MonteCarlo._metrics(returns[None, :], initial_cash, scale)
+
+        rng = np.random.default_rng(seed)
+        final_equity = np.empty(simulations)
+        max_drawdown = np.empty(simulations)
+        sharpe_ratio = np.empty(simulations)
+        batch = max(MonteCarlo.BATCH_ELEMENTS // count, 1)
+        for start in range(0, simulations, batch):
+            size = min(batch, simulations - start)
+            if method == "bootstrap":
+                samples = returns[rng.integers(0, count, size=(size, count))]
+            else:
+                samples = rng.permuted(np.broadcast_to(returns, (size, count)), axis=1)
+            metrics = MonteCarlo._metrics(samples, initial_cash, scale)
+            final_equity[start : start + size] = metrics[0]
+            max_drawdown[start : start + size] = metrics[1]
+            sharpe_ratio[start : start + size] = metrics[2]
+
+        return MonteCarloResult(
+            method=method,
+            final_equity=final_equity,
+            max_drawdown=max_drawdown,
+            sharpe_ratio=sharpe_ratio,
+            original={
+                "final_equity": float(original[0][0]),
+                "max_drawdown": float(original[1][0]),
+                "sharpe_ratio": float(original[2][0]),
+            },
+        )
+
+    @staticmethod
+    def _metrics(samples: np.ndarray, initial_cash: float, scale: float):
+        """(시뮬레이션, 거래) 수익률 배열 -> 최종 자산, MDD(%), 샤프 비율"""
+        equity = np.cumprod(1 + samples, axis=1)
+        # 초기 자산(1.0) 도 고점 후보에 포함
+        peaks = np.maximum(np.maximum.accumulate(equity, axis=1), 1.0)
+        max_drawdown = ((peaks - equity) / peaks).max(axis=1) * 100
+
+        std = samples.std(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.where(std > 0, samples.mean(axis=1) / std * scale, np.nan)
+        return equity[:, -1] * initial_cash, max_drawdown, sharpe
@@ -0,0 +1,357 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping
+
+from config import BACKTEST_STORE_PATH
+from src.exchanges.history.candle_array import CandleArray
+from src.utils.logging import Logging
+
+
+class BacktestStore:
+    """
+    백테스트 결과 저장소 (SQLite, 내용 주소 기반 캐시)
+    - 실행 키: 전략 코드 버전 + 파라미터 + 티커/인터벌/데이터 구간 + 데이터 체크섬의 SHA-256
+    - 같은 키로 다시 실행하면 저장된 결과(pickle, zlib 압축)를 바로 반환
+    - 주요 지표는 컬럼으로, 티커는 별도 테이블로 저장하여 인덱스로 비교 조회
+      (예: best("sharpe_ratio", ticker="KRW-BTC", interval="minute60", since=1년 전))
+    """
+
+    # 조회/정렬에 사용할 수 있는 지표 컬럼
+    METRIC_COLUMNS = (
+        "final_value",
+        "roi",
+        "annual_roi",
+        "max_drawdown",
+        "sharpe_ratio",
+        "win_rate",
+        "profit_factor",
+        "trades",
+    )
+
+    SCHEMA = f"""
+        CREATE TABLE IF NOT EXISTS runs (
+            key TEXT PRIMARY KEY,
+            created_at REAL NOT NULL,
+            strategy TEXT NOT NULL,
+            code_version TEXT NOT NULL,
+            params TEXT NOT NULL,
+            interval TEXT,
+            start TEXT NOT NULL,
+            end TEXT NOT NULL,
+            bars INTEGER NOT NULL,
+            {", ".join(f"{column} REAL" for column in METRIC_COLUMNS)},
+            metrics TEXT NOT NULL,
+            result BLOB
+        );
+        CREATE TABLE IF NOT EXISTS run_tickers (
+            key TEXT NOT NULL REFERENCES runs(key) ON DELETE CASCADE,
+            ticker TEXT NOT NULL,
+            PRIMARY KEY (key, ticker)
+        );
+        CREATE INDEX IF NOT EXISTS ix_run_tickers_ticker ON run_tickers (ticker, key);
+        CREATE INDEX IF NOT EXISTS ix_runs_strategy ON runs (strategy, interval, start);
+        CREATE INDEX IF NOT EXISTS ix_runs_sharpe ON runs (interval, sharpe_ratio);
+        CREATE INDEX IF NOT EXISTS ix_runs_roi ON runs (interval, roi);
+    """
+
+    path: str  # SQLite 파일 경로
+
+    def __init__(self, path: str = BACKTEST_STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(self.SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """스레드별 연결 (WAL 모드: 여러 프로세스가 읽는 중에도 기록 가능)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA foreign_keys=ON")
+            self._local.conn = conn
+        with conn:
+            yield conn
+
+    # 실행 키
+    @staticmethod
+    def code_version(*objects: Any) -> str:
+        """
+        전략 패키지(src/exchanges/strategy - 전략/신호/분석기) 전체와
+        객체가 정의된 모듈 소스의 해시 (백테스트 결과에 영향을 주는 코드가 바뀌면 다른 키)
+        """
+        paths = {
+            os.path.abspath(inspect.getsourcefile(sys.modules[obj.__module__]))
+            for obj in objects
+        }
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        for root, dirs, files in os.walk(package_dir):
+            dirs[:] = [name for name in dirs if name != "__pycache__"]
+            paths.update(
+                os.path.join(root, name) for name in files if name.endswith(".py")
+            )
+
+        digest = hashlib.sha256()
+        for path in sorted(paths):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def data_checksum(candles: Mapping[str, pd.DataFrame | CandleArray]) -> str:
+        """티커별 캔들 데이터(타임스탬프 + 값)의 체크섬"""
+        digest = hashlib.blake2b(digest_size=16)
+        for ticker in sorted(candles):
+            data = candles[ticker]
+            digest.update(ticker.encode())
+            if isinstance(data, CandleArray):
+                arrays = [data.timestamps, data.prices, data.volumes]
+            else:
+                arrays = [
+                    data.index.to_numpy(dtype="datetime64[ns]"),
+                    data.to_numpy(dtype=np.float64),
+                ]
+                digest.update(",".join(map(str, data.columns)).encode())
+            for array in arrays:
+                digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def run_key(
+        strategy: str,
+        code_version: str,
+        params: Dict[str, Any],
+        candles: Mapping[str, pd.DataFrame | CandleArray],
+        interval: str | None = None,
+    ) -> str:
+        start, end, _ = BacktestStore._range(candles)
+        payload = json.dumps(
+            {
+                "strategy": strategy,
+                "code_version": code_version,
+                "params": params,
+                "tickers": sorted(candles),
+                "interval": interval,
+                "start": start,
+                "end": end,
+                "data": BacktestStore.data_checksum(candles),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    def _range(candles: Mapping[str, pd.DataFrame | CandleArray]):
+        """전체 티커의 데이터 시작 / 끝 시각 (ISO 문자열) 과 봉 수"""
+        starts, ends, bars = [], [], 0
+        for data in candles.values():
+            if len(data) == 0:
+                continue
+            if isinstance(data, CandleArray):
+                starts.append(data.first_time())
+                ends.append(data.last_time())
+            else:
+                starts.append(pd.Timestamp(data.index[0]))
+                ends.append(pd.Timestamp(data.index[-1]))
+            bars += len(data)
+        if not starts:
+            return "", "", 0
+        return min(starts).isoformat(), max(ends).isoformat(), bars
+
+    # 저장 / 조회
+    def get(self, key: str) -> Any | None:
+        """저장된 결과 (없거나 읽을 수 없으면 None)"""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT result FROM runs WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        try:
+            return pickle.loads(zlib.decompress(row[0]))
+        except Exception as e:
+            # 클래스 구조가 바뀐 이전 결과 등은 다시 계산
+            Logging.warning("Stored backtest result is unreadable", error=repr(e))
+            return None
+
+    def put(
+        self,
+        key: str,
+        strategy: str,
+        code_version: str,
+        params: Dict[str, Any],
+        candles: Mapping[str, pd.DataFrame | CandleArray],
+        metrics: Dict[str, float],
+        result: Any = None,
+        interval: str | None = None,
+    ):
+        start, end, bars = self._range(candles)
+        blob = (
+            zlib.compress(pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL))
+            if result is not None
+            else None
+        )
+        columns = ", ".join(self.METRIC_COLUMNS)
+        placeholders = ", ".join("?" for _ in self.METRIC_COLUMNS)
+        with self._connect() as conn:
+            conn.execute(
+                f"""
+                INSERT OR REPLACE INTO runs (
+                    key, created_at, strategy, code_version, params, interval,
+                    start, end, bars, {columns}, metrics, result
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, {placeholders}, ?, ?)
+                """,
+                (
+                    key,
+                    time.time(),
+                    strategy,
+                    code_version,
+                    json.dumps(params, sort_keys=True, default=str),
+                    interval,
+                    start,
+                    end,
+                    bars,
+                    *(
+                        self._number(metrics.get(column))
+                        for column in self.METRIC_COLUMNS
+                    ),
+                    json.dumps(metrics, default=float),
+                    blob,
+                ),
+            )
+            conn.execute("DELETE FROM run_tickers WHERE key = ?", (key,))
+            conn.executemany(
+                "INSERT INTO run_tickers (key, ticker) VALUES (?, ?)",
+                [(key, ticker) for ticker in sorted(candles)],
+            )
+
+    def get_or_run(
+        self,
+        strategy: str,
+        code_version: str,
+        params: Dict[str, Any],
+        candles: Mapping[str, pd.DataFrame | CandleArray],
+        runner,
+        interval: str | None = None,
+    ) -> Any:
+        """
+        같은 실행 키의 결과가 있으면 반환하고, 없으면 runner() 로 실행 후 저장합니다.
+        runner 는 (결과, 지표 딕셔너리) 를 반환해야 하며, 결과가 None 이면 저장하지 않습니다.
+        """
+        key = self.run_key(strategy, code_version, params, candles, interval)
+        cached = self.get(key)
+        if cached is not None:
+            Logging.info("Backtest result loaded from store", key=key[:16])
+            return cached
+
+        result, metrics = runner()
+        if result is not None:
+            self.put(
+                key,
+                strategy,
+                code_version,
+                params,
+                candles,
+                metrics,
+                result=result,
+                interval=interval,
+            )
+        return result
+
+    def best(
+        self,
+        metric: str = "sharpe_ratio",
+        ticker: str | None = None,
+        interval: str | None = None,
+        strategy: str | None = None,
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+        ascending: bool = False,
+        limit: int = 10,
+    ) -> pd.DataFrame:
+        """
+        조건에 맞는 실행을 지표 순으로 조회합니다. (결과 본문 제외)
+
+        Args:
+            metric (str): 정렬 지표 (METRIC_COLUMNS)
+            ticker (str): 이 티커를 포함한 실행만
+            interval (str): 캔들 인터벌
+            strategy (str): 전략 이름
+            since / until: 데이터 구간이 이 범위 안에 있는 실행만 (start >= since, end <= until)
+            ascending (bool): 오름차순 정렬 (예: max_drawdown 이 작은 순)
+            limit (int): 최대 개수
+
+        Returns:
+            pd.DataFrame: key 인덱스, 파라미터 / 데이터 구간 / 지표 컬럼
+        """
+        if metric not in self.METRIC_COLUMNS:
+            raise ValueError(f"Unknown backtest metric: {metric}")
+
+        conditions: List[str] = [f"runs.{metric} IS NOT NULL"]
+        args: List[Any] = []
+        joins = ""
+        if ticker is not None:
+            joins = "JOIN run_tickers ON run_tickers.key = runs.key"
+            conditions.append("run_tickers.ticker = ?")
+            args.append(ticker)
+        for column, value in (("interval", interval), ("strategy", strategy)):
+            if value is not None:
+                conditions.append(f"runs.{column} = ?")
+                args.append(value)
+        if since is not None:
+            conditions.append("runs.start >= ?")
+            args.append(pd.Timestamp(since).isoformat())
+        if until is not None:
+            conditions.append("runs.end <= ?")
+            args.append(pd.Timestamp(until).isoformat())
+
+        query = f"""
+            SELECT runs.key, runs.created_at, runs.strategy, runs.code_version,
+                runs.params, runs.interval, runs.start, runs.end, runs.bars,
+                {", ".join(f"runs.{column}" for column in self.METRIC_COLUMNS)}
+            FROM runs {joins}
+            WHERE {" AND ".join(conditions)}
+            ORDER BY runs.{metric} {"ASC" if ascending else "DESC"}
+            LIMIT ?
+        """
+        with self._connect() as conn:
+            df = pd.read_sql_query(query, conn, params=[*args, limit])
+        df["params"] = df["params"].map(json.loads)
+        df["created_at"] = pd.to_datetime(df["created_at"], unit="s")
+        return df.set_index("key")
+
+    def tickers(self, key: str) -> List[str]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT ticker FROM run_tickers WHERE key = ? ORDER BY ticker", (key,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def delete(self, keys: Iterable[str]):
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM runs WHERE key = ?", [(k,) for k in keys])
+
+    @staticmethod
+    def _number(value: Any) -> float | None:
+        """SQLite 에 저장할 지표 값 (NaN / 무한대는 NULL)"""
+        if value is None:
+            return None
+        value = float(value)
+        return value if np.isfinite(value) else None
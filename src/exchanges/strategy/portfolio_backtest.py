@@ -0,0 +1,367 @@
+import numpy as np
+import pandas as pd
+
+from dataclasses import asdict, dataclass, field, is_dataclass
+from typing import Any, Dict, List, Mapping
+
+# 등록된 신호 전략 로드 (StrategyRegistry.register 데코레이터 실행)
+import src.exchanges.strategy.registry.signal_strategies  # noqa: F401
+
+from src.exchanges.history.candle_array import CandleArray
+from src.exchanges.strategy.analyzer.analyzer_result import AnalyzerMixin
+from src.exchanges.strategy.analyzer.monte_carlo import MonteCarlo, MonteCarloResult
+from src.exchanges.strategy.registry.indicator_graph import (
+    IndicatorFrame,
+    IndicatorGraph,
+)
+from src.exchanges.strategy.registry.strategy_registry import StrategyRegistry
+from src.exchanges.strategy.strategies.datas.types import StrategyType
+from src.utils.logging import Logging
+
+
+@dataclass
+class PortfolioResult:
+    equity: pd.Series  # 공통 타임라인 기준 포트폴리오 가치
+    cash: pd.Series  # 공통 타임라인 기준 현금 잔고
+    fills: pd.DataFrame  # 체결 내역 (time, ticker, side, price, size, value, pnl)
+    assets: pd.DataFrame  # 티커별 지표
+    metrics: Dict[str, float] = field(default_factory=dict)  # 포트폴리오 지표
+
+    def log(self):
+        m = self.metrics
+        Logging.info("=== 포트폴리오 백테스팅 결과 ===")
+        Logging.info(f"종목 수: {len(self.assets)}, 타임라인: {len(self.equity)}봉")
+        Logging.info(f"초기 포트폴리오 가치: {m['initial_cash']:,.0f}원")
+        Logging.info(f"최종 포트폴리오 가치: {m['final_value']:,.0f}원")
+        Logging.info(f"1. 투자수익률: {m['roi']:.2f}%")
+        Logging.info(f"2. 연간수익률: {m['annual_roi']:.2f}%")
+        Logging.info(f"3. 최대낙폭(MDD): {m['max_drawdown']:.2f}%")
+        Logging.info(f"4. 샤프 비율: {m['sharpe_ratio']:.2f}")
+        Logging.info(
+            f"5. 승률: {m['win_rate']:.2f}% (매도 {m['sells']:.0f}건, 매수 {m['buys']:.0f}건)"
+        )
+        Logging.info(f"6. 수익비율: {m['profit_factor']:.2f}")
+
+    def monte_carlo(
+        self,
+        simulations: int = 10000,
+        method: str = "bootstrap",
+        seed: int | None = None,
+    ) -> MonteCarloResult:
+        """매도 체결의 실현 손익으로 몬테카를로 강건성 분석을 실행합니다."""
+        pnl = self.fills.loc[self.fills["side"] == "SELL", "pnl"].to_numpy()
+        initial_cash = self.metrics["initial_cash"]
+        years = max((self.equity.index[-1] - self.equity.index[0]).days, 1) / 365
+        return MonteCarlo.run(
+            MonteCarlo.returns_from_pnl(pnl, initial_cash),
+            initial_cash=initial_cash,
+            simulations=simulations,
+            method=method,
+            periods_per_year=len(pnl) / years,
+            seed=seed,
+        )
+
+
+class PortfolioBacktest:
+    """
+    여러 티커를 공통 현금 잔고로 운용하는 포트폴리오 백테스트
+    - 티커별 봉을 합집합 타임라인으로 정렬 (정렬된 타임스탬프 searchsorted, 행렬 생성 없음)
+    - 티커별 신호는 SignalStrategy.signals() 로 전체 봉을 한 번에 계산
+    - 신호 봉 종가에서 주문, 해당 티커의 다음 봉 시가에 체결 (backtrader 시장가 주문과 동일)
+    - ProfitableStrategy 와 같이 포지션이 없을 때만 매수, 포지션이 있을 때만 매도
+    - 같은 시각의 주문은 매도 먼저 체결 후 매수. 매수는 각각 현금의 buy_percent,
+      합계가 현금을 넘으면 현금을 균등 분배 (티커 순서와 무관한 결정적 배분)
+    - 매도는 보유 수량의 sell_percent (CustomPercentSizer 와 같은 30%/50% 기본값)
+    """
+
+    def __init__(
+        self,
+        strategy_type: StrategyType = StrategyType.PROFITABLE,
+        initial_cash: float = 100000000,
+        commission: float = 0.0005,
+        buy_percent: float = 30,
+        sell_percent: float = 50,
+    ):
+        self.strategy = StrategyRegistry.get(strategy_type)
+        self.initial_cash = initial_cash
+        self.commission = commission
+        self.buy_percent = buy_percent
+        self.sell_percent = sell_percent
+
+    def params(self) -> Dict[str, Any]:
+        """결과 저장소 실행 키에 쓰는 파라미터 (백테스트 설정 + 전략의 단순 값 파라미터)"""
+        strategy_params = {
+            name: asdict(value) if is_dataclass(value) else value
+            for name, value in vars(self.strategy).items()
+            if is_dataclass(value) or isinstance(value, (int, float, str, bool))
+        }
+        return {
+            "strategy_type": self.strategy.strategy_type.value,
+            "strategy_params": strategy_params,
+            "initial_cash": self.initial_cash,
+            "commission": self.commission,
+            "buy_percent": self.buy_percent,
+            "sell_percent": self.sell_percent,
+        }
+
+    def run(self, candles: Mapping[str, pd.DataFrame | CandleArray]) -> PortfolioResult:
+        """
+        포트폴리오 백테스트 실행
+
+        Args:
+            candles (Mapping[str, pd.DataFrame | CandleArray]): 티커별 OHLCV 데이터
+
+        Returns:
+            PortfolioResult: 포트폴리오 가치 곡선, 체결 내역, 포트폴리오/티커별 지표
+        """
+        tickers = sorted(candles)
+        arrays = [
+            (
+                c
+                if isinstance(c, CandleArray)
+                else CandleArray.from_dataframe(c, np.float64)
+            )
+            for c in (candles[ticker] for ticker in tickers)
+        ]
+        timeline = np.unique(np.concatenate([c.timestamps for c in arrays]))
+
+        orders = self._orders(arrays)
+        fills = self._simulate(orders, len(tickers))
+        equity, cash = self._equity(arrays, timeline, fills)
+
+        index = pd.DatetimeIndex(timeline.view("datetime64[ns]"))
+        equity = pd.Series(equity, index=index, name="equity")
+        cash = pd.Series(cash, index=index, name="cash")
+        fills_df = pd.DataFrame(
+            {
+                "time": pd.DatetimeIndex(fills["time"].view("datetime64[ns]")),
+                "ticker": np.asarray(tickers, dtype=object)[fills["ticker"]],
+                "side": np.where(fills["side"] > 0, "BUY", "SELL"),
+                "price": fills["price"],
+                "size": fills["size"],
+                "value": fills["value"],
+                "pnl": fills["pnl"],
+            }
+        )
+        return PortfolioResult(
+            equity=equity,
+            cash=cash,
+            fills=fills_df,
+            assets=self._asset_metrics(tickers, arrays, fills),
+            metrics=self._portfolio_metrics(equity, fills),
+        )
+
+    def _orders(self, arrays: List[CandleArray]) -> Dict[str, np.ndarray]:
+        """
+        티커별 신호를 체결 시각(다음 봉) 기준 주문 배열로 변환합니다.
+        신호가 있는 봉만 남기므로 메모리는 전체 봉이 아닌 주문 수에 비례합니다.
+        """
+        specs = self.strategy.required_indicators()
+        times, tickers, sides, prices = [], [], [], []
+        for n, candles in enumerate(arrays):
+            if len(candles) < 2:
+                continue
+            frame = IndicatorGraph.compute(IndicatorFrame.from_candles(candles), specs)
+            signals = self.strategy.signals(frame)[:-1]  # 마지막 봉 신호는 체결 불가
+            bars = np.flatnonzero(signals) + 1  # 체결 봉 (다음 봉)
+            times.append(candles.timestamps[bars])
+            tickers.append(np.full(len(bars), n, dtype=np.int32))
+            sides.append(signals[bars - 1])
+            prices.append(candles.open[bars].astype(np.float64))
+
+        if not times:
+            empty = np.empty(0)
+            return {
+                "time": empty.astype(np.int64),
+                "ticker": empty.astype(np.int32),
+                "side": empty.astype(np.int8),
+                "price": empty,
+            }
+        orders = {
+            "time": np.concatenate(times),
+            "ticker": np.concatenate(tickers),
+            "side": np.concatenate(sides),
+            "price": np.concatenate(prices),
+        }
+        # 시각 -> 매도(-1) 먼저 -> 티커 순서로 정렬
+        order = np.lexsort((orders["ticker"], orders["side"], orders["time"]))
+        return {key: values[order] for key, values in orders.items()}
+
+    def _simulate(
+        self, orders: Dict[str, np.ndarray], ticker_count: int
+    ) -> Dict[str, np.ndarray]:
+        """같은 시각의 주문을 묶어 티커 단위 벡터 연산으로 체결합니다."""
+        fee = self.commission
+        cash = float(self.initial_cash)
+        size = np.zeros(ticker_count)  # 보유 수량
+        cost = np.zeros(ticker_count)  # 보유분 매수 원가 (수수료 포함)
+
+        count = len(orders["time"])
+        fill_size = np.zeros(count)
+        fill_value = np.zeros(count)
+        fill_pnl = np.zeros(count)
+        fill_cash = np.zeros(count)  # 체결 후 현금 잔고
+        filled = np.zeros(count, dtype=bool)
+
+        boundaries = np.flatnonzero(np.diff(orders["time"])) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [count]))
+        for start, end in zip(starts, ends):
+            group = np.arange(start, end)
+            tickers = orders["ticker"][group]
+            sides = orders["side"][group]
+            prices = orders["price"][group]
+
+            # 매도: 보유 중인 티커만, 보유 수량의 sell_percent
+            sell = (sides < 0) & (size[tickers] > 0)
+            if sell.any():
+                rows, t = group[sell], tickers[sell]
+                sold = size[t] * (self.sell_percent / 100)
+                proceeds = sold * prices[sell] * (1 - fee)
+                basis = cost[t] * (sold / size[t])
+                fill_size[rows] = sold
+                fill_value[rows] = proceeds
+                fill_pnl[rows] = proceeds - basis
+                filled[rows] = True
+                size[t] -= sold
+                cost[t] -= basis
+                cash += proceeds.sum()
+
+            # 매수: 포지션이 없는 티커만, 현금의 buy_percent (초과 시 균등 분배)
+            buy = (sides > 0) & (size[tickers] == 0)
+            if buy.any() and cash > 0:
+                rows, t = group[buy], tickers[buy]
+                budget = min(cash * (self.buy_percent / 100), cash / len(rows))
+                bought = budget / (prices[buy] * (1 + fee))
+                fill_size[rows] = bought
+                fill_value[rows] = budget
+                filled[rows] = True
+                size[t] += bought
+                cost[t] += budget
+                cash -= budget * len(rows)
+
+            fill_cash[start:end] = cash
+
+        fills = {key: values[filled] for key, values in orders.items()}
+        fills.update(
+            size=fill_size[filled],
+            value=fill_value[filled],
+            pnl=fill_pnl[filled],
+            cash=fill_cash[filled],
+        )
+        return fills
+
+    def _equity(
+        self,
+        arrays: List[CandleArray],
+        timeline: np.ndarray,
+        fills: Dict[str, np.ndarray],
+    ):
+        """
+        공통 타임라인 기준 현금 / 포트폴리오 가치 곡선
+        티커별로 체결 후 수량 x 종가를 계산해 타임라인에 직전 봉 값으로 더합니다. (O(타임라인) 메모리)
+        """
+        cash = np.full(len(timeline), float(self.initial_cash))
+        if len(fills["time"]):
+            # 체결 시각 이후 현금 잔고 (같은 시각의 마지막 체결 기준)
+            position = np.searchsorted(fills["time"], timeline, side="right") - 1
+            cash = np.where(position >= 0, fills["cash"][position], cash)
+
+        equity = cash.copy()
+        for n, candles in enumerate(arrays):
+            mine = fills["ticker"] == n
+            if not mine.any():
+                continue
+            signed = np.where(fills["side"][mine] > 0, 1.0, -1.0) * fills["size"][mine]
+            held = np.cumsum(signed)
+            # 봉별 보유 수량 (체결 봉부터 반영)
+            bar_fill = (
+                np.searchsorted(candles.timestamps, fills["time"][mine], side="left")
+                if len(candles)
+                else np.empty(0, dtype=np.int64)
+            )
+            last = np.searchsorted(bar_fill, np.arange(len(candles)), side="right") - 1
+            size = np.where(last >= 0, held[np.maximum(last, 0)], 0.0)
+            value = size * candles.close.astype(np.float64)
+
+            # 타임라인의 각 시각에서 이 티커의 직전 봉 가치
+            bar = np.searchsorted(candles.timestamps, timeline, side="right") - 1
+            equity += np.where(bar >= 0, value[np.maximum(bar, 0)], 0.0)
+        return equity, cash
+
+    def _portfolio_metrics(
+        self, equity: pd.Series, fills: Dict[str, np.ndarray]
+    ) -> Dict[str, float]:
+        analyzer = AnalyzerMixin()
+        final_value = float(equity.iloc[-1])
+        days = max((equity.index[-1] - equity.index[0]).days, 1)
+
+        values = equity.to_numpy()
+        peaks = np.maximum.accumulate(values)
+        max_drawdown = float(((peaks - values) / peaks).max() * 100)
+
+        daily_returns = equity.resample("D").last().dropna().pct_change().dropna()
+        sharpe = (
+            float(analyzer.calculate_sharpe_ratio(daily_returns))
+            if len(daily_returns) > 1 and daily_returns.std() > 0
+            else 0.0
+        )
+
+        sells = fills["side"] < 0
+        pnl = fills["pnl"][sells]
+        profit, loss = pnl[pnl > 0].sum(), -pnl[pnl < 0].sum()
+        return {
+            "initial_cash": float(self.initial_cash),
+            "final_value": final_value,
+            "roi": (final_value - self.initial_cash) / self.initial_cash * 100,
+            "annual_roi": analyzer.calculate_annual_roi(
+                final_value, self.initial_cash, days
+            ),
+            "max_drawdown": max_drawdown,
+            "sharpe_ratio": sharpe,
+            "buys": float((~sells).sum()),
+            "sells": float(sells.sum()),
+            "trades": float(len(sells)),
+            "win_rate": float((pnl > 0).mean() * 100) if len(pnl) else 0.0,
+            "profit_factor": float(profit / loss) if loss > 0 else float("inf"),
+        }
+
+    def _asset_metrics(
+        self,
+        tickers: List[str],
+        arrays: List[CandleArray],
+        fills: Dict[str, np.ndarray],
+    ) -> pd.DataFrame:
+        count = len(tickers)
+        ticker = fills["ticker"]
+        sells = fills["side"] < 0
+        signed = np.where(sells, -1.0, 1.0) * fills["size"]
+
+        buys_n = np.bincount(ticker[~sells], minlength=count)
+        sells_n = np.bincount(ticker[sells], minlength=count)
+        wins = np.bincount(ticker[sells & (fills["pnl"] > 0)], minlength=count)
+        realized = np.bincount(ticker, weights=fills["pnl"], minlength=count)
+        invested = np.bincount(
+            ticker[~sells], weights=fills["value"][~sells], minlength=count
+        )
+        final_size = np.bincount(ticker, weights=signed, minlength=count)
+        last_close = np.array(
+            [float(c.close[-1]) if len(c) else np.nan for c in arrays]
+        )
+        final_value = final_size * last_close
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            win_rate = np.where(sells_n > 0, wins / sells_n * 100, 0.0)
+        return pd.DataFrame(
+            {
+                "bars": [len(c) for c in arrays],
+                "buys": buys_n,
+                "sells": sells_n,
+                "win_rate": win_rate,
+                "invested": invested,
+                "realized_pnl": realized,
+                "final_size": final_size,
+                "final_value": final_value,
+            },
+            index=pd.Index(tickers, name="ticker"),
+        )
@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+from typing import Dict
+
+from src.exchanges.strategy.registry.strategy_registry import StrategySignal
+from src.exchanges.strategy.strategies.datas.types import StrategyType, TradingSignal
+
+
+@dataclass
+class EnsembleParameters:
+    # 전략별 투표 가중치
+    weights: Dict[StrategyType, float] = field(
+        default_factory=lambda: {
+            StrategyType.PROFITABLE: 0.4,
+            StrategyType.RSI: 0.2,
+            StrategyType.MA_CROSS: 0.2,
+            StrategyType.DCA: 0.2,
+        }
+    )
+    buy_threshold: float = 0.3  # 가중 점수가 이 값 이상이면 매수
+    sell_threshold: float = -0.3  # 가중 점수가 이 값 이하이면 매도
+
+
+@dataclass
+class EnsembleSignal:
+    signal: TradingSignal  # 가중 투표 결과
+    score: float  # 가중 점수 (-1: 전원 매도 ~ 1: 전원 매수)
+    signals: Dict[StrategyType, StrategySignal]  # 전략별 신호
+
+    def summary(self) -> str:
+        votes = ", ".join(
+            f"{strategy_type.value}: {signal.signal.value}"
+            for strategy_type, signal in self.signals.items()
+        )
+        return f"{votes} (score: {self.score:.2f})"
+
+
+class EnsembleStrategy:
+    """
+    여러 전략의 신호를 가중 투표로 하나의 신호로 결합하는 클래스
+    BUY = +1, SELL = -1, HOLD = 0 으로 환산하여 가중 평균을 계산합니다.
+    """
+
+    VOTES = {
+        TradingSignal.BUY: 1.0,
+        TradingSignal.SELL: -1.0,
+        TradingSignal.HOLD: 0.0,
+    }
+
+    def __init__(self, params: EnsembleParameters = None):
+        self.params = params or EnsembleParameters()
+
+    @property
+    def strategy_types(self):
+        return list(self.params.weights.keys())
+
+    def vote(self, signals: Dict[StrategyType, StrategySignal]) -> EnsembleSignal:
+        total_weight = 0.0
+        weighted_sum = 0.0
+        for strategy_type, signal in signals.items():
+            weight = self.params.weights.get(strategy_type, 0.0)
+            total_weight += weight
+            weighted_sum += weight * self.VOTES[signal.signal]
+
+        score = weighted_sum / total_weight if total_weight > 0 else 0.0
+
+        if score >= self.params.buy_threshold:
+            result = TradingSignal.BUY
+        elif score <= self.params.sell_threshold:
+            result = TradingSignal.SELL
+        else:
+            result = TradingSignal.HOLD
+
+        return EnsembleSignal(signal=result, score=score, signals=signals)
@@ -0,0 +1,270 @@
+import numpy as np
+import pandas as pd
+import talib
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Tuple
+
+from src.utils.timing import StageTimer
+
+if TYPE_CHECKING:
+    from src.exchanges.history.candle_array import CandleArray
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """
+    전략이 필요로 하는 기술적 지표의 선언
+    - kind: 지표 종류 (rsi, sma, ema, macd, macd_cross, stoch, bbands)
+    - params: 지표 파라미터 (정렬된 (이름, 값) 튜플)
+    종류와 파라미터가 같으면 같은 지표로 취급되어 한 번만 계산됩니다.
+    """
+
+    kind: str
+    params: Tuple[Tuple[str, Any], ...] = ()
+
+    @classmethod
+    def of(cls, kind: str, **params) -> "IndicatorSpec":
+        return cls(kind=kind, params=tuple(sorted(params.items())))
+
+    @classmethod
+    def rsi(cls, period: int = 14) -> "IndicatorSpec":
+        return cls.of("rsi", period=period)
+
+    @classmethod
+    def sma(cls, period: int) -> "IndicatorSpec":
+        return cls.of("sma", period=period)
+
+    @classmethod
+    def ema(cls, period: int) -> "IndicatorSpec":
+        return cls.of("ema", period=period)
+
+    @classmethod
+    def macd(cls, fast: int = 12, slow: int = 26, signal: int = 9) -> "IndicatorSpec":
+        return cls.of("macd", fast=fast, slow=slow, signal=signal)
+
+    @classmethod
+    def macd_cross(
+        cls, fast: int = 12, slow: int = 26, signal: int = 9
+    ) -> "IndicatorSpec":
+        return cls.of("macd_cross", fast=fast, slow=slow, signal=signal)
+
+    @classmethod
+    def stoch(cls, fastk: int = 12, slowk: int = 3, slowd: int = 3) -> "IndicatorSpec":
+        return cls.of("stoch", fastk=fastk, slowk=slowk, slowd=slowd)
+
+    @classmethod
+    def bbands(cls, period: int = 20, nbdev: float = 2) -> "IndicatorSpec":
+        return cls.of("bbands", period=period, nbdev=nbdev)
+
+    @property
+    def key(self) -> str:
+        values = ",".join(f"{name}={value}" for name, value in self.params)
+        return f"{self.kind}({values})"
+
+    def param(self, name: str) -> Any:
+        return dict(self.params)[name]
+
+
+@dataclass
+class IndicatorFrame:
+    """
+    하나의 캔들 집합에 대한 원본 배열과 계산된 지표 배열을 보관하는 클래스
+    모든 전략은 같은 IndicatorFrame 을 공유합니다.
+    """
+
+    index: np.ndarray  # datetime64[ns] 타임스탬프
+    inputs: Dict[str, np.ndarray]  # open/high/low/close/volume 원본 배열
+    values: Dict[str, Tuple[np.ndarray, ...]] = field(default_factory=dict)
+
+    INPUT_COLUMNS = ("open", "high", "low", "close", "volume")
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "IndicatorFrame":
+        """
+        DataFrame 의 OHLCV 컬럼을 연속된 float64 배열로 추출합니다.
+        Indicator.compute 로 계산된 지표 컬럼 (df.attrs["indicators"]) 은 다시 계산하지 않도록 함께 담습니다.
+        """
+        inputs = {
+            column: cls._array(df, column)
+            for column in cls.INPUT_COLUMNS
+            if column in df.columns
+        }
+        values = {
+            key: tuple(cls._array(df, column) for column in columns)
+            for key, columns in df.attrs.get("indicators", {}).items()
+            if all(column in df.columns for column in columns)
+        }
+        return cls(
+            index=df.index.to_numpy(dtype="datetime64[ns]"),
+            inputs=inputs,
+            values=values,
+        )
+
+    @classmethod
+    def from_candles(cls, candles: "CandleArray") -> "IndicatorFrame":
+        """
+        CandleArray 의 컬럼 뷰로 프레임을 만듭니다.
+        가격이 float64 면 복사 없이 사용하고, float32 면 TA-Lib 입력용 float64 로 변환합니다.
+        """
+        inputs = {
+            column: np.ascontiguousarray(getattr(candles, column), dtype=np.float64)
+            for column in cls.INPUT_COLUMNS
+        }
+        return cls(index=candles.index, inputs=inputs)
+
+    @staticmethod
+    def _array(df: pd.DataFrame, column: str) -> np.ndarray:
+        return np.ascontiguousarray(df[column].to_numpy(dtype=np.float64))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    @property
+    def close(self) -> np.ndarray:
+        return self.inputs["close"]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self.inputs["high"]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self.inputs["low"]
+
+    def has(self, spec: IndicatorSpec) -> bool:
+        return spec.key in self.values
+
+    def get(self, spec: IndicatorSpec) -> Tuple[np.ndarray, ...]:
+        """지표의 출력 배열 튜플 (예: macd -> (macd, signal, hist))"""
+        return self.values[spec.key]
+
+    def first(self, spec: IndicatorSpec) -> np.ndarray:
+        """지표의 첫 번째 출력 배열"""
+        return self.values[spec.key][0]
+
+
+def _macd_cross(frame: IndicatorFrame, spec: IndicatorSpec) -> Tuple[np.ndarray]:
+    macd, macd_signal, _ = frame.get(
+        IndicatorSpec.macd(spec.param("fast"), spec.param("slow"), spec.param("signal"))
+    )
+    prev_macd = np.roll(macd, 1)
+    prev_signal = np.roll(macd_signal, 1)
+    prev_macd[0] = np.nan
+    prev_signal[0] = np.nan
+    cross = np.select(
+        [
+            # 골든크로스
+            (prev_macd < prev_signal) & (macd > macd_signal),
+            # 데드크로스
+            (prev_macd > prev_signal) & (macd < macd_signal),
+        ],
+        [1.0, -1.0],
+        default=0.0,
+    )
+    return (cross,)
+
+
+class IndicatorGraph:
+    """
+    지표 의존성 그래프
+    요청된 지표들의 합집합을 의존성 순서대로 정렬하여 한 번씩만 계산합니다.
+    """
+
+    # 지표 종류별 계산 함수 (frame, spec) -> 출력 배열 튜플
+    CALCULATORS: Dict[
+        str, Callable[[IndicatorFrame, IndicatorSpec], Tuple[np.ndarray, ...]]
+    ] = {
+        "rsi": lambda frame, spec: (
+            talib.RSI(frame.close, timeperiod=spec.param("period")),
+        ),
+        "sma": lambda frame, spec: (
+            talib.SMA(frame.close, timeperiod=spec.param("period")),
+        ),
+        "ema": lambda frame, spec: (
+            talib.EMA(frame.close, timeperiod=spec.param("period")),
+        ),
+        "macd": lambda frame, spec: talib.MACD(
+            frame.close,
+            fastperiod=spec.param("fast"),
+            slowperiod=spec.param("slow"),
+            signalperiod=spec.param("signal"),
+        ),
+        "macd_cross": _macd_cross,
+        "stoch": lambda frame, spec: talib.STOCH(
+            frame.high,
+            frame.low,
+            frame.close,
+            fastk_period=spec.param("fastk"),
+            slowk_period=spec.param("slowk"),
+            slowk_matype=0,
+            slowd_period=spec.param("slowd"),
+            slowd_matype=0,
+        ),
+        "bbands": lambda frame, spec: talib.BBANDS(
+            frame.close,
+            timeperiod=spec.param("period"),
+            nbdevup=spec.param("nbdev"),
+            nbdevdn=spec.param("nbdev"),
+            matype=talib.MA_Type.SMA,
+        ),
+    }
+
+    # 지표 종류별 선행 지표
+    DEPENDENCIES: Dict[str, Callable[[IndicatorSpec], List[IndicatorSpec]]] = {
+        "macd_cross": lambda spec: [
+            IndicatorSpec.macd(
+                spec.param("fast"), spec.param("slow"), spec.param("signal")
+            )
+        ],
+    }
+
+    @classmethod
+    def resolve(cls, specs: Iterable[IndicatorSpec]) -> List[IndicatorSpec]:
+        """
+        지표 목록의 합집합을 의존성이 먼저 오도록 정렬합니다.
+
+        Args:
+            specs (Iterable[IndicatorSpec]): 요청된 지표 목록 (중복 허용)
+
+        Returns:
+            List[IndicatorSpec]: 중복이 제거되고 계산 순서로 정렬된 지표 목록
+        """
+        ordered: List[IndicatorSpec] = []
+        visited = set()
+
+        def visit(spec: IndicatorSpec):
+            if spec.key in visited:
+                return
+            if spec.kind not in cls.CALCULATORS:
+                raise ValueError(f"Unknown indicator: {spec.kind}")
+            visited.add(spec.key)
+            for dependency in cls.DEPENDENCIES.get(spec.kind, lambda _: [])(spec):
+                visit(dependency)
+            ordered.append(spec)
+
+        for spec in specs:
+            visit(spec)
+
+        return ordered
+
+    @classmethod
+    @StageTimer.timed("indicators")
+    def compute(
+        cls, frame: IndicatorFrame, specs: Iterable[IndicatorSpec]
+    ) -> IndicatorFrame:
+        """
+        프레임에 아직 없는 지표만 계산하여 추가합니다.
+
+        Args:
+            frame (IndicatorFrame): 원본 배열이 담긴 프레임
+            specs (Iterable[IndicatorSpec]): 필요한 지표 목록
+
+        Returns:
+            IndicatorFrame: 지표가 추가된 프레임 (같은 객체)
+        """
+        for spec in cls.resolve(specs):
+            if frame.has(spec):
+                continue
+            frame.values[spec.key] = tuple(cls.CALCULATORS[spec.kind](frame, spec))
+        return frame
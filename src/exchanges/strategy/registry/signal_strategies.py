@@ -0,0 +1,471 @@
+import numpy as np
+import talib
+
+from dataclasses import dataclass
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import List
+
+from src.exchanges.strategy.registry.indicator_graph import (
+    IndicatorFrame,
+    IndicatorSpec,
+)
+from src.exchanges.strategy.registry.strategy_registry import (
+    SignalStrategy,
+    StrategyRegistry,
+    StrategySignal,
+)
+from src.exchanges.strategy.registry.strategy_state import (
+    Bar,
+    StatefulSignalStrategy,
+)
+from src.exchanges.strategy.strategies.datas.types import StrategyType, TradingSignal
+from src.exchanges.strategy.strategies.profitable_realtime_strategy import (
+    TALibIndicator,
+    TradingParameters,
+    TradingStrategy,
+)
+
+
+@dataclass
+class ProfitableState:
+    """Profitable 전략의 확정된 마지막 봉 기준 지표 누적값"""
+
+    timestamp: int  # 마지막으로 반영한 봉 (ns)
+    close: float  # 마지막 종가 (RSI 변화량 계산용)
+    avg_gain: float  # RSI 평균 상승폭 (Wilder)
+    avg_loss: float  # RSI 평균 하락폭 (Wilder)
+    ema_fast: float  # MACD 단기 EMA
+    ema_slow: float  # MACD 장기 EMA
+    macd: float  # MACD (크로스 판단용 직전 값)
+    macd_signal: float  # MACD 시그널 (크로스 판단용 직전 값)
+    highs: List[float]  # 최근 fastk 개 고가
+    lows: List[float]  # 최근 fastk 개 저가
+    fastk: List[float]  # 최근 slowk 개 Fast %K
+    slowk: List[float]  # 최근 slowd 개 Slow %K
+
+
+# Profitable 전략 (RSI + MACD + 스토캐스틱)
+@StrategyRegistry.register
+class ProfitableSignalStrategy(StatefulSignalStrategy):
+    strategy_type = StrategyType.PROFITABLE
+    state_cls = ProfitableState
+
+    def __init__(self, params: TradingParameters = None, min_conditions: int = 3):
+        self.params = params or TradingParameters()
+        self.trading_strategy = TradingStrategy(self.params, TALibIndicator())
+        self.min_conditions = min_conditions  # 신호 발생에 필요한 최소 조건 수
+
+    def required_indicators(self) -> List[IndicatorSpec]:
+        return [
+            IndicatorSpec.rsi(self.params.rsi_period),
+            IndicatorSpec.macd(
+                self.params.macd_fastperiod,
+                self.params.macd_slowperiod,
+                self.params.macd_signalperiod,
+            ),
+            IndicatorSpec.stoch(
+                self.params.stoch_fastk,
+                self.params.stoch_slowk,
+                self.params.stoch_slowd,
+            ),
+        ]
+
+    def evaluate(self, frame: IndicatorFrame) -> StrategySignal:
+        rsi_spec, macd_spec, stoch_spec = self.required_indicators()
+        rsi = frame.first(rsi_spec)
+        macd, macdsignal, _ = frame.get(macd_spec)
+        slowk, slowd = frame.get(stoch_spec)
+
+        # 직전 봉의 MACD / 시그널로 크로스 판단
+        has_prev = len(frame) >= 2
+        buy_signals, sell_signals = self.trading_strategy.evaluate(
+            rsi=rsi[-1],
+            macd=macd[-1],
+            macdsignal=macdsignal[-1],
+            slowk=slowk[-1],
+            slowd=slowd[-1],
+            macd_prev=macd[-2] if has_prev else None,
+            macdsignal_prev=macdsignal[-2] if has_prev else None,
+        )
+        return self._signal(buy_signals, sell_signals)
+
+    def signals(self, frame: IndicatorFrame) -> np.ndarray:
+        p = self.params
+        rsi_spec, macd_spec, stoch_spec = self.required_indicators()
+        rsi = frame.first(rsi_spec)
+        macd, macdsignal, _ = frame.get(macd_spec)
+        slowk, slowd = frame.get(stoch_spec)
+        golden, dead = _crosses(macd, macdsignal)
+
+        # 충족된 조건 수 (NaN 비교는 False, TradingStrategy.evaluate 와 같은 조건)
+        buy_count = (
+            (slowk < p.stoch_oversold).astype(np.int8)
+            + (slowd < p.stoch_oversold)
+            + golden
+            + (rsi > p.rsi_threshold)
+        )
+        sell_count = (
+            (slowk > p.stoch_overbought).astype(np.int8)
+            + (slowd > p.stoch_overbought)
+            + dead
+            + (rsi < p.rsi_threshold)
+        )
+        return _select(
+            buy_count >= self.min_conditions, sell_count >= self.min_conditions
+        )
+
+    def _signal(self, buy_signals: List[str], sell_signals: List[str]):
+        if len(buy_signals) >= self.min_conditions:
+            return StrategySignal(self.strategy_type, TradingSignal.BUY, buy_signals)
+        elif len(sell_signals) >= self.min_conditions:
+            return StrategySignal(self.strategy_type, TradingSignal.SELL, sell_signals)
+
+        return StrategySignal(self.strategy_type, TradingSignal.HOLD)
+
+    # 증분 계산 (StrategyStateStore)
+    def warm_up(self, frame: IndicatorFrame) -> ProfitableState | None:
+        p = self.params
+        close, high, low = frame.close, frame.high, frame.low
+        required = max(
+            p.rsi_period + 1,
+            p.macd_slowperiod + p.macd_signalperiod - 1,
+            p.stoch_fastk + p.stoch_slowk + p.stoch_slowd - 2,
+        )
+        if len(frame) < required:
+            return None
+
+        # RSI: 첫 rsi_period 개 변화량의 평균으로 시작해 Wilder 평활 (TA-Lib 과 동일)
+        change = np.diff(close)
+        gains, losses = np.maximum(change, 0), np.maximum(-change, 0)
+        avg_gain = gains[: p.rsi_period].mean()
+        avg_loss = losses[: p.rsi_period].mean()
+        for gain, loss in zip(gains[p.rsi_period :], losses[p.rsi_period :]):
+            avg_gain = (avg_gain * (p.rsi_period - 1) + gain) / p.rsi_period
+            avg_loss = (avg_loss * (p.rsi_period - 1) + loss) / p.rsi_period
+
+        # MACD: EMA 는 TA-Lib 결과의 마지막 값에서 이어서 갱신
+        ema_fast = talib.EMA(close, timeperiod=p.macd_fastperiod)
+        ema_slow = talib.EMA(close, timeperiod=p.macd_slowperiod)
+        macd = (ema_fast - ema_slow)[p.macd_slowperiod - 1 :]
+        macd_signal = talib.EMA(macd, timeperiod=p.macd_signalperiod)
+
+        # 스토캐스틱: 최근 고가/저가 창과 Fast/Slow %K 보관
+        highest = sliding_window_view(high, p.stoch_fastk).max(axis=1)
+        lowest = sliding_window_view(low, p.stoch_fastk).min(axis=1)
+        fastk = self._fastk(close[p.stoch_fastk - 1 :], highest, lowest)
+        slowk = sliding_window_view(fastk, p.stoch_slowk).mean(axis=1)
+
+        return ProfitableState(
+            timestamp=int(frame.index[-1].astype(np.int64)),
+            close=float(close[-1]),
+            avg_gain=float(avg_gain),
+            avg_loss=float(avg_loss),
+            ema_fast=float(ema_fast[-1]),
+            ema_slow=float(ema_slow[-1]),
+            macd=float(macd[-1]),
+            macd_signal=float(macd_signal[-1]),
+            highs=high[-p.stoch_fastk :].tolist(),
+            lows=low[-p.stoch_fastk :].tolist(),
+            fastk=fastk[-p.stoch_slowk :].tolist(),
+            slowk=slowk[-p.stoch_slowd :].tolist(),
+        )
+
+    def step(self, state: ProfitableState, bar: Bar) -> ProfitableState:
+        p = self.params
+        change = bar.close - state.close
+        fast_alpha = 2 / (p.macd_fastperiod + 1)
+        slow_alpha = 2 / (p.macd_slowperiod + 1)
+        signal_alpha = 2 / (p.macd_signalperiod + 1)
+
+        ema_fast = state.ema_fast + fast_alpha * (bar.close - state.ema_fast)
+        ema_slow = state.ema_slow + slow_alpha * (bar.close - state.ema_slow)
+        macd = ema_fast - ema_slow
+
+        highs = (state.highs + [bar.high])[-p.stoch_fastk :]
+        lows = (state.lows + [bar.low])[-p.stoch_fastk :]
+        fastk = (state.fastk + [self._fastk(bar.close, max(highs), min(lows))])[
+            -p.stoch_slowk :
+        ]
+
+        return ProfitableState(
+            timestamp=bar.timestamp,
+            close=bar.close,
+            avg_gain=(state.avg_gain * (p.rsi_period - 1) + max(change, 0))
+            / p.rsi_period,
+            avg_loss=(state.avg_loss * (p.rsi_period - 1) + max(-change, 0))
+            / p.rsi_period,
+            ema_fast=ema_fast,
+            ema_slow=ema_slow,
+            macd=macd,
+            macd_signal=state.macd_signal + signal_alpha * (macd - state.macd_signal),
+            highs=highs,
+            lows=lows,
+            fastk=fastk,
+            slowk=(state.slowk + [sum(fastk) / len(fastk)])[-p.stoch_slowd :],
+        )
+
+    def evaluate_bar(self, state: ProfitableState, bar: Bar) -> StrategySignal:
+        current = self.step(state, bar)
+        buy_signals, sell_signals = self.trading_strategy.evaluate(
+            **self.indicator_values(current),
+            macd_prev=state.macd,
+            macdsignal_prev=state.macd_signal,
+        )
+        return self._signal(buy_signals, sell_signals)
+
+    @staticmethod
+    def indicator_values(state: ProfitableState) -> dict:
+        """상태의 RSI / MACD / 스토캐스틱 값"""
+        total = state.avg_gain + state.avg_loss
+        return {
+            "rsi": 100 * state.avg_gain / total if total > 0 else 0.0,
+            "macd": state.macd,
+            "macdsignal": state.macd_signal,
+            "slowk": state.slowk[-1],
+            "slowd": sum(state.slowk) / len(state.slowk),
+        }
+
+    @staticmethod
+    def _fastk(close, highest, lowest):
+        # 고가 == 저가 인 구간은 0 (TA-Lib 과 동일)
+        spread = np.asarray(highest - lowest, dtype=np.float64)
+        safe = np.where(spread > 0, spread, 1.0)
+        fastk = np.where(spread > 0, (close - lowest) / safe * 100, 0.0)
+        return fastk if fastk.ndim else float(fastk)
+
+
+# RSI 과매수/과매도 전략
+@StrategyRegistry.register
+class RSISignalStrategy(SignalStrategy):
+    strategy_type = StrategyType.RSI
+
+    def __init__(
+        self, rsi_period: int = 14, rsi_overbought: int = 70, rsi_oversold: int = 30
+    ):
+        self.rsi_period = rsi_period
+        self.rsi_overbought = rsi_overbought
+        self.rsi_oversold = rsi_oversold
+
+    def required_indicators(self) -> List[IndicatorSpec]:
+        return [IndicatorSpec.rsi(self.rsi_period)]
+
+    def evaluate(self, frame: IndicatorFrame) -> StrategySignal:
+        rsi = frame.first(IndicatorSpec.rsi(self.rsi_period))[-1]
+
+        if rsi < self.rsi_oversold:
+            return StrategySignal(
+                self.strategy_type,
+                TradingSignal.BUY,
+                [f"RSI: {rsi:.2f} < {self.rsi_oversold}"],
+            )
+        elif rsi > self.rsi_overbought:
+            return StrategySignal(
+                self.strategy_type,
+                TradingSignal.SELL,
+                [f"RSI: {rsi:.2f} > {self.rsi_overbought}"],
+            )
+
+        return StrategySignal(self.strategy_type, TradingSignal.HOLD)
+
+    def signals(self, frame: IndicatorFrame) -> np.ndarray:
+        rsi = frame.first(IndicatorSpec.rsi(self.rsi_period))
+        return _select(rsi < self.rsi_oversold, rsi > self.rsi_overbought)
+
+
+# 이동평균선 골든/데드크로스 전략
+@StrategyRegistry.register
+class MACrossSignalStrategy(SignalStrategy):
+    strategy_type = StrategyType.MA_CROSS
+
+    def __init__(self, fast_period: int = 3, slow_period: int = 10):
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+
+    def required_indicators(self) -> List[IndicatorSpec]:
+        return [
+            IndicatorSpec.sma(self.fast_period),
+            IndicatorSpec.sma(self.slow_period),
+        ]
+
+    def evaluate(self, frame: IndicatorFrame) -> StrategySignal:
+        if len(frame) < 2:
+            return StrategySignal(self.strategy_type, TradingSignal.HOLD)
+
+        sma_fast = frame.first(IndicatorSpec.sma(self.fast_period))
+        sma_slow = frame.first(IndicatorSpec.sma(self.slow_period))
+
+        if sma_fast[-2] < sma_slow[-2] and sma_fast[-1] > sma_slow[-1]:
+            return StrategySignal(
+                self.strategy_type,
+                TradingSignal.BUY,
+                [f"SMA{self.fast_period}/SMA{self.slow_period} 골든크로스"],
+            )
+        elif sma_fast[-2] > sma_slow[-2] and sma_fast[-1] < sma_slow[-1]:
+            return StrategySignal(
+                self.strategy_type,
+                TradingSignal.SELL,
+                [f"SMA{self.fast_period}/SMA{self.slow_period} 데드크로스"],
+            )
+
+        return StrategySignal(self.strategy_type, TradingSignal.HOLD)
+
+    def signals(self, frame: IndicatorFrame) -> np.ndarray:
+        golden, dead = _crosses(
+            frame.first(IndicatorSpec.sma(self.fast_period)),
+            frame.first(IndicatorSpec.sma(self.slow_period)),
+        )
+        return _select(golden, dead)
+
+
+@dataclass
+class DCAState:
+    """DCA 전략의 확정된 마지막 봉 기준 매수 기록"""
+
+    timestamp: int  # 마지막으로 반영한 봉 (ns)
+    last_investment: int | None  # 마지막 매수일 (epoch 일)
+    entries: int  # 매수 횟수
+    total_price: float  # 매수가 합계 (평균 매수가 계산용)
+
+
+# 적립식 분할 매수(DCA) 전략
+@StrategyRegistry.register
+class DCASignalStrategy(StatefulSignalStrategy):
+    strategy_type = StrategyType.DCA
+    state_cls = DCAState
+
+    NS_PER_DAY = 86_400 * 10**9
+
+    def __init__(self, dca_period: int = 30, take_profit_percent: float = 50):
+        self.dca_period = dca_period  # DCA 주기 (일)
+        self.take_profit_percent = take_profit_percent  # 익절 기준 수익률 (%)
+
+    def required_indicators(self) -> List[IndicatorSpec]:
+        return []
+
+    def evaluate(self, frame: IndicatorFrame) -> StrategySignal:
+        if len(frame) == 0:
+            return StrategySignal(self.strategy_type, TradingSignal.HOLD)
+
+        # 마지막 매수일로부터 DCA 주기가 지난 날의 첫 봉에서 매수
+        # - 상태가 없으므로 윈도우 첫 봉을 첫 매수로 가정 (실시간 신호는 StrategyStateStore 경로 사용)
+        buy_mask = self._buy_mask(frame.index)
+
+        close = frame.close
+        entries = close[buy_mask]
+        return self._signal(
+            bool(buy_mask[-1]), len(entries), float(entries.sum()), close[-1]
+        )
+
+    def signals(self, frame: IndicatorFrame) -> np.ndarray:
+        buy_mask = self._buy_mask(frame.index)
+        close = frame.close
+
+        # 각 봉까지의 평균 매수가 대비 수익률 (매도 조건이 매수보다 우선)
+        entries = np.cumsum(buy_mask)
+        total = np.cumsum(np.where(buy_mask, close, 0.0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            avg_entry_price = total / entries
+            current_return = (close - avg_entry_price) / avg_entry_price * 100
+        sell = (entries > 0) & (current_return >= self.take_profit_percent)
+        return _select(buy_mask & ~sell, sell)
+
+    # 증분 계산 (StrategyStateStore)
+    def warm_up(self, frame: IndicatorFrame) -> DCAState | None:
+        if len(frame) == 0:
+            return None
+
+        # 윈도우 과거 봉에서 가상의 매수 이력을 만들지 않고 평가 시작 시점부터 적립
+        # - 다음 날의 첫 봉에서 첫 매수, 익절은 이후 실제로 낸 매수 신호의 평균가 기준
+        return DCAState(
+            timestamp=int(frame.index[-1].astype(np.int64)),
+            last_investment=None,
+            entries=0,
+            total_price=0.0,
+        )
+
+    def step(self, state: DCAState, bar: Bar) -> DCAState:
+        day = bar.timestamp // self.NS_PER_DAY
+        invest = day != state.timestamp // self.NS_PER_DAY and (
+            state.last_investment is None
+            or day - state.last_investment >= self.dca_period
+        )
+        if not invest:
+            return DCAState(
+                timestamp=bar.timestamp,
+                last_investment=state.last_investment,
+                entries=state.entries,
+                total_price=state.total_price,
+            )
+        return DCAState(
+            timestamp=bar.timestamp,
+            last_investment=day,
+            entries=state.entries + 1,
+            total_price=state.total_price + bar.close,
+        )
+
+    def evaluate_bar(self, state: DCAState, bar: Bar) -> StrategySignal:
+        current = self.step(state, bar)
+        return self._signal(
+            current.entries > state.entries,
+            current.entries,
+            current.total_price,
+            bar.close,
+        )
+
+    def _signal(
+        self, invest: bool, entries: int, total_price: float, close: float
+    ) -> StrategySignal:
+        # 평균 매수가 대비 수익률이 기준 이상이면 매도
+        if entries > 0:
+            avg_entry_price = total_price / entries
+            current_return = (close - avg_entry_price) / avg_entry_price * 100
+            if current_return >= self.take_profit_percent:
+                return StrategySignal(
+                    self.strategy_type,
+                    TradingSignal.SELL,
+                    [f"평균 매수가 대비 수익률: {current_return:.2f}%"],
+                )
+
+        if invest:
+            return StrategySignal(
+                self.strategy_type,
+                TradingSignal.BUY,
+                [f"DCA 주기 매수 ({self.dca_period}일)"],
+            )
+
+        return StrategySignal(self.strategy_type, TradingSignal.HOLD)
+
+    @staticmethod
+    def _days(index: np.ndarray) -> np.ndarray:
+        return index.astype("datetime64[D]").astype(np.int64)
+
+    def _buy_mask(self, index: np.ndarray) -> np.ndarray:
+        """
+        마지막 매수일로부터 DCA 주기(일) 이상 지난 날의 첫 봉 (DCAStrategy 와 같은 규칙)
+        - 첫 봉에서 처음 매수하고 이후 last_investment + dca_period 일부터 다시 매수
+        """
+        days = self._days(index)
+        buy_mask = np.zeros(len(days), dtype=bool)
+        first_of_day = np.ones(len(days), dtype=bool)
+        first_of_day[1:] = days[1:] != days[:-1]
+
+        last_investment = None
+        for i in np.flatnonzero(first_of_day):
+            if last_investment is None or days[i] - last_investment >= self.dca_period:
+                buy_mask[i] = True
+                last_investment = days[i]
+        return buy_mask
+
+
+def _crosses(fast: np.ndarray, slow: np.ndarray):
+    """직전 봉 대비 골든크로스 / 데드크로스 여부 배열 (첫 봉은 False)"""
+    golden = np.zeros(len(fast), dtype=bool)
+    dead = np.zeros(len(fast), dtype=bool)
+    golden[1:] = (fast[:-1] < slow[:-1]) & (fast[1:] > slow[1:])
+    dead[1:] = (fast[:-1] > slow[:-1]) & (fast[1:] < slow[1:])
+    return golden, dead
+
+
+def _select(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """매수 우선으로 봉별 신호 배열 구성 (1: BUY, -1: SELL, 0: HOLD)"""
+    return np.where(buy, 1, np.where(sell, -1, 0)).astype(np.int8)
@@ -0,0 +1,105 @@
+import pandas as pd
+
+from typing import Dict, Iterable
+
+# 등록된 신호 전략 로드 (StrategyRegistry.register 데코레이터 실행)
+import src.exchanges.strategy.registry.signal_strategies  # noqa: F401
+
+from src.exchanges.history.candle_array import CandleArray
+from src.exchanges.strategy.registry.ensemble_strategy import (
+    EnsembleSignal,
+    EnsembleStrategy,
+)
+from src.exchanges.strategy.registry.indicator_graph import (
+    IndicatorFrame,
+    IndicatorGraph,
+)
+from src.exchanges.strategy.registry.strategy_registry import (
+    StrategyRegistry,
+    StrategySignal,
+)
+from src.exchanges.strategy.strategies.datas.types import StrategyType
+from src.utils.timing import StageTimer
+
+
+class StrategyEngine:
+    """
+    여러 전략을 하나의 캔들 집합에 대해 평가하는 엔진
+    - 전략들이 선언한 지표의 합집합을 한 번만 계산
+    - 계산된 IndicatorFrame 을 모든 전략이 공유
+    """
+
+    @StageTimer.timed("strategy")
+    def evaluate(
+        self,
+        df: pd.DataFrame | CandleArray,
+        strategy_types: Iterable[StrategyType] | None = None,
+    ) -> Dict[StrategyType, StrategySignal]:
+        """
+        캔들 데이터로 전략들을 평가합니다.
+
+        Args:
+            df (pd.DataFrame | CandleArray): OHLCV 데이터
+            strategy_types (Iterable[StrategyType]): 평가할 전략 (None 이면 등록된 전체)
+
+        Returns:
+            Dict[StrategyType, StrategySignal]: 전략별 매매 신호
+        """
+        if strategy_types is None:
+            strategies = StrategyRegistry.all()
+        else:
+            strategies = [
+                StrategyRegistry.get(strategy_type) for strategy_type in strategy_types
+            ]
+
+        frame = IndicatorGraph.compute(
+            (
+                IndicatorFrame.from_candles(df)
+                if isinstance(df, CandleArray)
+                else IndicatorFrame.from_dataframe(df)
+            ),
+            StrategyRegistry.required_indicators(strategies),
+        )
+
+        return {
+            strategy.strategy_type: strategy.evaluate(frame) for strategy in strategies
+        }
+
+    def evaluate_one(
+        self, df: pd.DataFrame | CandleArray, strategy_type: StrategyType
+    ) -> StrategySignal:
+        return self.evaluate(df, [strategy_type])[strategy_type]
+
+    def evaluate_ensemble(
+        self,
+        df: pd.DataFrame | CandleArray,
+        ensemble: EnsembleStrategy | None = None,
+        signals: Dict[StrategyType, StrategySignal] | None = None,
+    ) -> EnsembleSignal:
+        """
+        앙상블에 포함된 전략들을 한 번의 지표 계산으로 평가하고 가중 투표합니다.
+
+        Args:
+            df (pd.DataFrame | CandleArray): OHLCV 데이터
+            ensemble (EnsembleStrategy): 앙상블 설정 (None 이면 기본 가중치)
+            signals (Dict[StrategyType, StrategySignal]): 이미 평가한 전략별 신호
+                (예: StrategyStateStore 로 평가한 상태 기반 신호, 해당 전략은 다시 평가하지 않음)
+
+        Returns:
+            EnsembleSignal: 전략별 신호와 가중 투표 결과
+        """
+        ensemble = ensemble or EnsembleStrategy()
+        signals = dict(signals or {})
+        remaining = [
+            strategy_type
+            for strategy_type in ensemble.strategy_types
+            if strategy_type not in signals
+        ]
+        if remaining:
+            signals.update(self.evaluate(df, remaining))
+        return ensemble.vote(
+            {
+                strategy_type: signals[strategy_type]
+                for strategy_type in ensemble.strategy_types
+            }
+        )
@@ -0,0 +1,79 @@
+import numpy as np
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Type
+
+from src.exchanges.strategy.registry.indicator_graph import (
+    IndicatorFrame,
+    IndicatorGraph,
+    IndicatorSpec,
+)
+from src.exchanges.strategy.strategies.datas.types import StrategyType, TradingSignal
+
+
+@dataclass
+class StrategySignal:
+    strategy_type: StrategyType  # 신호를 생성한 전략
+    signal: TradingSignal  # 매매 신호 (BUY/SELL/HOLD)
+    reasons: List[str] = field(default_factory=list)  # 충족된 조건 목록
+
+
+class SignalStrategy:
+    """
+    실시간 신호 전략의 기본 클래스
+    각 전략은 필요한 지표를 선언하고, 공유된 IndicatorFrame 으로 신호를 계산합니다.
+    """
+
+    strategy_type: StrategyType
+
+    def required_indicators(self) -> List[IndicatorSpec]:
+        raise NotImplementedError
+
+    def evaluate(self, frame: IndicatorFrame) -> StrategySignal:
+        raise NotImplementedError
+
+    def signals(self, frame: IndicatorFrame) -> np.ndarray:
+        """
+        모든 봉의 신호를 한 번에 계산합니다. (백테스트용, 각 봉에서 evaluate 한 결과와 동일)
+
+        Returns:
+            np.ndarray: 봉별 신호 (int8, 1: BUY, -1: SELL, 0: HOLD)
+        """
+        raise NotImplementedError
+
+
+class StrategyRegistry:
+    """전략 유형별 신호 전략을 등록하고 조회하는 레지스트리"""
+
+    _strategies: Dict[StrategyType, SignalStrategy] = {}
+
+    @classmethod
+    def register(cls, strategy_cls: Type[SignalStrategy]) -> Type[SignalStrategy]:
+        """클래스 데코레이터: 기본 파라미터로 생성한 전략 인스턴스를 등록합니다."""
+        cls._strategies[strategy_cls.strategy_type] = strategy_cls()
+        return strategy_cls
+
+    @classmethod
+    def get(cls, strategy_type: StrategyType) -> SignalStrategy:
+        strategy = cls._strategies.get(strategy_type)
+        if strategy is None:
+            raise ValueError(f"Strategy not registered: {strategy_type}")
+        return strategy
+
+    @classmethod
+    def has(cls, strategy_type: StrategyType) -> bool:
+        return strategy_type in cls._strategies
+
+    @classmethod
+    def all(cls) -> List[SignalStrategy]:
+        return list(cls._strategies.values())
+
+    @classmethod
+    def required_indicators(
+        cls, strategies: Iterable[SignalStrategy]
+    ) -> List[IndicatorSpec]:
+        """전략들이 필요로 하는 지표의 합집합 (계산 순서로 정렬)"""
+        specs: List[IndicatorSpec] = []
+        for strategy in strategies:
+            specs.extend(strategy.required_indicators())
+        return IndicatorGraph.resolve(specs)
@@ -0,0 +1,177 @@
+import json
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Tuple
+
+from src.exchanges.strategy.registry.indicator_graph import IndicatorFrame
+from src.exchanges.strategy.registry.strategy_registry import (
+    SignalStrategy,
+    StrategyRegistry,
+    StrategySignal,
+)
+from src.exchanges.strategy.strategies.datas.types import StrategyType
+from src.utils.logging import Logging
+from src.utils.timing import StageTimer
+
+
+@dataclass(frozen=True)
+class Bar:
+    timestamp: int  # 봉 시작 시각 (ns)
+    high: float
+    low: float
+    close: float
+
+
+class StatefulSignalStrategy(SignalStrategy):
+    """
+    지표 누적값과 크로스 기억을 상태로 보관하여 새 봉마다 O(1) 로 갱신하는 전략
+    - warm_up(): 확정된 봉 배열로 초기 상태 생성 (최초 1회 또는 데이터 공백 시)
+    - step(): 확정된 봉 하나를 반영한 새 상태 (기존 상태는 변경하지 않음)
+    - evaluate_bar(): 진행 중인 마지막 봉으로 신호 계산 (상태에 반영하지 않음)
+    - 상태는 JSON 으로 저장/복원할 수 있는 dataclass
+    """
+
+    state_cls: type
+
+    def warm_up(self, frame: IndicatorFrame) -> Any | None:
+        """확정된 봉으로 초기 상태를 만듭니다. (봉 개수가 부족하면 None)"""
+        raise NotImplementedError
+
+    def step(self, state: Any, bar: Bar) -> Any:
+        raise NotImplementedError
+
+    def evaluate_bar(self, state: Any, bar: Bar) -> StrategySignal:
+        raise NotImplementedError
+
+
+class StrategyStateStore:
+    """
+    (티커, 인터벌, 전략) 별 실시간 전략 상태 저장소
+    - 마지막 봉은 진행 중인 봉으로 보고 확정된 봉까지만 상태에 반영
+    - 이전 호출 이후 새로 확정된 봉만 step() 으로 반영 (보통 0~1 개)
+    - 저장된 마지막 봉이 캔들에 없으면 (데이터 공백) 다시 warm_up
+    - save()/load() 로 JSON 스냅샷 저장/복원 (재시작 후에도 크로스 기억 유지)
+    """
+
+    def __init__(self):
+        self._states: Dict[Tuple[str, str, str], Any] = {}
+        self._lock = threading.Lock()
+        self.dirty = False  # 마지막 스냅샷 이후 변경 여부
+
+    @StageTimer.timed("strategy")
+    def evaluate(
+        self,
+        ticker: str,
+        interval: str,
+        strategy_type: StrategyType,
+        df: pd.DataFrame,
+    ) -> StrategySignal | None:
+        """
+        상태를 갱신하고 마지막 봉의 신호를 계산합니다.
+
+        Args:
+            ticker (str): 티커 (예: "KRW-BTC")
+            interval (str): 캔들 인터벌
+            strategy_type (StrategyType): 전략 유형
+            df (pd.DataFrame): OHLCV 데이터 (마지막 행은 진행 중인 봉)
+
+        Returns:
+            StrategySignal: 매매 신호 (상태를 지원하지 않는 전략이거나 봉이 부족하면 None)
+        """
+        if not StrategyRegistry.has(strategy_type):
+            return None
+        strategy = StrategyRegistry.get(strategy_type)
+        if not isinstance(strategy, StatefulSignalStrategy) or len(df) < 2:
+            return None
+
+        timestamps = df.index.as_unit("ns").asi8
+        key = (ticker, interval, strategy_type.value)
+
+        with self._lock:
+            state = self._states.get(key)
+            # 확정된 봉: 마지막 봉을 제외한 구간
+            position = (
+                np.searchsorted(timestamps[:-1], state.timestamp)
+                if state is not None
+                else len(timestamps)
+            )
+            if position >= len(timestamps) - 1 or (
+                timestamps[position] != state.timestamp
+            ):
+                state = strategy.warm_up(IndicatorFrame.from_dataframe(df.iloc[:-1]))
+                if state is None:
+                    return None
+            else:
+                for i in range(position + 1, len(timestamps) - 1):
+                    state = strategy.step(state, self._bar(df, timestamps, i))
+
+            if self._states.get(key) is not state:
+                self._states[key] = state
+                self.dirty = True
+
+        return strategy.evaluate_bar(state, self._bar(df, timestamps, -1))
+
+    @staticmethod
+    def _bar(df: pd.DataFrame, timestamps: np.ndarray, i: int) -> Bar:
+        return Bar(
+            timestamp=int(timestamps[i]),
+            high=float(df["high"].iat[i]),
+            low=float(df["low"].iat[i]),
+            close=float(df["close"].iat[i]),
+        )
+
+    def reset(self):
+        with self._lock:
+            self._states.clear()
+            self.dirty = True
+
+    def save(self, path: str):
+        """상태 스냅샷을 JSON 으로 저장합니다. (임시 파일 + rename)"""
+        with self._lock:
+            snapshot = {
+                "|".join(key): asdict(state) for key, state in self._states.items()
+            }
+            self.dirty = False
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> int:
+        """
+        저장된 상태 스냅샷을 복원합니다.
+
+        Returns:
+            int: 복원한 상태 수 (파일이 없거나 읽을 수 없으면 0)
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return 0
+        except (OSError, ValueError) as e:
+            Logging.warning("Strategy state snapshot is unreadable", error=repr(e))
+            return 0
+
+        states = {}
+        for name, values in snapshot.items():
+            try:
+                ticker, interval, strategy_value = name.split("|")
+                strategy = StrategyRegistry.get(StrategyType(strategy_value))
+                if isinstance(strategy, StatefulSignalStrategy):
+                    states[(ticker, interval, strategy_value)] = strategy.state_cls(
+                        **values
+                    )
+            except (TypeError, ValueError):
+                # 등록되지 않은 전략이거나 상태 형식이 바뀐 경우 다음 호출에서 warm_up
+                continue
+
+        with self._lock:
+            self._states.update(states)
+        return len(states)
@@ -0,0 +1,109 @@
+import array
+
+import backtrader as bt
+import numpy as np
+import pandas as pd
+
+from typing import Dict, Mapping
+
+from src.exchanges.history.candle_array import CandleArray
+
+# backtrader 날짜 숫자(date2num, 0001-01-01 기준 일수) 의 1970-01-01 값
+EPOCH_DATENUM = 719163.0
+NS_PER_DAY = 86_400_000_000_000
+
+
+class NumpyData(bt.feed.DataBase):
+    """
+    NumPy 배열에 바로 연결되는 데이터 피드 (CustomPandasData 대체)
+    - dataname: 컬럼 이름 -> 배열 딕셔너리 ("datetime" 은 datetime64 배열)
+    - preload 시 행 단위 Python 반복 없이 라인 버퍼를 배열 단위로 채움
+    - window(): 현재 봉까지의 최근 구간을 원본 배열의 뷰로 반환 (리스트 변환 없음)
+    - preload 를 끄면 (exactbars 등) 기존처럼 한 봉씩 로드
+    """
+
+    lines = (
+        "rsi",
+        "macd",
+        "macd_signal",
+        "macd_cross",
+        "sma_20",
+        "ema_12",
+        "stoch_k",
+        "stoch_d",
+        "value",
+    )
+
+    _arrays: Dict[str, np.ndarray]  # 라인 이름 -> float64 연속 배열
+    _cursor: int  # 한 봉씩 로드할 때의 다음 행 위치
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, **kwargs) -> "NumpyData":
+        """보조지표가 포함된 OHLCV 데이터프레임에서 생성 (없는 라인은 NaN)"""
+        arrays = {
+            column: df[column].to_numpy(dtype=np.float64)
+            for column in df.columns
+            if column in cls.lines.getlinealiases()
+        }
+        arrays["datetime"] = pd.DatetimeIndex(df.index).to_numpy(dtype="datetime64[ns]")
+        return cls(dataname=arrays, **kwargs)
+
+    @classmethod
+    def from_candles(cls, candles: CandleArray, **kwargs) -> "NumpyData":
+        """CandleArray 에서 생성 (OHLCV/value 라인만 사용)"""
+        arrays = {column: getattr(candles, column) for column in CandleArray.COLUMNS}
+        arrays["datetime"] = candles.index
+        return cls(dataname=arrays, **kwargs)
+
+    def _start(self):
+        # fromdate/todate 는 _start 안에서 날짜 숫자로 변환되므로 그 이후에 배열 구성
+        super()._start()
+        self._arrays = self._prepare(self.p.dataname)
+        self._cursor = 0
+
+    def _prepare(self, source: Mapping[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """라인별 float64 연속 배열 구성 (fromdate/todate 범위만)"""
+        timestamps = np.asarray(source["datetime"], dtype="datetime64[ns]").view(
+            np.int64
+        )
+        datenums = EPOCH_DATENUM + timestamps / NS_PER_DAY
+        mask = (datenums >= self.fromdate) & (datenums <= self.todate)
+        size = int(mask.sum())
+
+        arrays = {"datetime": np.ascontiguousarray(datenums[mask])}
+        for name in self.lines.getlinealiases():
+            if name == "datetime":
+                continue
+            values = source.get(name)
+            arrays[name] = (
+                np.ascontiguousarray(np.asarray(values)[mask], dtype=np.float64)
+                if values is not None
+                else np.full(size, np.nan)
+            )
+        return arrays
+
+    def preload(self):
+        # 라인 버퍼(array.array)를 배열 메모리에서 한 번에 복사
+        for name, values in self._arrays.items():
+            line = getattr(self.lines, name)
+            line.array = array.array("d")
+            line.array.frombytes(values.tobytes())
+        self._cursor = len(self._arrays["datetime"])
+        self.home()
+
+    def _load(self) -> bool:
+        i = self._cursor
+        if i >= len(self._arrays["datetime"]):
+            return False
+        for name, values in self._arrays.items():
+            getattr(self.lines, name)[0] = values[i]
+        self._cursor = i + 1
+        return True
+
+    def window(self, name: str, size: int) -> np.ndarray:
+        """
+        현재 봉까지의 최근 size 개 값 (복사 없는 뷰, 오래된 값부터)
+        preload 되지 않은 경우(한 봉씩 로드)에도 같은 배열을 사용합니다.
+        """
+        end = len(self)
+        return self._arrays[name][max(end - size, 0) : end]
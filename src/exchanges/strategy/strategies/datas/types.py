@@ -3,6 +3,10 @@ from enum import Enum
 
 class StrategyType(str, Enum):
     PROFITABLE = "Profitable"
+    RSI = "RSI"
+    MA_CROSS = "MACross"
+    DCA = "DCA"
+    ENSEMBLE = "Ensemble"
 
 
 class TradingSignal(str, Enum):
@@ -1,6 +1,8 @@
 import backtrader as bt
 from datetime import datetime, timedelta
 
+from src.utils.logging import Logging
+
 
 class DCAStrategy(bt.Strategy):
     params = (
@@ -115,5 +117,4 @@ class DCAStrategy(bt.Strategy):
         self.log("========================")
 
     def log(self, txt, dt=None):
-        dt = dt or self.data.datetime.date(0)
-        print(f"[{dt.isoformat()}] {txt}")
+        Logging.backtest(txt, dt=dt or self.data.datetime.date(0))
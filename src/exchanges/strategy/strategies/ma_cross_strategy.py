@@ -1,5 +1,7 @@
 import backtrader as bt
 
+from src.utils.logging import Logging
+
 
 class MACrossStrategy(bt.Strategy):
     params = (
@@ -37,7 +39,7 @@ class MACrossStrategy(bt.Strategy):
                 # 최소 0.0001 BTC 단위로 매수 가능하도록 설정
                 size = round(available_cash * 0.95 / stock_price, 4)
                 if size > 0.0001:  # 최소 거래 수량 설정
-                    print(f"매수 신호! 가격: {stock_price:,.0f}, 수량: {size:.4f}")
+                    self.log(f"매수 신호! 가격: {stock_price:,.0f}, 수량: {size:.4f}")
                     self.order = self.buy(size=size)
 
         # 포지션이 있을 때
@@ -47,7 +49,7 @@ class MACrossStrategy(bt.Strategy):
                 self.sma_fast[-1] > self.sma_slow[-1]
                 and self.sma_fast[0] < self.sma_slow[0]
             ):
-                print(f"매도 신호! 현재 보유수량: {self.position.size:.4f}")
+                self.log(f"매도 신호! 현재 보유수량: {self.position.size:.4f}")
                 self.order = self.sell(size=self.position.size)
 
     def notify_order(self, order):
@@ -56,13 +58,16 @@ class MACrossStrategy(bt.Strategy):
 
         if order.status in [order.Completed]:
             if order.isbuy():
-                print(
+                self.log(
                     f"매수 체결: 가격: {order.executed.price:,.0f}, 수량: {order.executed.size:.4f}, 비용: {order.executed.value:,.0f}"
                 )
             else:
-                print(
+                self.log(
                     f"매도 체결: 가격: {order.executed.price:,.0f}, 수량: {order.executed.size:.4f}, 수익: {order.executed.pnl:,.0f}"
                 )
             self.trades += 1
 
         self.order = None
+
+    def log(self, txt, dt=None):
+        Logging.backtest(txt, dt=dt or self.data.datetime.date(0))
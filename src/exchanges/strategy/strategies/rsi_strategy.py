@@ -1,6 +1,8 @@
 import backtrader as bt
 import math
 
+from src.utils.logging import Logging
+
 
 class RSIStrategy(bt.Strategy):
     params = (
@@ -32,7 +34,7 @@ class RSIStrategy(bt.Strategy):
                 )
                 if size >= self.params.min_trade_amount:
                     self.order = self.buy(size=size)
-                    print(f"매수 신호 (RSI: {self.rsi[0]:.2f})")
+                    self.log(f"매수 신호 (RSI: {self.rsi[0]:.2f})")
 
         else:
             if self.rsi[0] > self.params.rsi_overbought:
@@ -42,7 +44,7 @@ class RSIStrategy(bt.Strategy):
                 )
                 if size >= self.params.min_trade_amount:
                     self.order = self.sell(size=size)
-                    print(f"매도 신호 (RSI: {self.rsi[0]:.2f})")
+                    self.log(f"매도 신호 (RSI: {self.rsi[0]:.2f})")
 
     def notify_order(self, order):
         if order.status in [order.Submitted, order.Accepted]:
@@ -50,13 +52,16 @@ class RSIStrategy(bt.Strategy):
 
         if order.status in [order.Completed]:
             if order.isbuy():
-                print(
+                self.log(
                     f"매수 체결: {order.executed.price:,.0f}원, 수량: {order.executed.size:.4f} BTC"
                 )
             elif order.issell():
-                print(
+                self.log(
                     f"매도 체결: {order.executed.price:,.0f}원, 수량: {order.executed.size:.4f} BTC"
                 )
             self.trades += 1
 
         self.order = None
+
+    def log(self, txt, dt=None):
+        Logging.backtest(txt, dt=dt or self.data.datetime.date(0))
@@ -1,24 +1,101 @@
 import pandas as pd
 import backtrader as bt
 
+from typing import Dict, Mapping
+
+from config import BACKTEST_STORE_ENABLED
 from src.exchanges.strategy.analyzer.analyzer_result import (
     AnalyzerMixin,
     AnalyzerResult,
 )
-from src.exchanges.strategy.strategies.datas.custom_pandas_data import (
-    CustomPandasData,
+from src.exchanges.history.candle_array import CandleArray
+from src.exchanges.strategy.analyzer.monte_carlo import TradePnlAnalyzer
+from src.exchanges.strategy.backtest_store import BacktestStore
+from src.exchanges.strategy.portfolio_backtest import (
+    PortfolioBacktest,
+    PortfolioResult,
 )
+from src.exchanges.strategy.registry.indicator_graph import IndicatorGraph
+from src.exchanges.strategy.strategies.datas.numpy_data import NumpyData
 from src.exchanges.strategy.strategies.datas.custom_percent_sizer import (
     CustomPercentSizer,
 )
+from src.exchanges.strategy.strategies.datas.types import StrategyType
 from src.exchanges.strategy.strategies.dca_strategy import DCAStrategy
-from src.exchanges.strategy.strategies.profitable_strategy import ProfitableStrategy
+from src.exchanges.strategy.strategies.profitable_strategy import (
+    ProfitableStrategy,
+    TradingStrategy,
+)
+from src.utils.indicator import Indicator
+from src.utils.logging import Logging
+from src.utils.profiler import Profiler
+
+# 백테스트 초기 자본 / 거래 수수료율
+INITIAL_CASH = 100000000
+COMMISSION = 0.0005
 
 
 class BacktestingStrategy:
 
     @staticmethod
-    def run(df: pd.DataFrame):
+    def run(
+        df: pd.DataFrame | CandleArray,
+        plot: bool = True,
+        profile: bool = False,
+        ticker: str = "backtest",
+        interval: str | None = None,
+        use_store: bool = BACKTEST_STORE_ENABLED,
+    ) -> Dict[str, float] | None:
+        """
+        백테스트 실행
+
+        Args:
+            df (pd.DataFrame | CandleArray): 보조지표가 포함된 OHLCV 데이터
+                (CandleArray 면 기본 보조지표를 계산하여 사용)
+            plot (bool): 결과 그래프 출력 여부
+            profile (bool): 실행 구간 샘플링 프로파일 저장 여부 (PROFILE_DIR/{작업 ID}.folded)
+            ticker (str): 결과 저장소에 기록할 티커
+            interval (str): 결과 저장소에 기록할 캔들 인터벌
+            use_store (bool): 결과 저장소 사용 (같은 코드/데이터/설정이면 저장된 지표 반환,
+                그래프 출력 시에는 항상 실행)
+
+        Returns:
+            Dict[str, float]: 결과 지표 (실패 시 None)
+        """
+        if profile:
+            with Profiler.capture(name="backtest") as profile_id:
+                metrics = BacktestingStrategy.run(df, plot=plot, use_store=False)
+            Logging.info(f"Backtest profile saved: {Profiler.path(profile_id)}")
+            return metrics
+
+        if isinstance(df, CandleArray):
+            df = Indicator.add_sub_indicators(df.to_dataframe())
+        if plot or not use_store:
+            return BacktestingStrategy._run_cerebro(df, plot)
+
+        def runner():
+            metrics = BacktestingStrategy._run_cerebro(df, plot=False)
+            return metrics, metrics or {}
+
+        metrics = BacktestStore().get_or_run(
+            strategy=ProfitableStrategy.__name__,
+            code_version=BacktestStore.code_version(
+                BacktestingStrategy,
+                ProfitableStrategy,
+                TradingStrategy,
+                NumpyData,
+                CustomPercentSizer,
+                Indicator,
+            ),
+            params={"initial_cash": INITIAL_CASH, "commission": COMMISSION},
+            candles={ticker: df},
+            runner=runner,
+            interval=interval,
+        )
+        return metrics
+
+    @staticmethod
+    def _run_cerebro(df: pd.DataFrame, plot: bool) -> Dict[str, float] | None:
         try:
             # 데이터 준비 및 전략 실행
             df.index = pd.to_datetime(df.index)
@@ -28,7 +105,7 @@ class BacktestingStrategy:
             cerebro = bt.Cerebro()
 
             # 데이터 피드 추가
-            data = CustomPandasData(dataname=df)
+            data = NumpyData.from_dataframe(df)
             cerebro.adddata(data)
 
             # 분석기 추가 - 수정된 부분
@@ -38,10 +115,11 @@ class BacktestingStrategy:
                 bt.analyzers.SharpeRatio, _name="sharpe", riskfreerate=0.03
             )
             cerebro.addanalyzer(bt.analyzers.DrawDown, _name="drawdown")
+            cerebro.addanalyzer(TradePnlAnalyzer, _name="trade_pnl")
 
             # 초기 설정
-            initial_cash = 100000000
-            initial_commission = 0.0005
+            initial_cash = INITIAL_CASH
+            initial_commission = COMMISSION
             cerebro.broker.setcash(initial_cash)
             cerebro.broker.setcommission(commission=initial_commission)
 
@@ -66,10 +144,61 @@ class BacktestingStrategy:
             analyzerResult.df = df
             analyzerResult.analyzer = analyzer
             analyzerResult.initial_cash = initial_cash
-            analyzerResult.run()
+            metrics = analyzerResult.run()
 
             # 결과 그래프 출력
-            cerebro.plot(style="candle", volume=True)
+            if plot:
+                cerebro.plot(style="candle", volume=True)
+
+            return metrics
+
+        except Exception as e:
+            Logging.error(msg="Exception occurred in backtest:", error=e)
+            return None
+
+    @staticmethod
+    def run_portfolio(
+        candles: Mapping[str, pd.DataFrame | CandleArray],
+        strategy_type: StrategyType = StrategyType.PROFITABLE,
+        interval: str | None = None,
+        use_store: bool = BACKTEST_STORE_ENABLED,
+    ) -> PortfolioResult | None:
+        """
+        여러 티커를 공통 현금 잔고로 운용하는 포트폴리오 백테스트 실행
+        (초기 자본 / 수수료 / 30%·50% 분할 매매는 run() 과 동일)
+
+        Args:
+            candles (Mapping[str, pd.DataFrame | CandleArray]): 티커별 OHLCV 데이터
+            strategy_type (StrategyType): 신호 전략
+            interval (str): 결과 저장소에 기록할 캔들 인터벌
+            use_store (bool): 결과 저장소 사용 (같은 코드/데이터/설정이면 저장된 결과 반환)
+
+        Returns:
+            PortfolioResult: 포트폴리오 가치 곡선, 체결 내역, 포트폴리오/티커별 지표
+        """
+        try:
+            backtest = PortfolioBacktest(strategy_type, initial_cash=INITIAL_CASH)
+            if use_store:
+
+                def runner():
+                    result = backtest.run(candles)
+                    return result, result.metrics
 
+                strategy = backtest.strategy
+                result = BacktestStore().get_or_run(
+                    strategy=f"portfolio:{strategy_type.value}",
+                    code_version=BacktestStore.code_version(
+                        PortfolioBacktest, type(strategy), IndicatorGraph
+                    ),
+                    params=backtest.params(),
+                    candles=candles,
+                    runner=runner,
+                    interval=interval,
+                )
+            else:
+                result = backtest.run(candles)
+            result.log()
+            return result
         except Exception as e:
-            print("Exception occurred:", e)
+            Logging.error(msg="Exception occurred in portfolio backtest:", error=e)
+            return None
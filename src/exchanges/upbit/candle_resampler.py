@@ -0,0 +1,285 @@
+import threading
+
+import pandas as pd
+
+from typing import Dict, Optional, Tuple
+
+
+class CandleResampler:
+    """
+    티커별로 하나의 기본 봉(base interval) 스트림만 유지하고
+    기본 봉의 배수인 상위 타임프레임(예: 기본 봉 minute60 -> 240분/일봉) 캔들을 파생하는 클래스
+    - 기본 봉보다 짧은 인터벌(60분봉 기준 5분/15분)은 파생할 수 없으므로 직접 조회
+    - 기본 봉이 추가될 때 상위 타임프레임은 변경된 구간만 증분 갱신
+    - 파생된 캔들은 (티커, 인터벌) 단위로 캐시
+    """
+
+    # 인터벌별 분 단위 길이
+    INTERVAL_MINUTES: Dict[str, int] = {
+        "minute1": 1,
+        "minute3": 3,
+        "minute5": 5,
+        "minute10": 10,
+        "minute15": 15,
+        "minute30": 30,
+        "minute60": 60,
+        "minute240": 240,
+        "day": 1440,
+    }
+
+    # pyupbit 에서 허용하는 별칭 및 기존 코드에서 사용하던 이름
+    INTERVAL_ALIASES: Dict[str, str] = {
+        "minutes1": "minute1",
+        "minutes3": "minute3",
+        "minutes5": "minute5",
+        "minutes10": "minute10",
+        "minutes15": "minute15",
+        "minutes30": "minute30",
+        "minutes60": "minute60",
+        "minutes240": "minute240",
+        "hour": "minute60",
+        "days": "day",
+    }
+
+    # 실거래 조회에서 항상 기본 봉으로 파생할 최대 인터벌 (분)
+    MAX_DERIVED_MINUTES = 240
+
+    # 그보다 큰 인터벌(일봉)을 파생하기 위해 새로 채울 수 있는 최대 기본 봉 개수
+    # (200개씩 5회 조회, 60분봉 기준 일봉 41개 - 분석용 일봉 30개는 파생, 일봉 200개는 직접 조회)
+    MAX_BACKFILL_BASE_BARS = 1000
+
+    # 업비트 캔들은 UTC 00:00 (KST 09:00) 기준으로 정렬됨 (인덱스는 KST)
+    KST_OFFSET_MINUTES = 9 * 60
+
+    # OHLCV 집계 규칙
+    AGGREGATION = {
+        "open": "first",
+        "high": "max",
+        "low": "min",
+        "close": "last",
+        "volume": "sum",
+        "value": "sum",
+    }
+
+    base_interval: str  # 기본 봉 인터벌 (예: "minute60")
+    max_base_bars: int  # 티커별 보관할 최대 기본 봉 개수
+
+    def __init__(self, base_interval: str = "minute60", max_base_bars: int = 6000):
+        self.base_interval = self.normalize_interval(base_interval)
+        if self.base_interval not in self.INTERVAL_MINUTES:
+            raise ValueError(f"Unsupported base interval: {base_interval}")
+        self.max_base_bars = max_base_bars
+        self._base: Dict[str, pd.DataFrame] = {}
+        self._derived: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    @classmethod
+    def normalize_interval(cls, interval: str) -> str:
+        return cls.INTERVAL_ALIASES.get(interval, interval)
+
+    @classmethod
+    def interval_minutes(cls, interval: str) -> int:
+        return cls.INTERVAL_MINUTES[cls.normalize_interval(interval)]
+
+    def can_derive(self, interval: str) -> bool:
+        """기본 봉으로부터 해당 인터벌을 파생할 수 있는지 여부"""
+        interval = self.normalize_interval(interval)
+        if interval not in self.INTERVAL_MINUTES:
+            return False
+        base_minutes = self.INTERVAL_MINUTES[self.base_interval]
+        minutes = self.INTERVAL_MINUTES[interval]
+        return minutes >= base_minutes and minutes % base_minutes == 0
+
+    def should_derive(self, ticker: str, interval: str, count: int) -> bool:
+        """
+        거래소 조회 시 기본 봉에서 파생하는 편이 나은지 여부
+        - 분봉(MAX_DERIVED_MINUTES 이하)은 항상 파생
+        - 일봉은 필요한 기본 봉을 이미 보관 중이거나 MAX_BACKFILL_BASE_BARS 이내로 채울 수 있을 때만 파생
+          (이후 호출은 시간봉/일봉 모두 기본 봉 증분 조회 1회로 처리,
+           일봉 200개 = 60분봉 4800개 = 24회 조회이므로 그런 요청은 직접 조회)
+        - 필요한 기본 봉이 보관 한도(max_base_bars)를 넘으면 직접 조회
+        """
+        if not self.can_derive(interval):
+            return False
+        required = self.base_bars_for(interval, count)
+        if required > self.max_base_bars:
+            return False
+        if self.interval_minutes(interval) <= self.MAX_DERIVED_MINUTES:
+            return True
+        return required <= max(self.base_count(ticker), self.MAX_BACKFILL_BASE_BARS)
+
+    def base_bars_for(self, interval: str, count: int) -> int:
+        """인터벌 캔들 count 개를 만들기 위해 필요한 기본 봉 개수"""
+        ratio = (
+            self.interval_minutes(interval) // self.INTERVAL_MINUTES[self.base_interval]
+        )
+        return count * ratio
+
+    def last_timestamp(self, ticker: str) -> Optional[pd.Timestamp]:
+        with self._lock:
+            base = self._base.get(ticker)
+            if base is None or base.empty:
+                return None
+            return base.index[-1]
+
+    def base_count(self, ticker: str) -> int:
+        with self._lock:
+            base = self._base.get(ticker)
+            return 0 if base is None else len(base)
+
+    def version(self, ticker: str) -> int:
+        """기본 봉 데이터가 변경될 때마다 증가하는 버전 (캐시 무효화 용도)"""
+        with self._lock:
+            return self._versions.get(ticker, 0)
+
+    def fingerprint(self, ticker: str) -> str:
+        """
+        기본 봉 데이터 내용 기준 식별자 (워커 간 공유 캐시 키 용도)
+        버전은 프로세스마다 다르므로 구간/개수와 마지막 봉 값으로 만듭니다.
+        """
+        with self._lock:
+            base = self._base.get(ticker)
+            if base is None or base.empty:
+                return "empty"
+            last = base.iloc[-1]
+            return (
+                f"{base.index[0].isoformat()}-{base.index[-1].isoformat()}-{len(base)}"
+                f"-{last['close']}-{last['volume']}"
+            )
+
+    def append(self, ticker: str, df: pd.DataFrame) -> bool:
+        """
+        새로 수신한 기본 봉을 병합하고 파생 캔들을 증분 갱신합니다.
+        진행 중인 마지막 봉은 같은 시간의 새 값으로 교체됩니다.
+
+        Args:
+            ticker (str): 티커 (예: "KRW-BTC")
+            df (pd.DataFrame): 기본 인터벌의 OHLCV 데이터
+
+        Returns:
+            bool: 데이터 변경 여부
+        """
+        if df is None or len(df) == 0:
+            return False
+
+        df = df[list(self.AGGREGATION.keys())].sort_index()
+
+        with self._lock:
+            base = self._base.get(ticker)
+
+            if base is not None and not base.empty:
+                overlap = df.index.intersection(base.index)
+                if len(overlap) == len(df) and base.loc[overlap].equals(df):
+                    # 변경된 봉 없음
+                    return False
+                merged = pd.concat([base, df])
+                merged = merged[~merged.index.duplicated(keep="last")].sort_index()
+            else:
+                merged = df
+
+            if len(merged) > self.max_base_bars:
+                merged = merged.iloc[-self.max_base_bars :]
+
+            self._base[ticker] = merged
+            self._versions[ticker] = self._versions.get(ticker, 0) + 1
+
+            # 캐시된 상위 타임프레임 증분 갱신
+            changed_from = df.index[0]
+            for key in [key for key in self._derived if key[0] == ticker]:
+                self._derived[key] = self._update_derived(
+                    derived=self._derived[key],
+                    base=merged,
+                    interval=key[1],
+                    changed_from=changed_from,
+                )
+
+            return True
+
+    def resample(
+        self, ticker: str, interval: str, count: Optional[int] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        기본 봉으로부터 파생된 인터벌 캔들을 반환합니다.
+
+        Args:
+            ticker (str): 티커
+            interval (str): 조회할 인터벌 (예: "minute240", "day")
+            count (int): 최근 캔들 개수 (None 이면 전체)
+
+        Returns:
+            pd.DataFrame: OHLCV 데이터 (캐시된 데이터의 복사본)
+        """
+        interval = self.normalize_interval(interval)
+        if not self.can_derive(interval):
+            raise ValueError(
+                f"Interval {interval} cannot be derived from {self.base_interval}"
+            )
+
+        with self._lock:
+            base = self._base.get(ticker)
+            if base is None or base.empty:
+                return None
+
+            if interval == self.base_interval:
+                result = base
+            else:
+                key = (ticker, interval)
+                result = self._derived.get(key)
+                if result is None:
+                    result = self.aggregate(base, interval)
+                    self._derived[key] = result
+
+            if count is not None:
+                result = result.iloc[-count:]
+            return result.copy()
+
+    def clear(self, ticker: Optional[str] = None):
+        with self._lock:
+            if ticker is None:
+                self._base.clear()
+                self._derived.clear()
+                self._versions.clear()
+                return
+            self._base.pop(ticker, None)
+            self._versions.pop(ticker, None)
+            for key in [key for key in self._derived if key[0] == ticker]:
+                del self._derived[key]
+
+    def _bucket_start(self, timestamp: pd.Timestamp, interval: str) -> pd.Timestamp:
+        """timestamp 가 속한 인터벌 구간의 시작 시각"""
+        minutes = self.interval_minutes(interval)
+        step = minutes * 60 * 10**9
+        offset = (self.KST_OFFSET_MINUTES % minutes) * 60 * 10**9
+        value = ((timestamp.value - offset) // step) * step + offset
+        return pd.Timestamp(value)
+
+    def aggregate(self, base: pd.DataFrame, interval: str) -> pd.DataFrame:
+        """기본 봉을 업비트 봉 경계(UTC 00:00 기준)에 맞춰 상위 인터벌로 집계"""
+        minutes = self.interval_minutes(interval)
+        offset = self.KST_OFFSET_MINUTES % minutes
+        resampled = base.resample(
+            f"{minutes}min",
+            origin="epoch",
+            offset=f"{offset}min",
+            label="left",
+            closed="left",
+        ).agg(self.AGGREGATION)
+        # 거래가 없어 비어있는 구간 제거
+        return resampled.dropna(subset=["open"])
+
+    def _update_derived(
+        self,
+        derived: pd.DataFrame,
+        base: pd.DataFrame,
+        interval: str,
+        changed_from: pd.Timestamp,
+    ) -> pd.DataFrame:
+        # 변경이 시작된 봉이 속한 구간부터만 다시 집계
+        bucket_start = self._bucket_start(changed_from, interval)
+        head = derived[derived.index < bucket_start]
+        tail = self.aggregate(base[base.index >= bucket_start], interval)
+        updated = pd.concat([head, tail]) if not head.empty else tail
+        if len(updated) > self.max_base_bars:
+            updated = updated.iloc[-self.max_base_bars :]
+        return updated
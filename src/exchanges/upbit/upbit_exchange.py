@@ -1,16 +1,46 @@
-import json
+import copy
 import os
 import pyupbit
+import time
 
 import pandas as pd
 
-from datetime import datetime
-
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+from config import (
+    CACHE_CANDLE_TTL,
+    CACHE_INDICATOR_TTL,
+    CACHE_ORDERBOOK_TTL,
+    FNG_ENABLED,
+    NEWS_ENABLED,
+    ORDER_FILL_BACKOFF,
+    ORDER_FILL_MAX_ATTEMPTS,
+)
+from src.exchanges.strategy.registry.indicator_graph import IndicatorSpec
+from src.exchanges.upbit.candle_resampler import CandleResampler
 from src.models.trading_dto import TradingDto
+from src.utils.cache import SharedCache, get_cache
 from src.utils.fng import Fng
 from src.utils.indicator import Indicator
 from src.utils.logging import Logging
+from src.utils.metrics import Metrics
 from src.utils.news import News
+from src.utils.serialization import Serializer
+from src.utils.timing import StageTimer
+
+
+# 시세 API 호출 (공유 캐시 미스일 때만 실행되므로 여기서 호출 수 집계)
+@Metrics.exchange_call("orderbook")
+def _request_orderbook(ticker: str) -> dict | list | None:
+    return pyupbit.get_orderbook(ticker)
+
+
+@Metrics.exchange_call("candles")
+def _request_ohlcv(
+    ticker: str, interval: str, count: int, to: datetime | None
+) -> pd.DataFrame | None:
+    return pyupbit.get_ohlcv(ticker, count=count, interval=interval, to=to)
 
 
 class UpbitExchange:
@@ -28,6 +58,10 @@ class UpbitExchange:
     access_key: str  # 업비트 API 접근 키
     secret_key: str  # 업비트 API 비밀 키
     upbit: pyupbit.Upbit  # 업비트 API 클라이언트 인스턴스
+    resampler: CandleResampler  # 기본 봉으로부터 상위 타임프레임을 파생하는 리샘플러
+
+    # 더 이상 체결되지 않는 주문 상태 (시장가 매수는 잔여 금액이 cancel 로 종료)
+    FINAL_ORDER_STATES = ("done", "cancel")
 
     def __init__(self):
         """
@@ -40,15 +74,54 @@ class UpbitExchange:
         self.access_key = os.environ.get("UPBIT_ACCESS_KEY")
         self.secret_key = os.environ.get("UPBIT_SECRET_KEY")
         self.upbit = pyupbit.Upbit(self.access_key, self.secret_key)
+        self.resampler = CandleResampler(base_interval="minute60")
+        self._base_history: dict = {}  # 티커별 확보한 기본 봉 개수
+        self._indicator_cache: dict = {}  # (티커, 인터벌, 개수) -> (버전, 지표 데이터)
+
+    # Ticker Copy
+    def for_ticker(self, ticker: str) -> "UpbitExchange":
+        """
+        티커만 다른 사본을 반환합니다. (API 클라이언트/리샘플러/지표 캐시는 공유)
+        self.ticker 를 바꾸지 않고 여러 티커를 동시에 조회할 때 사용합니다.
+        """
+        exchange = copy.copy(self)
+        exchange.ticker = ticker
+        return exchange
+
+    # Now (KST)
+    def now_kst(self) -> datetime:
+        """현재 시각 (KST, tz 없음 - 캔들 인덱스와 같은 기준)"""
+        return datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+            minutes=CandleResampler.KST_OFFSET_MINUTES
+        )
+
+    # Get Current Price
+    @StageTimer.timed("fetch")
+    @Metrics.exchange_call("ticker")
+    def get_current_price(self, ticker: str | list[str]) -> float | dict | None:
+        """시세 API 로 현재가를 조회합니다. (티커 목록이면 티커별 dict)"""
+        return pyupbit.get_current_price(ticker)
+
+    # Get Orderbook
+    @StageTimer.timed("fetch")
+    def get_orderbook(self, ticker: str) -> dict | list | None:
+        """시세 API 로 호가 원본 데이터를 조회합니다. (워커 간 공유 캐시 사용)"""
+        return get_cache().get_or_set(
+            SharedCache.make_key("orderbook", ticker),
+            CACHE_ORDERBOOK_TTL,
+            lambda: _request_orderbook(ticker),
+            cache="orderbook",
+        )
 
     # Get Current Investment Status
     def get_current_investment_status(self):
         try:
             # 현재가 조회
-            current_price = pyupbit.get_current_price(self.ticker)
+            current_price = self.get_current_price(self.ticker)
 
             # 전체 계좌 조회
-            balances = self.upbit.get_balances()
+            with StageTimer.stage("fetch"), Metrics.exchange_call("accounts"):
+                balances = self.upbit.get_balances()
             filtered_balances = [
                 balance
                 for balance in balances
@@ -61,7 +134,7 @@ class UpbitExchange:
                 if coin_ticker == "KRW-KRW":
                     current_price = 0
                 else:
-                    current_price = pyupbit.get_current_price(coin_ticker)
+                    current_price = self.get_current_price(coin_ticker)
 
                 if float(balance["avg_buy_price"]) != 0:
                     profit_loss_percent = (
@@ -91,6 +164,29 @@ class UpbitExchange:
         except Exception as e:
             raise ValueError(f"Exception in Get Current Investment Status : {e}")
 
+    # Get Current Prices
+    def get_current_prices(self, currencies: list[str]) -> dict[str, float]:
+        """
+        여러 통화의 현재가를 한 번의 API 호출로 조회합니다.
+
+        Args:
+            currencies (list[str]): 통화 목록 (예: ["BTC", "ETH"])
+        Returns:
+            dict[str, float]: 통화별 현재가
+        """
+        if not currencies:
+            return {}
+        tickers = [f"KRW-{currency}" for currency in currencies]
+        prices = self.get_current_price(tickers)
+        if not isinstance(prices, dict):
+            # 티커가 하나면 float 로 반환됨
+            prices = {tickers[0]: prices}
+        return {
+            ticker.split("-")[1]: float(price)
+            for ticker, price in prices.items()
+            if price is not None
+        }
+
     # Get Orderbook Status
     def get_orderbook_status(self):
         """
@@ -107,7 +203,7 @@ class UpbitExchange:
         """
         try:
             # 업비트 API를 통해 호가 데이터 조회
-            orderbook_data = pyupbit.get_orderbook(self.ticker)
+            orderbook_data = self.get_orderbook(self.ticker)
 
             if not orderbook_data:
                 return None
@@ -167,11 +263,46 @@ class UpbitExchange:
         except Exception as e:
             raise ValueError(f"Exception in Get Orderbook Status : {e}")
 
+    # Fetch OHLCV
+    @StageTimer.timed("fetch")
+    def fetch_ohlcv(
+        self, interval: str = "day", count: int = 200, to: datetime | None = None
+    ) -> pd.DataFrame | None:
+        """
+        거래소에서 OHLCV 원본 데이터를 조회합니다. (지표 미포함)
+
+        Args:
+            interval (str): 캔들 인터벌 (예: "minute60", "day")
+            count (int): 조회할 캔들 개수
+            to (datetime): 조회 종료 시각 (UTC, None 이면 현재)
+
+        Returns:
+            pd.DataFrame: OHLCV 데이터 (조회 실패 시 None)
+        """
+        # 같은 조회는 워커 간 공유 캐시에서 한 번만 가져옴
+        ticker = self.ticker
+        return get_cache().get_or_set(
+            SharedCache.make_key("candles", ticker, interval, count, to),
+            CACHE_CANDLE_TTL,
+            lambda: _request_ohlcv(ticker, interval, count, to),
+            cache="candles",
+        )
+
     # Get Candle Data
-    def get_candle(self, count: int = 24, interval: str = "day") -> pd.DataFrame:
+    def get_candle(
+        self,
+        count: int = 24,
+        interval: str = "day",
+        specs: Iterable[IndicatorSpec] | None = None,
+    ) -> pd.DataFrame:
         """
         최근 X시간의 시간봉 데이터를 조회합니다.
 
+        Args:
+            count (int): 캔들 개수
+            interval (str): 캔들 인터벌
+            specs (Iterable[IndicatorSpec]): 추가할 지표 (None 이면 기본 지표, [] 이면 OHLCV 만)
+
         Returns:
             str: 시간봉 데이터의 JSON 문자열
                 포함 정보:
@@ -183,16 +314,136 @@ class UpbitExchange:
                 - value: 거래금액
         """
         try:
-            df: pd.DataFrame = pyupbit.get_ohlcv(
-                self.ticker, count=count, interval=interval
-            )
+            df: pd.DataFrame = self.fetch_ohlcv(count=count, interval=interval)
             if df is None:
                 return ""
-            df = Indicator.add_sub_indicators(df)
+            df = Indicator.compute(df, specs)
             return df
         except Exception as e:
             raise ValueError(f"Exception in Get Hour Candle : {e}")
 
+    # Sync Base Candle
+    def sync_base_candle(self, count: int) -> bool:
+        """
+        리샘플러의 기본 봉을 최신 상태로 동기화합니다.
+        이미 확보한 구간이 있으면 마지막 봉 이후의 봉만 조회합니다.
+
+        Args:
+            count (int): 확보해야 할 기본 봉 개수
+
+        Returns:
+            bool: 기본 봉 데이터 변경 여부
+        """
+        last_timestamp = self.resampler.last_timestamp(self.ticker)
+        history = self._base_history.get(self.ticker, 0)
+
+        if last_timestamp is None or history < count:
+            # 최초 조회 또는 더 긴 구간이 필요한 경우 전체 조회
+            fetch_count = count
+        else:
+            # 마지막 봉(진행 중일 수 있음)부터 현재까지의 봉만 조회
+            now_kst = self.now_kst()
+            step = timedelta(
+                minutes=CandleResampler.interval_minutes(self.resampler.base_interval)
+            )
+            fetch_count = min(count, int((now_kst - last_timestamp) / step) + 1)
+
+        df = self.fetch_ohlcv(
+            count=max(fetch_count, 1), interval=self.resampler.base_interval
+        )
+        if df is None:
+            return False
+
+        self._base_history[self.ticker] = max(history, count)
+        return self.resampler.append(self.ticker, df)
+
+    # Get Resampled Candle Data
+    def get_resampled_candle(
+        self,
+        count: int = 24,
+        interval: str = "day",
+        specs: Iterable[IndicatorSpec] | None = None,
+    ) -> pd.DataFrame:
+        """
+        기본 봉 스트림에서 파생한 캔들 데이터에 보조지표를 추가하여 반환합니다.
+        기본 봉으로 파생할 수 없거나 파생 비용이 큰 요청(CandleResampler.should_derive)은
+        get_candle 로 직접 조회합니다.
+
+        Args:
+            count (int): 캔들 개수
+            interval (str): 캔들 인터벌 (예: "minute240", "day", "hour")
+            specs (Iterable[IndicatorSpec]): 추가할 지표 (None 이면 기본 지표, [] 이면 OHLCV 만)
+
+        Returns:
+            pd.DataFrame: 보조지표가 포함된 OHLCV 데이터
+        """
+        try:
+            interval = CandleResampler.normalize_interval(interval)
+            if not self.resampler.should_derive(self.ticker, interval, count):
+                return self.get_candle(count=count, interval=interval, specs=specs)
+
+            self.sync_base_candle(count=self.resampler.base_bars_for(interval, count))
+
+            # 기본 봉이 변경되지 않았다면 지표 계산 결과 재사용
+            specs = Indicator.DEFAULT_SPECS if specs is None else list(specs)
+            specs_key = ",".join(spec.key for spec in specs)
+            cache_key = (self.ticker, interval, count, specs_key)
+            version = self.resampler.version(self.ticker)
+            cached = self._indicator_cache.get(cache_key)
+            hit = cached is not None and cached[0] == version
+            Metrics.cache_lookup("indicators", hit)
+            if hit:
+                return cached[1].copy()
+
+            # 다른 워커가 같은 기본 봉으로 계산한 결과가 있으면 공유 캐시에서 사용
+            ticker = self.ticker
+            df = get_cache().get_or_set(
+                SharedCache.make_key(
+                    "indicators",
+                    ticker,
+                    interval,
+                    count,
+                    specs_key,
+                    self.resampler.fingerprint(ticker),
+                ),
+                CACHE_INDICATOR_TTL,
+                lambda: self._compute_resampled_indicators(
+                    ticker, interval, count, specs
+                ),
+                cache="shared_indicators",
+            )
+            if df is None:
+                return ""
+            self._indicator_cache[cache_key] = (version, df)
+            return df.copy()
+        except Exception as e:
+            raise ValueError(f"Exception in Get Resampled Candle : {e}")
+
+    def _compute_resampled_indicators(
+        self, ticker: str, interval: str, count: int, specs: list[IndicatorSpec]
+    ) -> pd.DataFrame | None:
+        df = self.resampler.resample(ticker, interval, count=count)
+        if df is None:
+            return None
+        return Indicator.compute(df, specs)
+
+    # Get Market Context
+    def get_market_context(self) -> dict:
+        """
+        Fear & Greed Index 와 최근 뉴스 헤드라인 (백그라운드 갱신 값, 대기 없음)
+        아직 조회한 값이 없거나 비활성화된 항목은 포함하지 않습니다.
+        """
+        context = {}
+        if FNG_ENABLED:
+            fear_greed_index = Fng.get_fear_and_greed_index()
+            if fear_greed_index is not None:
+                context["Fear and Greed Index"] = fear_greed_index
+        if NEWS_ENABLED:
+            news_headlines = News.get_google_news(query=self.ticker.split("-")[1])
+            if news_headlines:
+                context["Recent news headlines"] = news_headlines
+        return context
+
     # Prepare Analysis Data
     def prepare_analysis_data(self) -> str:
         """
@@ -207,31 +458,28 @@ class UpbitExchange:
         """
 
         try:
-            ticker_currency = self.ticker.split("-")[1]
-
             # 각종 데이터 수집
             investment_status = self.get_current_investment_status()
-            day_candle_data = self.get_candle(count=30, interval="day").to_json()
-            hour_candle_data = self.get_candle(count=24, interval="hour").to_json()
+            # 일봉(30개 = 60분봉 720개)/시간봉 모두 하나의 기본 봉(60분봉) 스트림에서 파생
+            # (최초 호출 이후에는 기본 봉 증분 조회 1회로 두 인터벌을 모두 갱신)
+            day_candle_data = Serializer.frame(
+                self.get_resampled_candle(count=30, interval="day")
+            )
+            hour_candle_data = Serializer.frame(
+                self.get_resampled_candle(count=24, interval="hour")
+            )
             orderbook_status = self.get_orderbook_status()
-            # fear_greed_index = Fng.get_fear_and_greed_index()
-            # news_headlines = News.get_google_news(query=ticker_currency)
 
-            # 데이터 통합 및 JSON 형식으로 변환
+            # 데이터 통합 후 한 번만 JSON 으로 인코딩 (캔들은 split 형태의 중첩 객체)
             analysis_data = {
                 "Current Investment Status": investment_status,
                 "Daily OHLCV with indicators": day_candle_data,
                 "Hourly OHLCV with indicators": hour_candle_data,
                 "Orderbook Status": orderbook_status,
+                **self.get_market_context(),
             }
 
-            # if news_headlines is not None:
-            #     analysis_data["Recent news headlines"] = news_headlines
-
-            # if fear_greed_index is not None:
-            #     analysis_data["Fear and Greed Index"] = fear_greed_index
-
-            return json.dumps(analysis_data, indent=2)
+            return Serializer.dumps_str(analysis_data)
         except Exception as e:
             raise e
 
@@ -255,8 +503,8 @@ class UpbitExchange:
         - 매수 시 수수료 0.05% 고려 (0.9995)
         """
 
+        decision = answer["decision"].upper()
         try:
-            decision = answer["decision"].upper()
             reason = answer["reason"]
 
             if decision == "BUY":
@@ -264,36 +512,44 @@ class UpbitExchange:
                 Logging.info(f"Buy Reason: {reason}")
                 result = self.buy_market(buy_percent=buy_percent)
                 if result:
+                    Metrics.order(decision, "placed")
                     return TradingDto(
                         decision=decision,
                         reason=reason,
-                        created_at=datetime.now(),
+                        order_uuid=result["uuid"],
+                        created_at=datetime.now(timezone.utc),
                     )
             elif decision == "SELL":
                 # Sell
                 Logging.info(f"Sell Reason: {reason}")
                 result = self.sell_market(sell_percent=sell_percent)
                 if result:
+                    Metrics.order(decision, "placed")
                     return TradingDto(
                         decision=decision,
                         reason=reason,
-                        created_at=datetime.now(),
+                        order_uuid=result["uuid"],
+                        created_at=datetime.now(timezone.utc),
                     )
             elif decision == "HOLD":
                 # Hold
                 Logging.info(f"Hold Reason: {reason}")
+                Metrics.order(decision, "skipped")
                 return TradingDto(
                     decision=decision,
                     reason=reason,
-                    created_at=datetime.now(),
+                    created_at=datetime.now(timezone.utc),
                 )
 
             raise ValueError(f"거래 결과가 없거나 잘못 되었습니다.")
         except Exception as e:
+            Metrics.order(decision, "failed")
             raise e
 
-    def buy_market(self, buy_percent: float = 100) -> bool:
-        balance = self.upbit.get_balance("KRW")  # 보유 원화
+    @StageTimer.timed("order")
+    def buy_market(self, buy_percent: float = 100) -> dict:
+        with Metrics.exchange_call("accounts"):
+            balance = self.upbit.get_balance("KRW")  # 보유 원화
         available_buy_amount = balance - (
             balance * self.fee
         )  # 수수료 제외 실제 매수 가능 금액
@@ -305,9 +561,10 @@ class UpbitExchange:
             f"매수 금액: {buy_amount:,.0f}원"
         )
         if available_buy_amount > self.min_trade_amount:
-            buy_result = self.upbit.buy_market_order(
-                ticker=self.ticker, price=buy_amount
-            )
+            with Metrics.exchange_call("orders"):
+                buy_result = self.upbit.buy_market_order(
+                    ticker=self.ticker, price=buy_amount
+                )
 
             if buy_result is None:
                 raise ValueError(
@@ -321,15 +578,17 @@ class UpbitExchange:
             if "uuid" not in buy_result:
                 raise ValueError(f"매수 주문 ID를 찾을 수 없습니다.")
 
-            return True
+            return buy_result
         else:
             raise ValueError(
                 f"매수 금액이 {self.min_trade_amount}보다 적어서 매수 주문이 실패했습니다."
             )
 
-    def sell_market(self, sell_percent: float = 100) -> bool:
-        balance = self.upbit.get_balance(self.ticker)  # 보유수량
-        market_price = pyupbit.get_orderbook(ticker=self.ticker)["orderbook_units"][0][
+    @StageTimer.timed("order")
+    def sell_market(self, sell_percent: float = 100) -> dict:
+        with Metrics.exchange_call("accounts"):
+            balance = self.upbit.get_balance(self.ticker)  # 보유수량
+        market_price = self.get_orderbook(self.ticker)["orderbook_units"][0][
             "ask_price"
         ]  # 현재가
         asset_value = balance * market_price  # 평가 금액
@@ -344,9 +603,10 @@ class UpbitExchange:
             f"매도 금액: {ask_price:,.0f}원"
         )
         if ask_price > self.min_trade_amount:
-            sell_result = self.upbit.sell_market_order(
-                ticker=self.ticker, volume=sell_amount
-            )
+            with Metrics.exchange_call("orders"):
+                sell_result = self.upbit.sell_market_order(
+                    ticker=self.ticker, volume=sell_amount
+                )
 
             if sell_result is None:
                 raise ValueError(
@@ -360,8 +620,56 @@ class UpbitExchange:
             if "uuid" not in sell_result:
                 raise ValueError(f"매도 주문 ID를 찾을 수 없습니다.")
 
-            return True
+            return sell_result
         else:
             raise ValueError(
                 f"매도 금액이 {self.min_trade_amount}보다 적어서 매도 주문이 실패했습니다."
             )
+
+    # Get Order Fill
+    def get_order_fill(self, uuid: str) -> dict | None:
+        """
+        주문 ID 로 체결 정보를 조회합니다.
+        주문이 완료(done/cancel)될 때까지 대기 시간을 늘려가며 다시 조회합니다. (블로킹)
+
+        Args:
+            uuid (str): 업비트 주문 ID
+
+        Returns:
+            dict: 체결 정보 (체결 내역이 없거나 재시도 후에도 주문이 완료되지 않으면 None)
+                - price: 체결 평균가
+                - volume: 체결 수량
+                - amount: 체결 금액 (KRW)
+                - fee: 지불 수수료 (KRW)
+        """
+        delay = ORDER_FILL_BACKOFF
+        for attempt in range(ORDER_FILL_MAX_ATTEMPTS):
+            with Metrics.exchange_call("order"):
+                order = self.upbit.get_order(uuid)
+            if not order or "error" in order:
+                return None
+            if order.get("state") in self.FINAL_ORDER_STATES:
+                break
+            if attempt < ORDER_FILL_MAX_ATTEMPTS - 1:
+                time.sleep(delay)
+                delay *= 2
+        else:
+            # 부분 체결 상태로 기록하지 않음 (체결 정보 없이 저장)
+            Logging.warning(
+                f"Order {uuid} is not completed yet. Fill is left unresolved.",
+                state=order.get("state"),
+            )
+            return None
+
+        trades = order.get("trades") or []
+        volume = sum(float(trade["volume"]) for trade in trades)
+        amount = sum(float(trade["funds"]) for trade in trades)
+        if volume <= 0:
+            return None
+
+        return {
+            "price": amount / volume,
+            "volume": volume,
+            "amount": amount,
+            "fee": float(order.get("paid_fee") or 0),
+        }
@@ -0,0 +1,48 @@
+from pydantic import BaseModel
+from pydantic.alias_generators import to_camel
+from datetime import date, datetime, timezone
+
+
+# PositionDto: 통화별 현재 포지션 데이터 전송 객체
+class PositionDto(BaseModel):
+    currency: str  # 통화 (예: "BTC")
+    method: str  # 원가 계산 방식 (average/fifo)
+    quantity: float = 0  # 보유 수량
+    avg_cost: float = 0  # 평균 단가
+    cost_basis: float = 0  # 취득 원가 합계
+    realized_pnl: float = 0  # 누적 실현 손익
+    fees: float = 0  # 누적 수수료
+    last_price: float = 0  # 마지막 체결가
+    last_trade_id: int = 0  # 반영한 마지막 Trade ID
+    updated_at: datetime | None = None  # 수정 시간
+
+    class Config:
+        alias_generator = to_camel  # snake_case를 camelCase로 변환
+        populate_by_name = True  # 별칭과 원래 이름 모두 허용
+        from_attributes = True  # ORM 모델 -> DTO 변환 허용
+        json_encoders = {
+            datetime: lambda v: v.astimezone(
+                tz=timezone.utc
+            ),  # datetime을 UTC 시간대로 변환
+        }
+
+
+# PositionSnapshotDto: 일간 포지션/손익 스냅샷 데이터 전송 객체
+# currency 가 None 이면 전체 통화 합산 (에쿼티 커브)
+class PositionSnapshotDto(BaseModel):
+    day: date  # 일자
+    currency: str | None = None  # 통화
+    quantity: float | None = None  # 보유 수량 (합산 시 None)
+    avg_cost: float | None = None  # 평균 단가 (합산 시 None)
+    mark_price: float | None = None  # 평가 가격 (합산 시 None)
+    cost_basis: float = 0  # 취득 원가 합계
+    market_value: float = 0  # 평가 금액
+    realized_pnl: float = 0  # 누적 실현 손익
+    unrealized_pnl: float = 0  # 미실현 손익
+    fees: float = 0  # 누적 수수료
+    total_pnl: float = 0  # 실현 + 미실현 - 수수료
+
+    class Config:
+        alias_generator = to_camel  # snake_case를 camelCase로 변환
+        populate_by_name = True  # 별칭과 원래 이름 모두 허용
+        from_attributes = True  # ORM 모델 -> DTO 변환 허용
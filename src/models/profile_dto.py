@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from pydantic.alias_generators import to_camel
+from datetime import datetime
+
+
+# ProfileDto: 저장된 프로파일(folded stack) 메타데이터 전송 객체
+class ProfileDto(BaseModel):
+    id: str  # 프로파일 ID (요청 ID 또는 백테스트 작업 ID)
+    name: str  # 프로파일 대상 (예: "GET /v1/trade/agent", "backtest")
+    created_at: datetime  # 측정 시작 시간
+    duration: float  # 측정 시간 (초)
+    interval: float  # 샘플링 주기 (초)
+    samples: int  # 샘플 수
+
+    class Config:
+        alias_generator = to_camel  # snake_case를 camelCase로 변환
+        populate_by_name = True  # 별칭과 원래 이름 모두 허용
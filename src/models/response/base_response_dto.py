@@ -20,3 +20,12 @@ class BaseResponse(BaseGenericResponse, Generic[M]):
 
 class BaseListResponse(BaseGenericResponse, Generic[M]):
     items: list[M]
+
+
+class BaseCursorListResponse(BaseGenericResponse, Generic[M]):
+    items: list[M]
+    next_cursor: str | None = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+    class Config:
+        alias_generator = to_camel
+        populate_by_name = True
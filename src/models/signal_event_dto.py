@@ -0,0 +1,23 @@
+from pydantic import BaseModel
+from pydantic.alias_generators import to_camel
+from datetime import datetime
+
+from src.models.strategy_signal_dto import StrategySignalDto
+
+
+# SignalEventDto: 실시간 신호 스트림 이벤트 데이터 전송 객체
+class SignalEventDto(BaseModel):
+    ticker: str  # 거래 대상 티커 (예: "KRW-BTC")
+    interval: str  # 캔들 인터벌 (예: "day")
+    strategy_type: str  # 전략 유형 (예: "PROFITABLE")
+    signal: str  # 거래 신호 (BUY/SELL/HOLD)
+    changed: bool  # 직전 평가 대비 신호 변경 여부 (False 면 새 봉 평가)
+    reason: str | None = None  # 거래 신호 이유
+    score: float | None = None  # 앙상블 가중 투표 점수 (-1 ~ 1)
+    signals: list[StrategySignalDto] | None = None  # 앙상블 전략별 신호
+    candle_time: datetime  # 평가한 마지막 봉 시각
+    created_at: datetime  # 평가 시각
+
+    class Config:
+        alias_generator = to_camel  # snake_case를 camelCase로 변환
+        populate_by_name = True  # 별칭과 원래 이름 모두 허용
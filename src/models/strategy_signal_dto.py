@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from pydantic.alias_generators import to_camel
+
+
+# StrategySignalDto: 전략별 트레이딩 신호 데이터 전송 객체
+class StrategySignalDto(BaseModel):
+    strategy_type: str  # 전략 유형 (예: "RSI")
+    signal: str  # 거래 신호 (BUY/SELL/HOLD)
+    reasons: list[str] = []  # 충족된 조건 목록
+
+    class Config:
+        alias_generator = to_camel  # snake_case를 camelCase로 변환
+        populate_by_name = True  # 별칭과 원래 이름 모두 허용
@@ -0,0 +1,50 @@
+from pydantic import BaseModel
+from pydantic.alias_generators import to_camel
+from datetime import date, datetime, timezone
+
+
+# TradeDto: 트레이드 저널 레코드 데이터 전송 객체
+class TradeDto(BaseModel):
+    id: int = 0  # Trade ID
+    ticker: str | None = None  # 거래 대상 티커 (예: "KRW-BTC")
+    currency: str | None = None  # 거래 통화 (예: "BTC")
+    decision: str | None = None  # 거래 결정 (BUY/SELL/HOLD)
+    percentage: int | None = None  # 거래 비율
+    reason: str | None = None  # 결정 이유
+    provider: str | None = None  # 결정 주체 (strategy/openai)
+    strategy_type: str | None = None  # 사용한 전략 유형
+    order_uuid: str | None = None  # 주문 ID
+    price: float | None = None  # 체결 평균가
+    volume: float | None = None  # 체결 수량
+    amount: float | None = None  # 체결 금액
+    fee: float | None = None  # 수수료
+    total_tokens: int | None = None  # 총 토큰
+    prompt_tokens: int | None = None  # 프롬프트 토큰
+    completion_tokens: int | None = None  # 완성 토큰
+    total_cost: float | None = None  # 총 비용
+    created_at: datetime | None = None  # 생성 시간
+    updated_at: datetime | None = None  # 수정 시간
+
+    class Config:
+        alias_generator = to_camel  # snake_case를 camelCase로 변환
+        populate_by_name = True  # 별칭과 원래 이름 모두 허용
+        from_attributes = True  # ORM 모델 -> DTO 변환 허용
+        json_encoders = {
+            datetime: lambda v: v.astimezone(
+                tz=timezone.utc
+            ),  # datetime을 UTC 시간대로 변환
+        }
+
+
+# TradeDailyStatDto: 일자별/결정별 트레이드 집계 데이터 전송 객체
+class TradeDailyStatDto(BaseModel):
+    day: date  # 일자
+    decision: str | None = None  # 거래 결정 (BUY/SELL/HOLD)
+    count: int = 0  # 거래 건수
+    amount: float = 0  # 체결 금액 합계
+    fee: float = 0  # 수수료 합계
+    total_cost: float = 0  # LLM 비용 합계
+
+    class Config:
+        alias_generator = to_camel  # snake_case를 camelCase로 변환
+        populate_by_name = True  # 별칭과 원래 이름 모두 허용
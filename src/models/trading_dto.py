@@ -10,6 +10,7 @@ class TradingDto(BaseModel):
     reason: str | None = None  # 결정 이유
     confidence: str | None = None  # 신뢰도
     ratio: str | None = None  # 비율
+    order_uuid: str | None = None  # 주문 ID
     total_tokens: int | None = None  # 총 토큰
     prompt_tokens: int | None = None  # 프롬프트 토큰
     completion_tokens: int | None = None  # 완성 토큰
@@ -2,6 +2,8 @@ from pydantic import BaseModel, BeforeValidator
 from pydantic.alias_generators import to_camel
 from datetime import date, datetime, timedelta, timezone
 
+from src.models.strategy_signal_dto import StrategySignalDto
+
 
 # TradingSignalDto: 트레이딩 신호 데이터 전송 객체
 class TradingSignalDto(BaseModel):
@@ -9,6 +11,8 @@ class TradingSignalDto(BaseModel):
     ticker: str | None = None  # 거래 대상 티커 (예: "KRW-BTC")
     signal: str | None = None  # 거래 신호 (BUY/SELL/HOLD)
     reason: str | None = None  # 거래 신호 이유
+    score: float | None = None  # 앙상블 가중 투표 점수 (-1 ~ 1)
+    signals: list[StrategySignalDto] | None = None  # 앙상블 전략별 신호
     created_at: datetime | None = None  # 생성 시간
     updated_at: datetime | None = None  # 수정 시간
 
@@ -2,33 +2,99 @@ import inspect
 import pandas as pd
 
 from fastapi import status
-from typing import Tuple
-
-from src.agents.kestrel_agent import KestrelAiAgent
-from src.agents.prompts.prompt import KestrelPrompt
-from src.exchanges.strategy.strategies.datas.types import StrategyType, TradingSignal
-from src.exchanges.strategy.strategies.profitable_strategy import (
-    ProfitableRealTimeStrategy,
-)
+from typing import TYPE_CHECKING, Tuple
+
+from src.exchanges.strategy.registry.ensemble_strategy import EnsembleStrategy
+from src.exchanges.strategy.registry.strategy_engine import StrategyEngine
+from src.exchanges.strategy.registry.strategy_registry import StrategyRegistry
+from src.exchanges.strategy.registry.strategy_state import StrategyStateStore
+from src.exchanges.strategy.strategies.datas.types import StrategyType
+from src.exchanges.exchange_factory import create_exchange
 from src.exchanges.upbit.upbit_exchange import UpbitExchange
 from src.models.exception.http_json_exception import HttpJsonException
 from src.models.response.base_response_dto import BaseResponse
+from src.models.strategy_signal_dto import StrategySignalDto
 from src.models.trading_signal_dto import TradingSignalDto
 from src.utils.logging import Logging
+from src.utils.serialization import Serializer
+
+if TYPE_CHECKING:
+    from src.agents.kestrel_agent import KestrelAiAgent
 
 
 class ExchangeService:
     exchange: UpbitExchange
+    strategy_engine: StrategyEngine
+    strategy_state: StrategyStateStore
+
+    def __init__(self, exchange: UpbitExchange | None = None):
+        # 거래소 인스턴스 (미지정 시 KESTREL_EXCHANGE_MODE 에 따라 실거래/리플레이 생성)
+        self.exchange = exchange or create_exchange()
+        # 등록된 전략 평가 엔진
+        self.strategy_engine = StrategyEngine()
+        # (티커, 인터벌, 전략) 별 증분 지표 상태 (새 봉만 반영, 크로스 기억 유지)
+        self.strategy_state = StrategyStateStore()
+        self._ai_agent: "KestrelAiAgent | None" = None
+
+    @property
+    def ai_agent(self) -> "KestrelAiAgent":
+        """AI 에이전트 (LangChain/OpenAI 스택은 첫 에이전트 호출 시 로드)"""
+        if self._ai_agent is None:
+            from src.agents.kestrel_agent import KestrelAiAgent
+
+            self._ai_agent = KestrelAiAgent()
+        return self._ai_agent
+
+    # 전략 레지스트리에 등록된 전략에 따른 Trading Signal 생성
+    def get_strategy_trading_signal(
+        self,
+        ticker: str,
+        df: pd.DataFrame,
+        strategy_type: StrategyType,
+        interval: str | None = None,
+    ) -> TradingSignalDto | None:
+        if strategy_type == StrategyType.ENSEMBLE:
+            # 상태를 지원하는 전략(Profitable, DCA)은 저장된 상태로 평가한 신호를 사용하고
+            # 나머지 전략은 같은 캔들/지표 배열로 한 번에 평가 후 가중 투표
+            ensemble = EnsembleStrategy()
+            stateful_signals = {}
+            if interval is not None:
+                for member in ensemble.strategy_types:
+                    member_signal = self.strategy_state.evaluate(
+                        ticker, interval, member, df
+                    )
+                    if member_signal is not None:
+                        stateful_signals[member] = member_signal
+            ensemble_signal = self.strategy_engine.evaluate_ensemble(
+                df, ensemble=ensemble, signals=stateful_signals
+            )
+            return TradingSignalDto(
+                ticker=ticker,
+                signal=ensemble_signal.signal.value,
+                reason=ensemble_signal.summary(),
+                score=ensemble_signal.score,
+                signals=[
+                    StrategySignalDto(
+                        strategy_type=signal.strategy_type.value,
+                        signal=signal.signal.value,
+                        reasons=signal.reasons,
+                    )
+                    for signal in ensemble_signal.signals.values()
+                ],
+            )
 
-    def __init__(self):
-        # Upbit 거래소 인스턴스 생성
-        self.exchange = UpbitExchange()
+        if not StrategyRegistry.has(strategy_type):
+            return None
 
-    # Profitable 전략에 따른 Trading Signal 생성
-    def get_profitable_strategy_trading_signal(self, df: pd.DataFrame) -> TradingSignal:
-        strategy = ProfitableRealTimeStrategy(df=df)
-        latest_signal = strategy.analyze_market()
-        return TradingSignal(latest_signal)
+        # 상태를 지원하는 전략은 저장된 지표 상태에 새 봉만 반영하여 평가
+        strategy_signal = None
+        if interval is not None:
+            strategy_signal = self.strategy_state.evaluate(
+                ticker, interval, strategy_type, df
+            )
+        if strategy_signal is None:
+            strategy_signal = self.strategy_engine.evaluate_one(df, strategy_type)
+        return TradingSignalDto(ticker=ticker, signal=strategy_signal.signal.value)
 
     # 전략에 따른 Trading Signal 생성
     def get_trading_signal_with_strategy(
@@ -40,18 +106,19 @@ class ExchangeService:
         try:
             self.exchange.ticker = ticker
 
-            # 캔들 데이터 조회
-            candle_df = self.exchange.get_candle(count=200, interval=interval)
-
-            trading_signal: TradingSignal | None = None
+            # 캔들 데이터 조회 (지표는 전략 평가 시 필요한 것만 계산)
+            candle_df = self.exchange.get_resampled_candle(
+                count=200, interval=interval, specs=[]
+            )
 
-            if strategy_type == StrategyType.PROFITABLE:
-                # Profitable 전략
-                trading_signal = self.get_profitable_strategy_trading_signal(
-                    df=candle_df
-                )
+            trading_signal_dto = self.get_strategy_trading_signal(
+                ticker=ticker,
+                df=candle_df,
+                strategy_type=strategy_type,
+                interval=interval,
+            )
 
-            if trading_signal is None:
+            if trading_signal_dto is None:
                 raise HttpJsonException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     error_message=str("Trading Signal Not Found"),
@@ -59,7 +126,7 @@ class ExchangeService:
 
             return BaseResponse[TradingSignalDto](
                 status_code=status.HTTP_200_OK,
-                item=TradingSignalDto(ticker=ticker, signal=trading_signal.value),
+                item=trading_signal_dto,
             )
         except HttpJsonException as e:
             raise e
@@ -85,36 +152,57 @@ class ExchangeService:
             self.exchange.ticker = ticker
 
             investment_status = self.exchange.get_current_investment_status()
-            candle_df = self.exchange.get_candle(count=candle_count, interval=interval)
+            candle_df = self.exchange.get_resampled_candle(
+                count=candle_count, interval=interval
+            )
             orderbook_status = self.exchange.get_orderbook_status()
 
-            trading_signal: TradingSignal | None = None
-
-            if strategy_type == StrategyType.PROFITABLE:
-                # Profitable 전략
-                trading_signal = self.get_profitable_strategy_trading_signal(
-                    df=candle_df
-                )
+            trading_signal_dto = self.get_strategy_trading_signal(
+                ticker=ticker,
+                df=candle_df,
+                strategy_type=strategy_type,
+                interval=interval,
+            )
 
-            if trading_signal is None:
+            if trading_signal_dto is None:
                 raise HttpJsonException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     error_message=str("Trading Signal Not Found"),
                 )
 
-            # 데이터 통합 및 JSON 형식으로 변환
+            # 데이터 통합 (에이전트에서 한 번만 JSON 으로 인코딩)
             analysis_data = {
                 "Current Investment Status": investment_status,
-                "OHLCV With Indicators": candle_df.to_json(),
+                "OHLCV With Indicators": Serializer.frame(candle_df),
                 "Orderbook Status": orderbook_status,
-                "Result By Trading Strategy": trading_signal.value,
+                "Result By Trading Strategy": trading_signal_dto.signal,
+                **self.exchange.get_market_context(),
             }
 
-            # AI 매매 결정
-            ai_agent = KestrelAiAgent()
-            answer = ai_agent.invoke(
+            if trading_signal_dto.signals is not None:
+                # 앙상블 모드: 전략별 신호와 가중 투표 점수 포함
+                analysis_data["Result By Each Strategy"] = {
+                    signal.strategy_type: signal.signal
+                    for signal in trading_signal_dto.signals
+                }
+                analysis_data["Ensemble Vote Score"] = trading_signal_dto.score
+
+            # AI 매매 결정 (같은 확정 봉/전략 신호 구간에서는 캐시된 결정 재사용)
+            # 진행 중인 마지막 봉과 호가는 계속 바뀌므로 마지막 확정 봉 시각을 키로 사용
+            last_closed = candle_df.index[-2] if len(candle_df) > 1 else None
+            answer = self.ai_agent.invoke(
                 analysis_data=analysis_data,
                 strategy_type=strategy_type,
+                cache_key=(
+                    (
+                        ticker,
+                        interval,
+                        last_closed.isoformat(),
+                        trading_signal_dto.signal,
+                    )
+                    if last_closed is not None
+                    else None
+                ),
             )
 
             return (
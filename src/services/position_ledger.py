@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List
+
+
+class CostMethod(str, Enum):
+    AVERAGE = "average"  # 평균 단가법
+    FIFO = "fifo"  # 선입선출법
+
+
+@dataclass
+class PositionLot:
+    volume: float  # 남은 수량
+    price: float  # 매수 단가
+
+
+@dataclass
+class PositionLedger:
+    """
+    통화 하나의 포지션 원장
+    체결(fill)을 순서대로 반영하여 보유 수량, 취득 원가, 실현 손익, 수수료를 누적합니다.
+    """
+
+    currency: str
+    method: CostMethod = CostMethod.AVERAGE
+    quantity: float = 0.0  # 보유 수량
+    cost_basis: float = 0.0  # 보유 수량의 취득 원가 합계 (KRW, 수수료 제외)
+    realized_pnl: float = 0.0  # 누적 실현 손익 (KRW, 수수료 제외)
+    fees: float = 0.0  # 누적 수수료 (KRW)
+    last_price: float = 0.0  # 마지막 체결가
+    lots: List[PositionLot] = field(default_factory=list)  # FIFO 매수 로트
+
+    @property
+    def avg_cost(self) -> float:
+        return self.cost_basis / self.quantity if self.quantity > 0 else 0.0
+
+    def apply_fill(self, side: str, price: float, volume: float, fee: float = 0.0):
+        """
+        체결 하나를 원장에 반영합니다.
+
+        Args:
+            side (str): "BUY" 또는 "SELL"
+            price (float): 체결 평균가
+            volume (float): 체결 수량
+            fee (float): 지불 수수료
+        """
+        side = side.upper()
+        self.fees += fee or 0.0
+        self.last_price = price
+
+        if side == "BUY":
+            self.quantity += volume
+            self.cost_basis += price * volume
+            if self.method == CostMethod.FIFO:
+                self.lots.append(PositionLot(volume=volume, price=price))
+        elif side == "SELL":
+            volume = min(volume, self.quantity)
+            if volume <= 0:
+                return
+            if self.method == CostMethod.FIFO:
+                released_cost = self._consume_lots(volume)
+            else:
+                released_cost = self.avg_cost * volume
+            self.realized_pnl += price * volume - released_cost
+            self.cost_basis -= released_cost
+            self.quantity -= volume
+            if self.quantity <= 1e-12:
+                # 부동소수점 잔여분 정리
+                self.quantity = 0.0
+                self.cost_basis = 0.0
+                self.lots = []
+
+    def unrealized_pnl(self, mark_price: float) -> float:
+        return self.quantity * mark_price - self.cost_basis
+
+    def _consume_lots(self, volume: float) -> float:
+        released_cost = 0.0
+        remaining = volume
+        while remaining > 1e-12 and self.lots:
+            lot = self.lots[0]
+            take = min(lot.volume, remaining)
+            released_cost += take * lot.price
+            lot.volume -= take
+            remaining -= take
+            if lot.volume <= 1e-12:
+                self.lots.pop(0)
+        return released_cost
@@ -0,0 +1,364 @@
+import asyncio
+import inspect
+import json
+
+from dataclasses import replace
+from datetime import date, datetime, timedelta, timezone
+from fastapi import status
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, List, Tuple
+
+from src.databases.entity.positions_entity import (
+    LedgerCursor,
+    PositionSnapshots,
+    Positions,
+)
+from src.databases.entity.trades_entity import Trades
+from src.exchanges.upbit.candle_resampler import CandleResampler
+from src.models.exception.http_json_exception import HttpJsonException
+from src.models.position_dto import PositionDto, PositionSnapshotDto
+from src.models.response.base_response_dto import BaseListResponse
+from src.services.position_ledger import CostMethod, PositionLedger, PositionLot
+from src.utils.logging import Logging
+
+
+class PositionLedgerService:
+    """
+    트레이드 저널의 체결을 증분 소비하여 포지션 원장과 일간 스냅샷을 유지하는 서비스
+    - 체결 정보가 채워졌고 아직 반영하지 않은(ledger_applied=false) 매수/매도 레코드만 조회하여 반영
+      (여러 워커가 늦게 커밋한 낮은 ID 나 나중에 체결 정보가 채워진 레코드도 누락 없이 반영)
+    - 커서 행을 잠근 트랜잭션 안에서 반영 (저널 훅/API/여러 워커가 동시에 호출해도 한 번만 반영)
+    - 체결이 발생한 (통화, 일자) 스냅샷을 갱신 (일자는 KST 기준)
+    - 조회는 스냅샷 테이블에 대한 인덱스 쿼리 한 번으로 처리
+    """
+
+    method: CostMethod  # 원가 계산 방식
+    batch_size: int  # 한 번에 확인할 최대 Trade 레코드 수
+
+    CURSOR_NAME = "positions"
+    KST_OFFSET = timedelta(minutes=CandleResampler.KST_OFFSET_MINUTES)
+
+    def __init__(self, method: CostMethod = CostMethod.AVERAGE, batch_size: int = 5000):
+        self.method = method
+        self.batch_size = batch_size
+        self._lock = (
+            asyncio.Lock()
+        )  # 같은 프로세스 안의 호출 직렬화 (DB 잠금 대기 방지)
+
+    @classmethod
+    def _day(cls, timestamp: datetime) -> date:
+        """스냅샷 일자 (KST 기준, tz 없는 시각은 UTC 로 간주)"""
+        if timestamp.tzinfo is not None:
+            timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+        return (timestamp + cls.KST_OFFSET).date()
+
+    @staticmethod
+    def _to_ledger(entity: Positions) -> PositionLedger:
+        lots = json.loads(entity.lots) if entity.lots else []
+        return PositionLedger(
+            currency=entity.currency,
+            method=CostMethod(entity.method),
+            quantity=entity.quantity,
+            cost_basis=entity.cost_basis,
+            realized_pnl=entity.realized_pnl,
+            fees=entity.fees,
+            last_price=entity.last_price,
+            lots=[PositionLot(volume=volume, price=price) for volume, price in lots],
+        )
+
+    @staticmethod
+    def _update_entity(entity: Positions, ledger: PositionLedger, last_trade_id: int):
+        entity.quantity = ledger.quantity
+        entity.cost_basis = ledger.cost_basis
+        entity.realized_pnl = ledger.realized_pnl
+        entity.fees = ledger.fees
+        entity.last_price = ledger.last_price
+        entity.lots = json.dumps([[lot.volume, lot.price] for lot in ledger.lots])
+        entity.last_trade_id = last_trade_id
+
+    @staticmethod
+    def _update_snapshot(
+        snapshot: PositionSnapshots, ledger: PositionLedger, mark_price: float
+    ):
+        unrealized_pnl = ledger.unrealized_pnl(mark_price)
+        snapshot.quantity = ledger.quantity
+        snapshot.avg_cost = ledger.avg_cost
+        snapshot.cost_basis = ledger.cost_basis
+        snapshot.mark_price = mark_price
+        snapshot.market_value = ledger.quantity * mark_price
+        snapshot.realized_pnl = ledger.realized_pnl
+        snapshot.unrealized_pnl = unrealized_pnl
+        snapshot.fees = ledger.fees
+        snapshot.total_pnl = ledger.realized_pnl + unrealized_pnl - ledger.fees
+
+    async def _load_snapshots(
+        self, db: AsyncSession, keys: List[Tuple[str, date]]
+    ) -> Dict[Tuple[str, date], PositionSnapshots]:
+        if not keys:
+            return {}
+        currencies = {currency for currency, _ in keys}
+        days = [day for _, day in keys]
+        result = await db.execute(
+            select(PositionSnapshots).where(
+                PositionSnapshots.currency.in_(currencies),
+                PositionSnapshots.day >= min(days),
+                PositionSnapshots.day <= max(days),
+            )
+        )
+        return {
+            (snapshot.currency, snapshot.day): snapshot
+            for snapshot in result.scalars().all()
+        }
+
+    async def _lock_cursor(self, db: AsyncSession) -> LedgerCursor | None:
+        """
+        원장 커서 행을 잠그고 반환합니다. (SELECT ... FOR UPDATE, 트랜잭션 종료 시 해제)
+        커서가 없으면 기존 포지션의 마지막 Trade ID 로 생성합니다.
+        (동시에 생성을 시도해 충돌하면 다른 쪽이 반영하므로 None)
+        """
+        cursor = (
+            await db.execute(
+                select(LedgerCursor)
+                .where(LedgerCursor.name == self.CURSOR_NAME)
+                .with_for_update()
+            )
+        ).scalar_one_or_none()
+        if cursor is not None:
+            return cursor
+
+        watermark = (
+            await db.execute(select(func.max(Positions.last_trade_id)))
+        ).scalar()
+        cursor = LedgerCursor(name=self.CURSOR_NAME, last_trade_id=watermark or 0)
+        db.add(cursor)
+        try:
+            await db.flush()
+        except IntegrityError:
+            await db.rollback()
+            return None
+        return cursor
+
+    async def apply_new_fills(self, db: AsyncSession) -> int:
+        """
+        아직 반영하지 않은 체결을 원장에 반영하고 일간 스냅샷을 갱신합니다.
+
+        Returns:
+            int: 반영한 체결 수 (0 이면 더 반영할 체결 없음)
+        """
+        async with self._lock:
+            return await self._apply_new_fills(db)
+
+    async def _apply_new_fills(self, db: AsyncSession) -> int:
+        try:
+            cursor = await self._lock_cursor(db)
+            if cursor is None:
+                return 0
+
+            # 체결 정보가 없는(주문 조회 실패) 레코드는 채워질 때까지 남겨둠
+            result = await db.execute(
+                select(Trades)
+                .where(
+                    Trades.ledger_applied.is_(False),
+                    Trades.decision.in_(("BUY", "SELL")),
+                    Trades.currency.is_not(None),
+                    Trades.volume > 0,
+                    Trades.price > 0,
+                )
+                .order_by(Trades.id)
+                .limit(self.batch_size)
+            )
+            trades = list(result.scalars().all())
+            if not trades:
+                await db.commit()
+                return 0
+
+            positions = {
+                entity.currency: entity
+                for entity in (await db.execute(select(Positions))).scalars().all()
+            }
+            ledgers = {
+                currency: self._to_ledger(entity)
+                for currency, entity in positions.items()
+            }
+
+            # 체결 반영 후 (통화, 일자)별 마지막 원장 상태와 평가 가격 기록
+            states: Dict[Tuple[str, date], Tuple[PositionLedger, float]] = {}
+            last_fill_ids: Dict[str, int] = {}
+            for trade in trades:
+                ledger = ledgers.setdefault(
+                    trade.currency,
+                    PositionLedger(currency=trade.currency, method=self.method),
+                )
+                ledger.apply_fill(
+                    side=trade.decision,
+                    price=trade.price,
+                    volume=trade.volume,
+                    fee=trade.fee or 0.0,
+                )
+                states[(trade.currency, self._day(trade.created_at))] = (
+                    replace(ledger, lots=[]),
+                    trade.price,
+                )
+                last_fill_ids[trade.currency] = trade.id
+
+            for currency, last_trade_id in last_fill_ids.items():
+                ledger = ledgers[currency]
+                entity = positions.get(currency)
+                if entity is None:
+                    entity = Positions(currency=currency, method=ledger.method.value)
+                    db.add(entity)
+                self._update_entity(entity, ledger, last_trade_id)
+
+            snapshots = await self._load_snapshots(db, list(states.keys()))
+            for key, (ledger, mark_price) in states.items():
+                snapshot = snapshots.get(key)
+                if snapshot is None:
+                    snapshot = PositionSnapshots(currency=key[0], day=key[1])
+                    db.add(snapshot)
+                self._update_snapshot(snapshot, ledger, mark_price)
+
+            await db.execute(
+                update(Trades)
+                .where(Trades.id.in_([trade.id for trade in trades]))
+                .values(ledger_applied=True)
+            )
+            cursor.last_trade_id = max(cursor.last_trade_id, trades[-1].id)
+            await db.commit()
+            return len(trades)
+        except Exception as e:
+            await db.rollback()
+            calling_function = inspect.currentframe().f_code.co_name
+            Logging.error(
+                msg=f"Exception occurred in [{calling_function}]:",
+                error=e,
+            )
+            raise
+
+    async def mark_to_market(
+        self, db: AsyncSession, prices: Dict[str, float], day: date | None = None
+    ) -> BaseListResponse[PositionSnapshotDto]:
+        """
+        현재 가격으로 전체 포지션의 일간 스냅샷을 갱신합니다.
+        하루 한 번 이상 호출하면 모든 통화가 매일 스냅샷을 가지므로
+        일자별 합산(에쿼티 커브)이 체결이 없는 날에도 연속됩니다.
+
+        Args:
+            prices (Dict[str, float]): 통화별 현재 가격 (없으면 마지막 체결가 사용)
+            day (date): 스냅샷 일자 (default: 오늘, KST)
+        Returns:
+            BaseListResponse[PositionSnapshotDto]: 갱신한 통화별 스냅샷
+        """
+        try:
+            day = day or self._day(datetime.now(timezone.utc))
+            positions = (await db.execute(select(Positions))).scalars().all()
+            snapshots = await self._load_snapshots(
+                db, [(entity.currency, day) for entity in positions]
+            )
+            items = []
+            for entity in positions:
+                snapshot = snapshots.get((entity.currency, day))
+                if snapshot is None:
+                    snapshot = PositionSnapshots(currency=entity.currency, day=day)
+                    db.add(snapshot)
+                mark_price = prices.get(entity.currency) or entity.last_price
+                self._update_snapshot(snapshot, self._to_ledger(entity), mark_price)
+                items.append(PositionSnapshotDto.model_validate(snapshot))
+            await db.commit()
+
+            return BaseListResponse[PositionSnapshotDto](
+                status_code=status.HTTP_200_OK,
+                items=items,
+            )
+        except Exception as e:
+            await db.rollback()
+            calling_function = inspect.currentframe().f_code.co_name
+            Logging.error(
+                msg=f"Exception occurred in [{calling_function}]:",
+                error=e,
+            )
+            raise HttpJsonException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+            )
+
+    # 현재 포지션 조회
+    async def get_positions(
+        self, db: AsyncSession, include_closed: bool = False
+    ) -> BaseListResponse[PositionDto]:
+        try:
+            query = select(Positions).order_by(Positions.currency)
+            if not include_closed:
+                query = query.where(Positions.quantity > 0)
+            entities = (await db.execute(query)).scalars().all()
+
+            return BaseListResponse[PositionDto](
+                status_code=status.HTTP_200_OK,
+                items=[
+                    PositionDto.model_validate(entity).model_copy(
+                        update={"avg_cost": self._to_ledger(entity).avg_cost}
+                    )
+                    for entity in entities
+                ],
+            )
+        except Exception as e:
+            calling_function = inspect.currentframe().f_code.co_name
+            Logging.error(
+                msg=f"Exception occurred in [{calling_function}]:",
+                error=e,
+            )
+            raise HttpJsonException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+            )
+
+    # 일간 스냅샷 조회 (통화 지정 시 통화별, 미지정 시 일자별 합산)
+    async def get_snapshots(
+        self,
+        db: AsyncSession,
+        currency: str | None = None,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> BaseListResponse[PositionSnapshotDto]:
+        try:
+            if currency:
+                query = select(PositionSnapshots).where(
+                    PositionSnapshots.currency == currency
+                )
+            else:
+                query = select(
+                    PositionSnapshots.day,
+                    func.sum(PositionSnapshots.cost_basis).label("cost_basis"),
+                    func.sum(PositionSnapshots.market_value).label("market_value"),
+                    func.sum(PositionSnapshots.realized_pnl).label("realized_pnl"),
+                    func.sum(PositionSnapshots.unrealized_pnl).label("unrealized_pnl"),
+                    func.sum(PositionSnapshots.fees).label("fees"),
+                    func.sum(PositionSnapshots.total_pnl).label("total_pnl"),
+                ).group_by(PositionSnapshots.day)
+            if start is not None:
+                query = query.where(PositionSnapshots.day >= start)
+            if end is not None:
+                query = query.where(PositionSnapshots.day <= end)
+            query = query.order_by(PositionSnapshots.day)
+
+            result = await db.execute(query)
+            if currency:
+                items = [
+                    PositionSnapshotDto.model_validate(snapshot)
+                    for snapshot in result.scalars().all()
+                ]
+            else:
+                items = [PositionSnapshotDto(**row._mapping) for row in result.all()]
+
+            return BaseListResponse[PositionSnapshotDto](
+                status_code=status.HTTP_200_OK,
+                items=items,
+            )
+        except Exception as e:
+            calling_function = inspect.currentframe().f_code.co_name
+            Logging.error(
+                msg=f"Exception occurred in [{calling_function}]:",
+                error=e,
+            )
+            raise HttpJsonException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+            )
@@ -0,0 +1,43 @@
+import inspect
+import os
+
+from fastapi import status
+
+from src.models.exception.http_json_exception import HttpJsonException
+from src.models.profile_dto import ProfileDto
+from src.models.response.base_response_dto import BaseListResponse
+from src.utils.logging import Logging
+from src.utils.profiler import Profiler
+
+
+class ProfileService:
+
+    # 저장된 프로파일 목록 조회 (최신순)
+    def get_profiles(self, limit: int = 50) -> BaseListResponse[ProfileDto]:
+        try:
+            return BaseListResponse[ProfileDto](
+                status_code=status.HTTP_200_OK,
+                items=[
+                    ProfileDto.model_validate(meta)
+                    for meta in Profiler.list()[: max(1, limit)]
+                ],
+            )
+        except Exception as e:
+            calling_function = inspect.currentframe().f_code.co_name
+            Logging.error(
+                msg=f"Exception occurred in [{calling_function}]:",
+                error=e,
+            )
+            raise HttpJsonException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+            )
+
+    # 프로파일 파일 경로 조회 (folded stack 다운로드용)
+    def get_profile_path(self, profile_id: str) -> str:
+        path = Profiler.path(profile_id) if Profiler.is_valid_id(profile_id) else None
+        if path is None or not os.path.exists(path):
+            raise HttpJsonException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                error_message=f"Profile not found: {profile_id}",
+            )
+        return path
@@ -0,0 +1,384 @@
+import asyncio
+import itertools
+
+import pandas as pd
+
+from datetime import datetime
+from fastapi import status
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
+
+from config import (
+    SIGNAL_STREAM_KEEPALIVE,
+    SIGNAL_STREAM_MAX_CONCURRENCY,
+    SIGNAL_STREAM_MAX_KEYS,
+    SIGNAL_STREAM_MAX_SUBSCRIBERS,
+    SIGNAL_STREAM_POLL_INTERVAL,
+)
+from src.exchanges.strategy.registry.strategy_registry import StrategyRegistry
+from src.exchanges.strategy.registry.strategy_state import StrategyStateStore
+from src.exchanges.strategy.strategies.datas.types import StrategyType
+from src.exchanges.upbit.candle_resampler import CandleResampler
+from src.models.exception.http_json_exception import HttpJsonException
+from src.models.signal_event_dto import SignalEventDto
+from src.models.trading_signal_dto import TradingSignalDto
+from src.services.exchange_service import ExchangeService
+from src.utils.logging import Logging
+from src.utils.metrics import Metrics
+from src.utils.serialization import Serializer
+
+# (티커, 인터벌)
+MarketKey = Tuple[str, str]
+
+
+class SignalSubscription:
+    """
+    구독자 1명의 대기 이벤트 버퍼
+    - (티커, 전략) 별 최신 이벤트만 보관: 느린 구독자는 중간 변경을 건너뛰고 최신 상태를 받음
+    - 대기 이벤트 수는 구독한 (티커 x 전략) 수 이하로 제한 (폴러는 구독자를 기다리지 않음)
+    """
+
+    tickers: Tuple[str, ...]
+    strategy_types: Tuple[StrategyType, ...]
+    interval: str
+    pending: Dict[Tuple[str, StrategyType], bytes]  # 전송 대기 SSE 프레임 (도착 순)
+    closed: bool
+
+    def __init__(
+        self,
+        tickers: Iterable[str],
+        strategy_types: Iterable[StrategyType],
+        interval: str,
+    ):
+        self.tickers = tuple(dict.fromkeys(tickers))
+        self.strategy_types = tuple(dict.fromkeys(strategy_types))
+        self.interval = interval
+        self.pending = {}
+        self.closed = False
+        self._ready = asyncio.Event()
+
+    def push(self, key: Tuple[str, StrategyType], frame: bytes):
+        if key in self.pending:
+            # 아직 전송하지 못한 이전 이벤트는 최신 이벤트로 대체 (순서는 최신 기준)
+            del self.pending[key]
+            Metrics.signal_event("coalesced")
+        self.pending[key] = frame
+        self._ready.set()
+
+    def close(self):
+        self.closed = True
+        self._ready.set()
+
+    async def next(self, timeout: float) -> List[bytes] | None:
+        """
+        대기 중인 프레임을 모두 꺼냅니다.
+
+        Returns:
+            List[bytes] | None: 프레임 목록 (timeout 동안 없으면 빈 목록, 종료되면 None)
+        """
+        if not self.pending and not self.closed:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        if self.closed:
+            return None
+        frames = list(self.pending.values())
+        self.pending.clear()
+        return frames
+
+
+class MarketFeed:
+    """(티커, 인터벌) 하나의 공유 평가 상태와 전략별 구독자"""
+
+    ticker: str
+    interval: str
+    subscribers: Dict[StrategyType, Set[SignalSubscription]]
+    signals: Dict[StrategyType, str]  # 전략별 마지막 신호
+    frames: Dict[StrategyType, bytes]  # 전략별 마지막 이벤트 (새 구독자에게 바로 전송)
+    candle_time: Optional[pd.Timestamp]  # 마지막으로 평가한 봉 시각
+
+    def __init__(self, ticker: str, interval: str):
+        self.ticker = ticker
+        self.interval = interval
+        self.subscribers = {}
+        self.signals = {}
+        self.frames = {}
+        self.candle_time = None
+
+
+class SignalStreamService:
+    """
+    실시간 매매 신호 스트림 (/v1/signals/stream, Server-Sent Events)
+    - 워커마다 하나의 폴러가 구독 중인 (티커, 인터벌) 마켓을 poll_interval 마다 한 번씩 평가
+      (구독자 수와 관계없이 마켓당 캔들 조회 1회, 전략당 평가 1회, 이벤트 인코딩 1회)
+    - 신호가 바뀌면 "signal", 새 봉이 생기면 (신호가 같아도) "candle" 이벤트를 구독자에게 전달
+    - 구독자별 버퍼는 (티커, 전략) 별 최신 이벤트만 보관하여 느린 구독자도 메모리가 늘지 않음
+    - 마켓 평가는 워커 스레드에서 최대 max_concurrency 개씩 동시에 실행
+      (티커별 거래소 사본으로 조회하여 요청 처리와 거래소 티커 상태를 공유하지 않음)
+    - 전략 상태는 앱의 StrategyStateStore 를 공유 (스냅샷 저장/복원 대상과 동일)
+    """
+
+    KEEPALIVE_FRAME = b": keepalive\n\n"
+    RETRY_FRAME = b"retry: 5000\n\n"  # 재연결 대기 (ms)
+
+    exchange_service: ExchangeService
+    feeds: Dict[MarketKey, MarketFeed]
+    subscriptions: Set[SignalSubscription]
+
+    def __init__(
+        self,
+        exchange_service: ExchangeService | None = None,
+        poll_interval: float = SIGNAL_STREAM_POLL_INTERVAL,
+        keepalive: float = SIGNAL_STREAM_KEEPALIVE,
+        max_subscribers: int = SIGNAL_STREAM_MAX_SUBSCRIBERS,
+        max_keys: int = SIGNAL_STREAM_MAX_KEYS,
+        max_concurrency: int = SIGNAL_STREAM_MAX_CONCURRENCY,
+        strategy_state: StrategyStateStore | None = None,
+    ):
+        self.exchange_service = exchange_service or ExchangeService()
+        if strategy_state is not None:
+            # 요청 처리 경로와 같은 지표 상태 사용 (StrategyStateService 가 저장/복원)
+            self.exchange_service.strategy_state = strategy_state
+        self.poll_interval = poll_interval
+        self.keepalive = keepalive
+        self.max_subscribers = max_subscribers
+        self.max_keys = max_keys
+        self.max_concurrency = max_concurrency
+        self.feeds = {}
+        self.subscriptions = set()
+        self._ids = itertools.count(1)
+        self._wakeup = asyncio.Event()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """폴러 시작 (애플리케이션 시작 시 호출)"""
+        if self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """폴러 종료 및 열린 스트림 종료 (애플리케이션 종료 시 호출)"""
+        for subscription in list(self.subscriptions):
+            subscription.close()
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    # 구독
+    def subscribe(
+        self,
+        tickers: Iterable[str],
+        strategy_types: Iterable[StrategyType],
+        interval: str = "day",
+    ) -> SignalSubscription:
+        """
+        구독 요청을 검증하여 구독 객체를 만듭니다. (마켓 등록은 stream() 시작 시)
+        스트림이 시작되지 못한 구독이 남지 않도록 등록/해제를 모두 stream() 안에서 처리합니다.
+        """
+        subscription = SignalSubscription(
+            tickers=tickers,
+            strategy_types=strategy_types,
+            interval=CandleResampler.normalize_interval(interval),
+        )
+        if subscription.interval not in CandleResampler.INTERVAL_MINUTES:
+            raise HttpJsonException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                error_message=f"Unknown interval: {interval}",
+            )
+        for ticker in subscription.tickers:
+            if not ticker.startswith("KRW-") or ticker == "KRW-":
+                raise HttpJsonException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    error_message=f"Only KRW market tickers are supported: {ticker}",
+                )
+        keys = len(subscription.tickers) * len(subscription.strategy_types)
+        if keys == 0 or keys > self.max_keys:
+            raise HttpJsonException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                error_message=f"Subscribe to 1 ~ {self.max_keys} (ticker, strategy) pairs",
+            )
+        for strategy_type in subscription.strategy_types:
+            if strategy_type != StrategyType.ENSEMBLE and not StrategyRegistry.has(
+                strategy_type
+            ):
+                raise HttpJsonException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    error_message=f"Unknown strategy: {strategy_type.value}",
+                )
+        if len(self.subscriptions) >= self.max_subscribers:
+            raise HttpJsonException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                error_message="Too many signal stream subscribers",
+            )
+        return subscription
+
+    def _register(self, subscription: SignalSubscription):
+        new_feed = False
+        for ticker in subscription.tickers:
+            key = (ticker, subscription.interval)
+            feed = self.feeds.get(key)
+            if feed is None:
+                feed = self.feeds[key] = MarketFeed(ticker, subscription.interval)
+                new_feed = True
+            for strategy_type in subscription.strategy_types:
+                feed.subscribers.setdefault(strategy_type, set()).add(subscription)
+                # 이미 평가된 신호는 바로 전송
+                if strategy_type in feed.frames:
+                    subscription.push(
+                        (ticker, strategy_type), feed.frames[strategy_type]
+                    )
+                else:
+                    new_feed = True
+
+        self.subscriptions.add(subscription)
+        Metrics.SIGNAL_SUBSCRIBERS.inc()
+        if new_feed:
+            # 처음 구독된 마켓/전략은 다음 주기를 기다리지 않고 평가
+            self._wakeup.set()
+
+    def _unregister(self, subscription: SignalSubscription):
+        if subscription not in self.subscriptions:
+            return
+        self.subscriptions.discard(subscription)
+        Metrics.SIGNAL_SUBSCRIBERS.dec()
+        for ticker in subscription.tickers:
+            key = (ticker, subscription.interval)
+            feed = self.feeds.get(key)
+            if feed is None:
+                continue
+            for strategy_type in subscription.strategy_types:
+                subscribers = feed.subscribers.get(strategy_type)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    # 구독자가 없는 전략은 평가 중단
+                    del feed.subscribers[strategy_type]
+                    feed.signals.pop(strategy_type, None)
+                    feed.frames.pop(strategy_type, None)
+            if not feed.subscribers:
+                del self.feeds[key]
+
+    async def stream(self, subscription: SignalSubscription) -> AsyncIterator[bytes]:
+        """
+        구독의 SSE 프레임 스트림 (연결이 끊기거나 서버가 종료되면 구독 해제)
+        이벤트가 없으면 keepalive 마다 주석 프레임을 보내 끊어진 연결을 감지합니다.
+        """
+        self._register(subscription)
+        try:
+            yield self.RETRY_FRAME
+            while True:
+                frames = await subscription.next(self.keepalive)
+                if frames is None:
+                    return
+                yield b"".join(frames) if frames else self.KEEPALIVE_FRAME
+        finally:
+            self._unregister(subscription)
+
+    # 폴링
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            await asyncio.gather(
+                *[self._poll(feed) for feed in list(self.feeds.values())]
+            )
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll(self, feed: MarketFeed):
+        strategy_types = list(feed.subscribers)
+        if not strategy_types:
+            return
+        try:
+            async with self._semaphore:
+                candle_time, signals = await asyncio.to_thread(
+                    self._evaluate, feed.ticker, feed.interval, strategy_types
+                )
+        except Exception as e:
+            Logging.error(
+                msg=f"Signal stream evaluation failed [{feed.ticker} {feed.interval}]:",
+                error=e,
+            )
+            return
+        self._publish(feed, candle_time, signals)
+
+    def _evaluate(
+        self, ticker: str, interval: str, strategy_types: List[StrategyType]
+    ) -> Tuple[pd.Timestamp, Dict[StrategyType, TradingSignalDto]]:
+        """마켓의 캔들을 한 번 조회하여 구독 중인 전략을 모두 평가 (워커 스레드)"""
+        exchange = self.exchange_service.exchange.for_ticker(ticker)
+        candle_df = exchange.get_resampled_candle(
+            count=200, interval=interval, specs=[]
+        )
+        signals = {}
+        for strategy_type in strategy_types:
+            trading_signal_dto = self.exchange_service.get_strategy_trading_signal(
+                ticker=ticker,
+                df=candle_df,
+                strategy_type=strategy_type,
+                interval=interval,
+            )
+            if trading_signal_dto is not None:
+                signals[strategy_type] = trading_signal_dto
+        return pd.Timestamp(candle_df.index[-1]), signals
+
+    def _publish(
+        self,
+        feed: MarketFeed,
+        candle_time: pd.Timestamp,
+        signals: Dict[StrategyType, TradingSignalDto],
+    ):
+        new_candle = feed.candle_time is not None and candle_time != feed.candle_time
+        feed.candle_time = candle_time
+        now = datetime.now()
+        for strategy_type, trading_signal_dto in signals.items():
+            subscribers = feed.subscribers.get(strategy_type)
+            if not subscribers:
+                # 평가 중에 구독이 모두 해제된 전략
+                continue
+            changed = feed.signals.get(strategy_type) != trading_signal_dto.signal
+            if not changed and not new_candle:
+                continue
+
+            event = "signal" if changed else "candle"
+            frame = self._frame(
+                event,
+                SignalEventDto(
+                    ticker=feed.ticker,
+                    interval=feed.interval,
+                    strategy_type=strategy_type.value,
+                    signal=trading_signal_dto.signal,
+                    changed=changed,
+                    reason=trading_signal_dto.reason,
+                    score=trading_signal_dto.score,
+                    signals=trading_signal_dto.signals,
+                    candle_time=candle_time.to_pydatetime(),
+                    created_at=now,
+                ),
+            )
+            feed.signals[strategy_type] = trading_signal_dto.signal
+            feed.frames[strategy_type] = frame
+            for subscription in subscribers:
+                subscription.push((feed.ticker, strategy_type), frame)
+            Metrics.signal_event(event)
+
+    def _frame(self, event: str, signal_event_dto: SignalEventDto) -> bytes:
+        """SSE 프레임 (모든 구독자가 같은 bytes 를 공유)"""
+        data = Serializer.dumps(
+            signal_event_dto.model_dump(mode="json", by_alias=True, exclude_none=True)
+        )
+        return b"id: %d\nevent: %s\ndata: %s\n\n" % (
+            next(self._ids),
+            event.encode(),
+            data,
+        )
@@ -0,0 +1,61 @@
+import asyncio
+
+from typing import Optional
+
+from config import STRATEGY_STATE_PATH, STRATEGY_STATE_SNAPSHOT_INTERVAL
+from src.exchanges.strategy.registry.strategy_state import StrategyStateStore
+from src.utils.logging import Logging
+
+
+class StrategyStateService:
+    """
+    실시간 전략 상태의 스냅샷 저장/복원
+    - start(): 저장된 스냅샷 복원 후 주기적 스냅샷 태스크 시작
+    - 변경된 상태가 있을 때만 snapshot_interval 마다 저장
+    - stop(): 종료 전 마지막 스냅샷 저장
+    """
+
+    def __init__(
+        self,
+        store: StrategyStateStore,
+        path: str = STRATEGY_STATE_PATH,
+        snapshot_interval: float = STRATEGY_STATE_SNAPSHOT_INTERVAL,
+    ):
+        self.store = store
+        self.path = path
+        self.snapshot_interval = snapshot_interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """스냅샷 복원 및 주기적 저장 시작 (애플리케이션 시작 시 호출)"""
+        if self._task is not None:
+            return
+        restored = self.store.load(self.path)
+        if restored:
+            Logging.info("Strategy state restored", states=restored, path=self.path)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """주기적 저장 종료 후 마지막 스냅샷 저장 (애플리케이션 종료 시 호출)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        self.snapshot()
+
+    def snapshot(self):
+        if not self.store.dirty:
+            return
+        try:
+            self.store.save(self.path)
+        except OSError as e:
+            Logging.error(msg="Strategy state snapshot failed:", error=e)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            self.snapshot()
@@ -0,0 +1,173 @@
+import base64
+import inspect
+
+from datetime import datetime
+from fastapi import status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Tuple
+
+from src.models.exception.http_json_exception import HttpJsonException
+from src.models.response.base_response_dto import (
+    BaseCursorListResponse,
+    BaseListResponse,
+    BaseResponse,
+)
+from src.models.trade_dto import TradeDailyStatDto, TradeDto
+from src.services.trades_database_service import TradesDatabaseService
+from src.utils.logging import Logging
+
+
+class TradeHistoryService:
+    trades_database_service: TradesDatabaseService
+
+    MAX_PAGE_SIZE = 500  # 한 페이지 최대 크기
+
+    def __init__(self):
+        self.trades_database_service = TradesDatabaseService()
+
+    @staticmethod
+    def encode_cursor(cursor: Tuple[datetime, int] | None) -> str | None:
+        """(created_at, id) 커서를 URL 안전한 문자열로 인코딩"""
+        if cursor is None:
+            return None
+        created_at, id = cursor
+        raw = f"{created_at.isoformat()}|{id}".encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str | None) -> Tuple[datetime, int] | None:
+        if cursor is None:
+            return None
+        try:
+            created_at, id = base64.urlsafe_b64decode(cursor).decode().split("|")
+            return datetime.fromisoformat(created_at), int(id)
+        except Exception:
+            raise HttpJsonException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                error_message="Invalid cursor",
+            )
+
+    # 트레이드 목록 조회 (키셋 페이지네이션)
+    async def get_trades(
+        self,
+        db: AsyncSession,
+        limit: int = 50,
+        cursor: str | None = None,
+        currency: str | None = None,
+        decision: str | None = None,
+        provider: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> BaseCursorListResponse[TradeDto]:
+        try:
+            entities, next_cursor = await self.trades_database_service.get_page(
+                db=db,
+                limit=max(1, min(limit, self.MAX_PAGE_SIZE)),
+                cursor=self.decode_cursor(cursor),
+                currency=currency,
+                decision=decision.upper() if decision else None,
+                provider=provider,
+                start=start,
+                end=end,
+            )
+
+            return BaseCursorListResponse[TradeDto](
+                status_code=status.HTTP_200_OK,
+                items=[TradeDto.model_validate(entity) for entity in entities],
+                next_cursor=self.encode_cursor(next_cursor),
+            )
+        except HttpJsonException as e:
+            raise e
+        except Exception as e:
+            calling_function = inspect.currentframe().f_code.co_name
+            Logging.error(
+                msg=f"Exception occurred in [{calling_function}]:",
+                error=e,
+            )
+            raise HttpJsonException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+            )
+
+    # 일자별/결정별 트레이드 집계
+    async def get_daily_stats(
+        self,
+        db: AsyncSession,
+        currency: str | None = None,
+        decision: str | None = None,
+        provider: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> BaseListResponse[TradeDailyStatDto]:
+        try:
+            rows = await self.trades_database_service.get_daily_stats(
+                db=db,
+                currency=currency,
+                decision=decision.upper() if decision else None,
+                provider=provider,
+                start=start,
+                end=end,
+            )
+
+            return BaseListResponse[TradeDailyStatDto](
+                status_code=status.HTTP_200_OK,
+                items=[TradeDailyStatDto(**row) for row in rows],
+            )
+        except HttpJsonException as e:
+            raise e
+        except Exception as e:
+            calling_function = inspect.currentframe().f_code.co_name
+            Logging.error(
+                msg=f"Exception occurred in [{calling_function}]:",
+                error=e,
+            )
+            raise HttpJsonException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+            )
+
+    # 트레이드 단건 조회
+    async def get_trade(self, db: AsyncSession, id: int) -> BaseResponse[TradeDto]:
+        try:
+            entity = await self.trades_database_service.get_one_by_id(db=db, id=id)
+            if entity is None:
+                raise HttpJsonException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    error_message="Trade Not Found",
+                )
+
+            return BaseResponse[TradeDto](
+                status_code=status.HTTP_200_OK,
+                item=TradeDto.model_validate(entity),
+            )
+        except HttpJsonException as e:
+            raise e
+        except Exception as e:
+            calling_function = inspect.currentframe().f_code.co_name
+            Logging.error(
+                msg=f"Exception occurred in [{calling_function}]:",
+                error=e,
+            )
+            raise HttpJsonException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+            )
+
+    # 트레이드 단건 삭제
+    async def delete_trade(self, db: AsyncSession, id: int) -> bool:
+        try:
+            deleted = await self.trades_database_service.delete_one_by_id(db=db, id=id)
+            if not deleted:
+                raise HttpJsonException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    error_message="Trade Not Found",
+                )
+            return True
+        except HttpJsonException as e:
+            raise e
+        except Exception as e:
+            calling_function = inspect.currentframe().f_code.co_name
+            Logging.error(
+                msg=f"Exception occurred in [{calling_function}]:",
+                error=e,
+            )
+            raise HttpJsonException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, error_message=str(e)
+            )
@@ -0,0 +1,175 @@
+import asyncio
+import inspect
+
+from datetime import datetime, timezone
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Awaitable, Callable, List, Optional
+
+from config import (
+    TRADE_JOURNAL_BATCH_SIZE,
+    TRADE_JOURNAL_FLUSH_INTERVAL,
+    TRADE_JOURNAL_MAX_QUEUE_SIZE,
+)
+from src.databases.database import SessionLocal
+from src.databases.entity.trades_entity import Trades
+from src.models.trading_dto import TradingDto
+from src.services.trades_database_service import TradesDatabaseService
+from src.utils.logging import Logging
+
+
+class TradeJournalService:
+    """
+    매매 결정/체결/토큰 비용을 Trades 테이블에 기록하는 트레이드 저널
+    - record() 는 큐에 적재만 하고 즉시 반환 (요청 처리 경로에 DB 지연 없음)
+    - 백그라운드 태스크가 배치 단위로 모아서 한 번의 트랜잭션으로 저장
+    - 주문 ID 가 있으면 저장 전에 체결 정보(가격/수량/수수료)를 조회하여 보강
+    - 저장 후 after_write 훅으로 후속 처리 (예: 포지션 원장 증분 반영)
+    """
+
+    batch_size: int  # 한 번에 저장할 최대 레코드 수
+    flush_interval: float  # 배치를 모으는 최대 대기 시간 (초)
+    max_queue_size: int  # 큐 최대 크기 (초과 시 레코드 폐기)
+
+    def __init__(
+        self,
+        fill_resolver: Optional[Callable[[str], Optional[dict]]] = None,
+        after_write: Optional[Callable[[AsyncSession], Awaitable]] = None,
+        batch_size: int = TRADE_JOURNAL_BATCH_SIZE,
+        flush_interval: float = TRADE_JOURNAL_FLUSH_INTERVAL,
+        max_queue_size: int = TRADE_JOURNAL_MAX_QUEUE_SIZE,
+    ):
+        self.fill_resolver = fill_resolver
+        self.after_write = after_write
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.trades_database_service = TradesDatabaseService()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """백그라운드 배치 writer 시작 (애플리케이션 시작 시 호출)"""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """큐에 남은 레코드를 모두 저장한 뒤 writer 종료 (애플리케이션 종료 시 호출)"""
+        if self._task is None:
+            return
+        await self._queue.join()
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def record(self, **fields) -> bool:
+        """
+        Trades 레코드를 큐에 적재합니다. (스레드 안전, 논블로킹)
+
+        Args:
+            **fields: Trades 컬럼 값
+
+        Returns:
+            bool: 적재 요청 여부 (writer 미실행 시 False)
+        """
+        if self._loop is None or self._loop.is_closed():
+            Logging.warning("Trade journal writer is not running. Record dropped.")
+            return False
+        self._loop.call_soon_threadsafe(self._enqueue, fields)
+        return True
+
+    def record_trade(
+        self,
+        ticker: str,
+        trading_dto: TradingDto,
+        strategy_type: str | None = None,
+        provider: str | None = None,
+        percentage: float | None = None,
+    ) -> bool:
+        """매매 실행 결과(TradingDto)를 저널에 기록합니다."""
+        return self.record(
+            ticker=ticker,
+            currency=ticker.split("-")[1],
+            decision=trading_dto.decision,
+            reason=trading_dto.reason,
+            percentage=int(percentage) if percentage is not None else None,
+            strategy_type=strategy_type,
+            provider=provider,
+            order_uuid=trading_dto.order_uuid,
+            total_tokens=trading_dto.total_tokens,
+            prompt_tokens=trading_dto.prompt_tokens,
+            completion_tokens=trading_dto.completion_tokens,
+            total_cost=trading_dto.total_cost,
+            created_at=trading_dto.created_at or datetime.now(timezone.utc),
+        )
+
+    def _enqueue(self, fields: dict):
+        try:
+            self._queue.put_nowait(fields)
+        except asyncio.QueueFull:
+            Logging.warning("Trade journal queue is full. Record dropped.")
+
+    async def _next_batch(self) -> List[dict]:
+        # 첫 레코드는 무기한 대기, 이후 flush_interval 동안 batch_size 까지 수집
+        batch = [await self._queue.get()]
+        deadline = self._loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - self._loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _resolve_fill(self, fields: dict) -> dict:
+        # 주문 체결 정보 보강 (블로킹 API 호출은 스레드에서 실행)
+        order_uuid = fields.get("order_uuid")
+        if self.fill_resolver is None or order_uuid is None:
+            return fields
+        try:
+            fill = await asyncio.to_thread(self.fill_resolver, order_uuid)
+            if fill:
+                fields.update(fill)
+        except Exception as e:
+            Logging.error(
+                msg=f"Failed to resolve fill for order {order_uuid}:", error=e
+            )
+        return fields
+
+    async def _write(self, batch: List[dict]):
+        resolved = await asyncio.gather(
+            *[self._resolve_fill(fields) for fields in batch]
+        )
+        entities = [Trades(**fields) for fields in resolved]
+        async with SessionLocal() as db:
+            await self.trades_database_service.create_all(db, entities)
+            if self.after_write is not None:
+                try:
+                    await self.after_write(db)
+                except Exception as e:
+                    # 저널 레코드는 이미 저장됨 (다음 배치에서 다시 반영)
+                    Logging.error(msg="Trade journal after_write hook failed:", error=e)
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._write(batch)
+            except Exception as e:
+                calling_function = inspect.currentframe().f_code.co_name
+                Logging.error(
+                    msg=f"Exception occurred in [{calling_function}] "
+                    f"({len(batch)} trade records dropped):",
+                    error=e,
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
@@ -2,7 +2,8 @@ import inspect
 
 from fastapi import status
 
-from src.exchanges.strategy.strategies.profitable_strategy import TradingSignal
+from src.exchanges.strategy.strategies.datas.types import TradingSignal
+from src.exchanges.exchange_factory import create_exchange
 from src.exchanges.upbit.upbit_exchange import UpbitExchange
 from src.models.exception.http_json_exception import HttpJsonException
 from src.models.response.base_response_dto import BaseResponse
@@ -15,9 +16,9 @@ from src.utils.logging import Logging
 class TradeService:
     exchange: UpbitExchange
 
-    def __init__(self):
-        # Upbit 거래소 인스턴스 생성
-        self.exchange = UpbitExchange()
+    def __init__(self, exchange: UpbitExchange | None = None):
+        # 거래소 인스턴스 (미지정 시 KESTREL_EXCHANGE_MODE 에 따라 실거래/리플레이 생성)
+        self.exchange = exchange or create_exchange()
 
     def run_trade(
         self,
@@ -1,33 +1,127 @@
-from typing import List
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List, Tuple
+from sqlalchemy import Select, delete, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.databases.entity.trades_entity import Trades
+from src.utils.logging import Logging
 
 
 class TradesDatabaseService:
 
     def __init__(self):
-        print("TradesDatabaseService Init")
+        Logging.debug("TradesDatabaseService Init")
 
-    # def create(self, db: Session, dto: Trades) -> Trades:
-    #     try:
-    #         entity = Trades(domain=dto.domain, content=dto.content)
-    #         db.add(entity)
-    #         db.commit()
-    #         db.refresh(entity)
-    #         return entity
-    #     except:
-    #         raise
+    async def create_all(self, db: AsyncSession, entities: List[Trades]) -> None:
+        try:
+            db.add_all(entities)
+            await db.commit()
+        except:
+            await db.rollback()
+            raise
+
+    def _apply_filters(
+        self,
+        query: Select,
+        currency: str | None = None,
+        decision: str | None = None,
+        provider: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Select:
+        if currency is not None:
+            query = query.where(Trades.currency == currency)
+        if decision is not None:
+            query = query.where(Trades.decision == decision)
+        if provider is not None:
+            query = query.where(Trades.provider == provider)
+        if start is not None:
+            query = query.where(Trades.created_at >= start)
+        if end is not None:
+            query = query.where(Trades.created_at < end)
+        return query
+
+    async def get_page(
+        self,
+        db: AsyncSession,
+        limit: int = 50,
+        cursor: Tuple[datetime, int] | None = None,
+        currency: str | None = None,
+        decision: str | None = None,
+        provider: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Tuple[List[Trades], Tuple[datetime, int] | None]:
+        """
+        (created_at, id) 키셋 페이지네이션으로 최신순 트레이드를 조회합니다.
 
-    def get_all(self, db: Session) -> List[Trades]:
+        Args:
+            limit (int): 페이지 크기
+            cursor (Tuple[datetime, int]): 이전 페이지 마지막 행의 (created_at, id)
+            currency, decision, provider, start, end: 필터 조건
+
+        Returns:
+            Tuple[List[Trades], Tuple[datetime, int] | None]: 트레이드 목록, 다음 커서
+        """
         try:
-            return db.query(Trades).all()
+            query = self._apply_filters(
+                select(Trades), currency, decision, provider, start, end
+            )
+            if cursor is not None:
+                query = query.where(tuple_(Trades.created_at, Trades.id) < cursor)
+            query = query.order_by(Trades.created_at.desc(), Trades.id.desc()).limit(
+                limit + 1
+            )
+
+            result = await db.execute(query)
+            entities = list(result.scalars().all())
+
+            next_cursor = None
+            if len(entities) > limit:
+                entities = entities[:limit]
+                next_cursor = (entities[-1].created_at, entities[-1].id)
+
+            return entities, next_cursor
+        except:
+            raise
+
+    async def get_daily_stats(
+        self,
+        db: AsyncSession,
+        currency: str | None = None,
+        decision: str | None = None,
+        provider: str | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> List[dict]:
+        """일자별/결정별 거래 건수, 체결 금액, 수수료, LLM 비용 집계"""
+        try:
+            day = func.date(Trades.created_at).label("day")
+            query = self._apply_filters(
+                select(
+                    day,
+                    Trades.decision,
+                    func.count(Trades.id).label("count"),
+                    func.coalesce(func.sum(Trades.amount), 0).label("amount"),
+                    func.coalesce(func.sum(Trades.fee), 0).label("fee"),
+                    func.coalesce(func.sum(Trades.total_cost), 0).label("total_cost"),
+                ),
+                currency,
+                decision,
+                provider,
+                start,
+                end,
+            )
+            query = query.group_by(day, Trades.decision).order_by(day, Trades.decision)
+
+            result = await db.execute(query)
+            return [dict(row._mapping) for row in result]
         except:
             raise
 
-    def get_one_by_id(self, db: Session, id: str) -> Trades:
+    async def get_one_by_id(self, db: AsyncSession, id: int) -> Trades | None:
         try:
-            return db.query(Trades).filter_by(id=id).one()
+            return await db.get(Trades, id)
         except:
             raise
 
@@ -40,13 +134,12 @@ class TradesDatabaseService:
     #     except:
     #         raise
 
-    def delete_one_by_id(self, db: Session, id: str) -> bool:
+    async def delete_one_by_id(self, db: AsyncSession, id: int) -> bool:
         try:
-            entity = db.query(Trades).filter_by(id=id).all()
-            if not entity:
-                return False
-            db.query(Trades).filter_by(id=id).delete()
-            db.commit()
-            return True
+            # 단일 DELETE 문으로 삭제하고 삭제된 행 수로 존재 여부 판단
+            result = await db.execute(delete(Trades).where(Trades.id == id))
+            await db.commit()
+            return result.rowcount > 0
         except:
+            await db.rollback()
             raise
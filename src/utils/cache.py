@@ -0,0 +1,280 @@
+import hashlib
+import os
+import pickle
+import threading
+import time
+import uuid
+
+from typing import Any, Callable, Dict, Tuple
+
+from config import (
+    CACHE_BACKEND,
+    CACHE_LOCK_TIMEOUT,
+    CACHE_PREFIX,
+    CACHE_REDIS_URL,
+    CACHE_SHM_DIR,
+)
+from src.utils.logging import Logging
+from src.utils.metrics import Metrics
+
+
+class SharedCache:
+    """
+    여러 워커가 공유하는 캐시 (캔들, 지표, 호가, LLM 결정)
+    - 값은 pickle 로 저장 (내부 데이터 전용)
+    - get_or_set: 캐시 미스 시 키 단위 잠금으로 한 워커만 로드하고 나머지는 결과를 기다림
+    """
+
+    POLL_INTERVAL = 0.02  # 잠금 대기 중 캐시 확인 주기 (초)
+
+    def get(self, key: str) -> Any | None:
+        raw = self._get(key)
+        return pickle.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: float):
+        self._set(key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), ttl)
+
+    def get_or_set(
+        self,
+        key: str,
+        ttl: float,
+        loader: Callable[[], Any],
+        cache: str = "shared",
+    ) -> Any:
+        """
+        캐시된 값을 반환하고, 없으면 loader 결과를 저장 후 반환합니다.
+
+        Args:
+            key (str): 캐시 키
+            ttl (float): 만료 시간 (초, 0 이하면 캐시하지 않음)
+            loader (Callable): 캐시 미스 시 값을 만드는 함수 (None 반환 시 저장하지 않음)
+            cache (str): 지표 라벨 (candles, indicators, orderbook, llm)
+        """
+        if ttl <= 0:
+            return loader()
+
+        value = self.get(key)
+        Metrics.cache_lookup(cache, value is not None)
+        if value is not None:
+            return value
+
+        deadline = time.monotonic() + CACHE_LOCK_TIMEOUT
+        while not self._acquire(key, CACHE_LOCK_TIMEOUT):
+            # 다른 워커가 로드 중: 결과가 저장될 때까지 대기 (시간 초과 시 직접 로드)
+            time.sleep(self.POLL_INTERVAL)
+            value = self.get(key)
+            if value is not None:
+                return value
+            if time.monotonic() >= deadline:
+                return self._load_and_set(key, ttl, loader)
+        try:
+            value = self.get(key)
+            if value is not None:
+                return value
+            return self._load_and_set(key, ttl, loader)
+        finally:
+            self._release(key)
+
+    def _load_and_set(self, key: str, ttl: float, loader: Callable[[], Any]) -> Any:
+        value = loader()
+        if value is not None:
+            try:
+                self.set(key, value, ttl)
+            except Exception as e:
+                Logging.warning(f"Cache set failed for {key}: {e!r}")
+        return value
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """키 구성 요소를 이어 붙인 캐시 키 (긴 요소는 해시)"""
+        items = []
+        for part in parts:
+            text = str(part)
+            if len(text) > 64:
+                text = hashlib.sha1(text.encode()).hexdigest()
+            items.append(text)
+        return CACHE_PREFIX + ":".join(items)
+
+    # Backend
+    def _get(self, key: str) -> bytes | None:
+        raise NotImplementedError
+
+    def _set(self, key: str, raw: bytes, ttl: float):
+        raise NotImplementedError
+
+    def _acquire(self, key: str, timeout: float) -> bool:
+        raise NotImplementedError
+
+    def _release(self, key: str):
+        raise NotImplementedError
+
+
+class MemoryCache(SharedCache):
+    """프로세스 내 캐시 (단일 워커)"""
+
+    def __init__(self):
+        self._items: Dict[str, Tuple[float, bytes]] = {}
+        self._locks: Dict[str, float] = {}
+        self._mutex = threading.Lock()
+
+    def _get(self, key: str) -> bytes | None:
+        item = self._items.get(key)
+        if item is None or item[0] < time.monotonic():
+            return None
+        return item[1]
+
+    def _set(self, key: str, raw: bytes, ttl: float):
+        now = time.monotonic()
+        with self._mutex:
+            self._items[key] = (now + ttl, raw)
+            # 만료된 항목 정리
+            if len(self._items) > 1024:
+                self._items = {k: v for k, v in self._items.items() if v[0] >= now}
+
+    def _acquire(self, key: str, timeout: float) -> bool:
+        now = time.monotonic()
+        with self._mutex:
+            if self._locks.get(key, 0) > now:
+                return False
+            self._locks[key] = now + timeout
+            return True
+
+    def _release(self, key: str):
+        with self._mutex:
+            self._locks.pop(key, None)
+
+
+class ShmCache(SharedCache):
+    """
+    같은 호스트의 워커끼리 공유하는 파일 캐시 (기본 /dev/shm - 메모리 기반 파일시스템)
+    - 값 파일: {만료 시각(epoch)}\\n{pickle}  (임시 파일 + rename 으로 원자적 교체)
+    - 잠금 파일: O_EXCL 생성, 만료 시각이 지난 잠금은 회수
+    """
+
+    def __init__(self, directory: str = CACHE_SHM_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str, suffix: str = "") -> str:
+        return os.path.join(
+            self.directory, hashlib.sha1(key.encode()).hexdigest() + suffix
+        )
+
+    def _get(self, key: str) -> bytes | None:
+        try:
+            with open(self._path(key), "rb") as f:
+                expires_at = float(f.readline())
+                if expires_at < time.time():
+                    return None
+                return f.read()
+        except (OSError, ValueError):
+            return None
+
+    def _set(self, key: str, raw: bytes, ttl: float):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(f"{time.time() + ttl}\n".encode())
+            f.write(raw)
+        os.replace(tmp_path, path)
+
+    def _acquire(self, key: str, timeout: float) -> bool:
+        path = self._path(key, ".lock")
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                with open(path, "rb") as f:
+                    expired = float(f.read() or 0) < time.time()
+            except (OSError, ValueError):
+                expired = True
+            if expired:
+                # 잠금을 잡은 워커가 비정상 종료된 경우
+                self._release(key)
+            return False
+        with os.fdopen(fd, "wb") as f:
+            f.write(str(time.time() + timeout).encode())
+        return True
+
+    def _release(self, key: str):
+        try:
+            os.remove(self._path(key, ".lock"))
+        except OSError:
+            pass
+
+
+class RedisCache(SharedCache):
+    """
+    Redis 캐시 (여러 호스트/워커 공유)
+    - 잠금은 무작위 토큰으로 SET NX PX, 해제는 토큰이 같을 때만 삭제 (Lua 스크립트)
+      (만료 후 다른 워커가 잡은 잠금을 지우지 않음)
+    - Redis 장애 시 캐시 없이 loader 로 직접 로드 (요청은 실패하지 않음)
+    """
+
+    # 토큰이 일치할 때만 잠금 삭제 (compare-and-delete)
+    RELEASE_SCRIPT = """
+    if redis.call("get", KEYS[1]) == ARGV[1] then
+        return redis.call("del", KEYS[1])
+    end
+    return 0
+    """
+
+    def __init__(self, url: str = CACHE_REDIS_URL):
+        import redis
+
+        self.client = redis.Redis.from_url(url)
+        self.errors = (redis.exceptions.RedisError,)
+        self._release_script = self.client.register_script(self.RELEASE_SCRIPT)
+        self._tokens: Dict[str, str] = {}  # 이 프로세스가 잡은 잠금의 토큰
+
+    def _get(self, key: str) -> bytes | None:
+        try:
+            return self.client.get(key)
+        except self.errors as e:
+            Logging.warning(f"Cache get failed for {key}: {e!r}")
+            return None
+
+    def _set(self, key: str, raw: bytes, ttl: float):
+        self.client.set(key, raw, px=max(1, int(ttl * 1000)))
+
+    def _acquire(self, key: str, timeout: float) -> bool:
+        token = uuid.uuid4().hex
+        try:
+            acquired = self.client.set(
+                f"{key}:lock", token, nx=True, px=max(1, int(timeout * 1000))
+            )
+        except self.errors as e:
+            # 잠금 없이 직접 로드
+            Logging.warning(f"Cache lock failed for {key}: {e!r}")
+            return True
+        if acquired:
+            self._tokens[key] = token
+        return bool(acquired)
+
+    def _release(self, key: str):
+        token = self._tokens.pop(key, None)
+        if token is None:
+            return
+        try:
+            self._release_script(keys=[f"{key}:lock"], args=[token])
+        except self.errors as e:
+            # 잠금은 만료 시각에 자동 해제
+            Logging.warning(f"Cache unlock failed for {key}: {e!r}")
+
+
+_cache: SharedCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> SharedCache:
+    """CACHE_BACKEND (memory/shm/redis) 에 따른 공유 캐시 (프로세스당 1개)"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            if CACHE_BACKEND == "redis":
+                _cache = RedisCache()
+            elif CACHE_BACKEND == "shm":
+                _cache = ShmCache()
+            else:
+                _cache = MemoryCache()
+        return _cache
@@ -0,0 +1,135 @@
+import asyncio
+import time
+
+from typing import Dict, Generic, Hashable, Set, Tuple, TypeVar
+
+import httpx
+
+from config import PROVIDER_RETRY_INTERVAL, PROVIDER_TIMEOUT
+from src.utils.logging import Logging
+from src.utils.metrics import Metrics
+
+T = TypeVar("T")
+
+
+class CachedProvider(Generic[T]):
+    """
+    외부 데이터 제공자 (Fear & Greed, 뉴스 등) 의 비동기 TTL 캐시
+    - httpx.AsyncClient 하나로 커넥션 재사용, 요청마다 PROVIDER_TIMEOUT 적용
+    - start() 후에는 이벤트 루프의 백그라운드 태스크가 만료된 키를 갱신
+    - peek(): I/O 없이 마지막 값을 반환 (동기 코드/요청 경로용, 만료 시 갱신 예약)
+    - 갱신 실패 시 마지막 값을 유지하고 PROVIDER_RETRY_INTERVAL 후 재시도
+    """
+
+    name: str = "provider"  # 지표/로그 라벨
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[T, float]] = {}  # 키 -> (값, 만료 시각)
+        self._retry_at: Dict[Hashable, float] = {}  # 실패한 키 -> 재시도 시각
+        self._keys: Set[Hashable] = set()  # 백그라운드 갱신 대상 키
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    async def _fetch(self, client: httpx.AsyncClient, key: Hashable) -> Tuple[T, float]:
+        """키의 최신 값과 TTL (초) 을 조회합니다. (하위 클래스 구현)"""
+        raise NotImplementedError
+
+    # Lifecycle
+    async def start(self):
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._client = httpx.AsyncClient(timeout=PROVIDER_TIMEOUT)
+        self._task = asyncio.create_task(self._run(), name=f"{self.name}-refresh")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._loop = None
+
+    # Read
+    def peek(self, key: Hashable = None) -> T | None:
+        """
+        마지막으로 조회한 값을 반환합니다. (만료된 값 포함, 없으면 None)
+        만료되었거나 값이 없으면 백그라운드 갱신을 예약하고 기다리지 않습니다.
+        """
+        self._keys.add(key)
+        entry = self._entries.get(key)
+        fresh = entry is not None and entry[1] > time.time()
+        Metrics.cache_lookup(self.name, fresh)
+        if not fresh and self._loop is not None and self._wake is not None:
+            self._loop.call_soon_threadsafe(self._wake.set)
+        return entry[0] if entry is not None else None
+
+    async def get(self, key: Hashable = None) -> T | None:
+        """캐시가 유효하면 반환하고, 아니면 조회 후 반환합니다. (실패 시 마지막 값)"""
+        self._keys.add(key)
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] > time.time():
+            return entry[0]
+        return await self.refresh(key)
+
+    async def refresh(self, key: Hashable = None) -> T | None:
+        """값을 다시 조회합니다. 같은 키의 동시 조회는 하나로 합칩니다."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._refresh(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _refresh(self, key: Hashable) -> T | None:
+        try:
+            if self._client is None:
+                async with httpx.AsyncClient(timeout=PROVIDER_TIMEOUT) as client:
+                    value, ttl = await self._fetch(client, key)
+            else:
+                value, ttl = await self._fetch(self._client, key)
+        except Exception as e:
+            Logging.warning(
+                f"{self.name} refresh failed, using last known value",
+                key=key,
+                error=repr(e),
+            )
+            self._retry_at[key] = time.time() + PROVIDER_RETRY_INTERVAL
+            entry = self._entries.get(key)
+            return entry[0] if entry is not None else None
+        self._retry_at.pop(key, None)
+        # 갱신 주기가 너무 짧아지지 않도록 최소 1초
+        self._entries[key] = (value, time.time() + max(ttl, 1.0))
+        return value
+
+    def _next_due(self, key: Hashable) -> float:
+        entry = self._entries.get(key)
+        due = entry[1] if entry is not None else 0.0
+        return max(due, self._retry_at.get(key, 0.0))
+
+    async def _run(self):
+        while True:
+            now = time.time()
+            due = [key for key in list(self._keys) if self._next_due(key) <= now]
+            if due:
+                await asyncio.gather(*(self.refresh(key) for key in due))
+                continue
+
+            self._wake.clear()
+            timeout = min(
+                (self._next_due(key) - now for key in self._keys), default=None
+            )
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
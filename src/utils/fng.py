@@ -1,4 +1,34 @@
-import requests
+import os
+
+import httpx
+import pandas as pd
+
+from datetime import datetime, timedelta
+from typing import Hashable, Tuple
+
+from config import FNG_HISTORY_PATH, FNG_TTL, PROVIDER_TIMEOUT
+from src.exchanges.upbit.candle_resampler import CandleResampler
+from src.utils.cached_provider import CachedProvider
+from src.utils.logging import Logging
+
+# Fear & Greed Index API 엔드포인트
+FNG_URL = "https://api.alternative.me/fng/"
+
+
+class FngProvider(CachedProvider[dict]):
+    """최신 Fear & Greed Index (API 의 다음 갱신 시각까지 캐시, 하루 1회 갱신)"""
+
+    name = "fng"
+
+    async def _fetch(
+        self, client: httpx.AsyncClient, key: Hashable
+    ) -> Tuple[dict, float]:
+        response = await client.get(FNG_URL)
+        response.raise_for_status()
+        latest = response.json()["data"][0]  # 최신 데이터(첫 번째 항목)
+        # 다음 갱신까지 남은 시간 (초) 만큼 캐시, 없으면 FNG_TTL
+        ttl = float(latest.get("time_until_update") or FNG_TTL)
+        return latest, ttl
 
 
 class Fng:
@@ -14,30 +44,84 @@ class Fng:
     을 나타냅니다.
     """
 
+    provider = FngProvider(ttl=FNG_TTL)
+
+    # 이력의 날짜는 UTC 기준 (UTC 00:00 = KST 09:00 에 공개)
+    # KST 캔들 시각과 비교할 때는 이만큼 뒤로 이동해서 비교 (공개 전 값 사용 방지)
+    KST_OFFSET = pd.Timedelta(minutes=CandleResampler.KST_OFFSET_MINUTES)
+
     @staticmethod
-    def get_fear_and_greed_index():
+    def get_fear_and_greed_index() -> dict | None:
         """
-        Alternative.me API에서 최신 Fear & Greed Index를 조회하는 메서드
+        백그라운드에서 갱신된 최신 Fear & Greed Index 를 반환하는 메서드 (I/O 없음)
 
         Returns:
-            dict: 성공시 아래 형식의 딕셔너리 반환
+            dict: 아래 형식의 딕셔너리 (갱신 실패 시 마지막으로 조회한 값)
                 {
                     'value': '현재 인덱스 값',
                     'value_classification': '현재 상태 분류',
                     'timestamp': '데이터 시간stamp',
                     'time_until_update': '다음 업데이트까지 남은 시간'
                 }
-            None: API 호출 실패시
+            None: 아직 조회한 값이 없는 경우
         """
-        # Fear & Greed Index API 엔드포인트
-        url = "https://api.alternative.me/fng/"
-
-        # GET 요청 보내기
-        response = requests.get(url)
-
-        # 응답 상태 코드가 200(성공)인 경우
-        if response.status_code == 200:
-            data = response.json()  # JSON 응답을 파이썬 딕셔너리로 변환
-            return data["data"][0]  # 최신 데이터(첫 번째 항목) 반환
-        else:
-            return None
+        return Fng.provider.peek()
+
+    @staticmethod
+    def get_history(refresh: bool = False, fetch: bool = True) -> pd.DataFrame | None:
+        """
+        일별 Fear & Greed Index 전체 이력 (리플레이 시장 컨텍스트용, backfill.py --fng 로 저장)
+        FNG_HISTORY_PATH 에 저장된 파일을 사용하고, 없거나 어제 이후 값이 없으면 다시 조회합니다.
+
+        Args:
+            refresh (bool): 저장된 파일과 관계없이 다시 조회
+            fetch (bool): False 면 저장된 파일만 사용 (네트워크 조회 안 함)
+
+        Returns:
+            pd.DataFrame: 날짜 인덱스, fng(값)/fng_classification(분류) 컬럼
+                (조회 실패 시 저장된 파일, 둘 다 없으면 None)
+        """
+        history = None
+        if os.path.exists(FNG_HISTORY_PATH):
+            try:
+                history = pd.read_csv(FNG_HISTORY_PATH, index_col=0, parse_dates=True)
+            except pd.errors.EmptyDataError:
+                history = pd.DataFrame(
+                    columns=["fng", "fng_classification"],
+                    index=pd.DatetimeIndex([], name="date"),
+                )
+
+        if not fetch:
+            return history
+        yesterday = pd.Timestamp(datetime.now().date() - timedelta(days=1))
+        if (
+            not refresh
+            and history is not None
+            and not history.empty
+            and history.index[-1] >= yesterday
+        ):
+            return history
+
+        try:
+            response = httpx.get(
+                FNG_URL, params={"limit": 0}, timeout=PROVIDER_TIMEOUT * 5
+            )
+            response.raise_for_status()
+            rows = response.json()["data"]
+        except Exception as e:
+            Logging.warning("Fear & Greed history fetch failed", error=repr(e))
+            return history
+
+        history = pd.DataFrame(
+            {
+                "fng": [int(row["value"]) for row in rows],
+                "fng_classification": [row["value_classification"] for row in rows],
+            },
+            index=pd.to_datetime([int(row["timestamp"]) for row in rows], unit="s"),
+        ).sort_index()
+        history.index = history.index.normalize()
+        history.index.name = "date"
+
+        os.makedirs(os.path.dirname(FNG_HISTORY_PATH) or ".", exist_ok=True)
+        history.to_csv(FNG_HISTORY_PATH)
+        return history
@@ -1,77 +1,133 @@
 import pandas as pd
 import numpy as np
-import talib
+
+from typing import Dict, Iterable, List, Tuple
+
+from src.exchanges.strategy.registry.indicator_graph import (
+    IndicatorFrame,
+    IndicatorGraph,
+    IndicatorSpec,
+)
+from src.utils.timing import StageTimer
 
 
 class Indicator:
     """
     Ta-Lib를 사용하여 기술적 분석 지표들을 계산하고 데이터프레임에 추가하는 클래스
+    - 필요한 지표 목록(IndicatorSpec)만 연속된 NumPy 배열에서 계산
+    - 원본 컬럼과 지표 컬럼을 하나의 배열로 모아 DataFrame 생성
+    - 계산된 지표는 df.attrs 에 기록되어 전략 평가(IndicatorFrame) 에서 다시 계산하지 않음
     """
 
+    # 기존 add_sub_indicators 가 추가하던 지표 (get_candle 기본값)
+    DEFAULT_SPECS: List[IndicatorSpec] = [
+        IndicatorSpec.bbands(20, 2),  # 볼린저 밴드 (20일, 2 표준편차)
+        IndicatorSpec.rsi(14),  # RSI (14일)
+        IndicatorSpec.sma(20),  # 20일 단순이동평균
+        IndicatorSpec.ema(12),  # 12일 지수이동평균
+        IndicatorSpec.macd(12, 26, 9),  # MACD
+        IndicatorSpec.macd_cross(12, 26, 9),  # MACD 교차 (골든크로스/데드크로스)
+        IndicatorSpec.stoch(3, 3, 12),  # 스토캐스틱 (%K 3, %K 스무딩 3, %D 12)
+    ]
+
+    # 기본 지표의 기존 컬럼 이름 (BBANDS 출력 순서: 상단, 중간, 하단)
+    LEGACY_COLUMNS: Dict[str, Tuple[str, ...]] = {
+        IndicatorSpec.bbands(20, 2).key: ("bb_bbm", "bb_bbh", "bb_bbl"),
+        IndicatorSpec.rsi(14).key: ("rsi",),
+        IndicatorSpec.sma(20).key: ("sma_20",),
+        IndicatorSpec.ema(12).key: ("ema_12",),
+        IndicatorSpec.macd(12, 26, 9).key: ("macd", "macd_signal", "macd_hist"),
+        IndicatorSpec.macd_cross(12, 26, 9).key: ("macd_cross",),
+        IndicatorSpec.stoch(3, 3, 12).key: ("stoch_k", "stoch_d"),
+    }
+
+    # 지표 종류별 출력 컬럼 접미사
+    OUTPUT_SUFFIXES: Dict[str, Tuple[str, ...]] = {
+        "rsi": ("",),
+        "sma": ("",),
+        "ema": ("",),
+        "macd": ("", "_signal", "_hist"),
+        "macd_cross": ("",),
+        "stoch": ("_k", "_d"),
+        "bbands": ("_upper", "_middle", "_lower"),
+    }
+
+    # 정수 컬럼으로 반환하는 지표
+    INTEGER_KINDS = {"macd_cross"}
+
     @staticmethod
-    def add_sub_indicators(df):
+    def column_names(spec: IndicatorSpec) -> Tuple[str, ...]:
+        """지표의 출력 컬럼 이름 (기본 지표는 기존 이름, 그 외 "rsi_7", "stoch_12_3_3_k" 형식)"""
+        legacy = Indicator.LEGACY_COLUMNS.get(spec.key)
+        if legacy is not None:
+            return legacy
+        prefix = "_".join([spec.kind, *(str(value) for _, value in spec.params)])
+        return tuple(prefix + suffix for suffix in Indicator.OUTPUT_SUFFIXES[spec.kind])
+
+    @staticmethod
+    @StageTimer.timed("indicators")
+    def compute(
+        df: pd.DataFrame, specs: Iterable[IndicatorSpec] | None = None
+    ) -> pd.DataFrame:
         """
-        주어진 데이터프레임에 여러 기술적 지표들을 계산하여 추가하는 메서드
+        요청한 지표만 계산하여 OHLCV 컬럼 뒤에 추가한 데이터프레임을 반환합니다.
 
         Parameters:
             df (pandas.DataFrame): 주가 데이터가 포함된 데이터프레임
                                  필수 컬럼: 'close' (종가), 'high' (고가), 'low' (저가)
+            specs (Iterable[IndicatorSpec]): 필요한 지표 목록 (None 이면 DEFAULT_SPECS)
 
         Returns:
-            pandas.DataFrame: 기술적 지표들이 추가된 데이터프레임
+            pandas.DataFrame: 요청한 지표 컬럼이 추가된 데이터프레임 (새 객체)
         """
-
         # 결측치 처리
         df = df.dropna()
 
-        # 볼린저 밴드 계산 (20일, 2 표준편차)
-        df["bb_bbm"], df["bb_bbh"], df["bb_bbl"] = talib.BBANDS(
-            df["close"], timeperiod=20, nbdevup=2, nbdevdn=2, matype=talib.MA_Type.SMA
+        requested = {
+            spec.key: spec
+            for spec in (Indicator.DEFAULT_SPECS if specs is None else specs)
+        }
+        frame = IndicatorGraph.compute(
+            IndicatorFrame.from_dataframe(df), requested.values()
         )
 
-        # RSI 계산 (14일)
-        df["rsi"] = talib.RSI(df["close"], timeperiod=14)
+        # 원본 컬럼 + 요청한 지표 컬럼을 하나의 배열로 구성 (의존성으로만 계산된 지표는 제외)
+        outputs = [(spec, frame.get(spec)) for spec in requested.values()]
+        columns = list(df.columns)
+        width = len(columns) + sum(len(values) for _, values in outputs)
+        # 열 우선(F) 배열: 컬럼별로 연속된 메모리 (DataFrame 내부 블록과 같은 배치)
+        block = np.empty((len(df), width), dtype=np.float64, order="F")
+        block[:, : len(columns)] = df.to_numpy(dtype=np.float64)
 
-        # 이동평균선 계산
-        df["sma_20"] = talib.SMA(df["close"], timeperiod=20)  # 20일 단순이동평균
-        df["ema_12"] = talib.EMA(df["close"], timeperiod=12)  # 12일 지수이동평균
+        position = len(columns)
+        indicator_columns: Dict[str, List[str]] = {}
+        for spec, values in outputs:
+            names = Indicator.column_names(spec)
+            for name, value in zip(names, values):
+                block[:, position] = value
+                position += 1
+            columns.extend(names)
+            indicator_columns[spec.key] = list(names)
 
-        # MACD 계산
-        df["macd"], df["macd_signal"], df["macd_hist"] = talib.MACD(
-            df["close"], fastperiod=12, slowperiod=26, signalperiod=9
-        )
+        result = pd.DataFrame(block, index=df.index, columns=columns, copy=False)
+        for spec, _ in outputs:
+            if spec.kind in Indicator.INTEGER_KINDS:
+                for name in indicator_columns[spec.key]:
+                    result[name] = result[name].astype(np.int64)
+        result.attrs["indicators"] = indicator_columns
+        return result
 
-        # MACD 교차 계산 (골든크로스/데드크로스)
-        df["macd_cross"] = np.select(
-            [
-                # 골든크로스
-                (df["macd"].shift(1) < df["macd_signal"].shift(1))
-                & (df["macd"] > df["macd_signal"]),
-                # 데드크로스
-                (df["macd"].shift(1) > df["macd_signal"].shift(1))
-                & (df["macd"] < df["macd_signal"]),
-            ],
-            [1, -1],
-            default=0,
-        )
-
-        # 스토캐스틱 계산
-        df["stoch_k"], df["stoch_d"] = talib.STOCH(
-            df["high"],
-            df["low"],
-            df["close"],
-            fastk_period=3,  # %K 기간
-            slowk_period=3,  # %K 스무딩 기간
-            slowk_matype=0,  # 단순이동평균 사용
-            slowd_period=12,  # %D 기간
-            slowd_matype=0,  # 단순이동평균 사용
-        )
-
-        # # 결과 확인
-        # print(df[["macd", "macd_signal", "macd_cross"]].tail())
+    @staticmethod
+    def add_sub_indicators(df):
+        """
+        주어진 데이터프레임에 기본 기술적 지표들을 계산하여 추가하는 메서드
+        (볼린저 밴드, RSI, SMA20, EMA12, MACD, MACD 교차, 스토캐스틱)
 
-        # # 교차 발생한 날짜만 확인
-        # cross_days = df[df["macd_cross"] != 0]
-        # print("\n교차 발생일:", cross_days[["macd", "macd_signal", "macd_cross"]])
+        Parameters:
+            df (pandas.DataFrame): 주가 데이터가 포함된 데이터프레임
+                                 필수 컬럼: 'close' (종가), 'high' (고가), 'low' (저가)
 
-        return df
+        Returns:
+            pandas.DataFrame: 기술적 지표들이 추가된 데이터프레임
+        """
+        return Indicator.compute(df, Indicator.DEFAULT_SPECS)
@@ -1,14 +1,164 @@
+import atexit
+import json
+import logging
 import os
+import queue
+import sys
+import threading
+import uuid
+
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 
 from colorama import Fore
 from colorama import init as colorama_init
 
+from config import LOG_BACKTEST_SAMPLE, LOG_FORMAT, LOG_LEVEL, LOG_LEVELS
+
+# 요청/트레이스 ID (요청 미들웨어에서 설정, 백그라운드 작업은 "-")
+_request_id: ContextVar[str] = ContextVar("request_id", default="-")
+
+# 백테스트 봉 단위 로그 로거 이름
+BACKTEST_LOGGER = "kestrel.backtest"
+
+
+class _JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포맷 (ts, level, logger, request_id, msg, 추가 필드, 예외)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "msg": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", None) or {})
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _TextFormatter(logging.Formatter):
+    """로컬 개발용 컬러 텍스트 포맷"""
+
+    COLORS = {
+        "DEBUG": Fore.CYAN,
+        "INFO": Fore.GREEN,
+        "WARNING": Fore.YELLOW,
+        "ERROR": Fore.RED,
+        "CRITICAL": Fore.RED,
+    }
+
+    def format(self, record: logging.LogRecord) -> str:
+        color = self.COLORS.get(record.levelname, "")
+        text = f"{color}[{record.levelname}]{Fore.RESET} {record.getMessage()}"
+        fields = getattr(record, "fields", None)
+        if fields:
+            text += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        if record.exc_text:
+            text += "\n" + record.exc_text
+        return text
+
+
+class _QueueHandler(QueueHandler):
+    """
+    호출 스레드에서는 메시지/예외 문자열 확정과 요청 ID 만 기록하고
+    포맷(JSON 직렬화)과 출력은 QueueListener 스레드에서 처리
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.request_id = _request_id.get()
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _SampleFilter(logging.Filter):
+    """N 개 중 1 개만 통과 (백테스트 봉 단위 로그)"""
+
+    def __init__(self, every: int):
+        super().__init__()
+        self.every = every
+        self._count = 0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        self._count += 1
+        return self._count % self.every == 1
+
 
 class Logging:
+    """
+    구조화 로깅 (logging + QueueHandler/QueueListener)
+    - 호출 측은 큐에 넣기만 하고 포맷/출력은 백그라운드 스레드에서 처리
+    - LOG_FORMAT: json (한 줄 JSON) / text (컬러 텍스트)
+    - LOG_LEVEL: 기본 레벨, LOG_LEVELS: 모듈별 레벨 (예: "src.exchanges=DEBUG,httpx=WARNING")
+    - 로거 이름은 호출한 모듈 이름 (모듈별 레벨 적용)
+    - 백테스트 봉 단위 로그는 LOG_BACKTEST_SAMPLE 개 중 1 개만 출력 (0 이면 출력 안 함)
+    """
+
+    _listener: QueueListener | None = None
+    _lock = threading.Lock()
 
     @staticmethod
     def init():
-        colorama_init()
+        with Logging._lock:
+            if Logging._listener is not None:
+                return
+            colorama_init()
+
+            stream = logging.StreamHandler(sys.stdout)
+            stream.setFormatter(
+                _JsonFormatter() if LOG_FORMAT == "json" else _TextFormatter()
+            )
+            log_queue = queue.SimpleQueue()
+            Logging._listener = QueueListener(log_queue, stream)
+            Logging._listener.start()
+            atexit.register(Logging.shutdown)
+
+            root = logging.getLogger()
+            root.handlers = [_QueueHandler(log_queue)]
+            root.setLevel(LOG_LEVEL.upper())
+            for item in filter(None, LOG_LEVELS.split(",")):
+                name, _, level = item.partition("=")
+                logging.getLogger(name.strip()).setLevel(level.strip().upper())
+
+            backtest = logging.getLogger(BACKTEST_LOGGER)
+            if LOG_BACKTEST_SAMPLE <= 0:
+                backtest.disabled = True
+            elif LOG_BACKTEST_SAMPLE > 1:
+                backtest.addFilter(_SampleFilter(LOG_BACKTEST_SAMPLE))
+
+    @staticmethod
+    def shutdown():
+        """큐에 남은 로그를 모두 출력하고 리스너 스레드 종료"""
+        with Logging._lock:
+            if Logging._listener is not None:
+                Logging._listener.stop()
+                Logging._listener = None
+
+    @staticmethod
+    def get_logger(name: str) -> logging.Logger:
+        if Logging._listener is None:
+            Logging.init()
+        return logging.getLogger(name)
+
+    @staticmethod
+    def bind_request_id(request_id: str | None = None) -> Token:
+        """현재 컨텍스트에 요청 ID 설정 (미지정 시 생성)"""
+        return _request_id.set(request_id or uuid.uuid4().hex)
+
+    @staticmethod
+    def reset_request_id(token: Token):
+        _request_id.reset(token)
+
+    @staticmethod
+    def request_id() -> str:
+        return _request_id.get()
 
     @staticmethod
     def langSmith(project_name=None, set_enable=True):
@@ -26,13 +176,40 @@ class Logging:
             Logging.info("LangSmith Disabled.")
 
     @staticmethod
-    def error(msg, error):
-        print(f"{Fore.RED}[ERROR]{Fore.RESET} {msg}", error)
+    def _log(level: int, msg, error=None, **fields):
+        # 호출한 모듈 이름의 로거 사용 (_log <- Logging.info <- 호출 모듈)
+        name = sys._getframe(2).f_globals.get("__name__", "kestrel")
+        logger = Logging.get_logger(name)
+        if not logger.isEnabledFor(level):
+            return
+        exc_info = None
+        if isinstance(error, BaseException):
+            fields["error"] = repr(error)
+            exc_info = (type(error), error, error.__traceback__)
+        elif error is not None:
+            fields["error"] = str(error)
+        logger.log(level, msg, exc_info=exc_info, extra={"fields": fields})
+
+    @staticmethod
+    def error(msg, error=None, **fields):
+        Logging._log(logging.ERROR, msg, error, **fields)
+
+    @staticmethod
+    def info(msg, **fields):
+        Logging._log(logging.INFO, msg, **fields)
+
+    @staticmethod
+    def warning(msg, **fields):
+        Logging._log(logging.WARNING, msg, **fields)
 
     @staticmethod
-    def info(msg):
-        print(f"{Fore.GREEN}[INFO]{Fore.RESET} {msg}")
+    def debug(msg, **fields):
+        Logging._log(logging.DEBUG, msg, **fields)
 
     @staticmethod
-    def warning(msg):
-        print(f"{Fore.YELLOW}[WARNING]{Fore.RESET} {msg}")
+    def backtest(msg, dt=None):
+        """백테스트 봉 단위 로그 (샘플링/비활성화 대상)"""
+        logger = Logging.get_logger(BACKTEST_LOGGER)
+        if logger.disabled or not logger.isEnabledFor(logging.INFO):
+            return
+        logger.info(msg, extra={"fields": {"bar": dt.isoformat()} if dt else {}})
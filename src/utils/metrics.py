@@ -0,0 +1,150 @@
+import os
+
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+
+class Metrics:
+    """
+    Prometheus 지표 수집기 (/metrics 로 노출)
+    - 처리 단계별 소요 시간 (StageTimer 단계: fetch, indicators, strategy, llm, order)
+    - HTTP 요청 지연 시간
+    - 거래소 API 호출 수 (엔드포인트/결과별), 캐시 적중률
+    - LLM 토큰/비용 누적, 주문 결과
+    - 신호 스트림 구독자 수, 전송/병합된 이벤트 수
+    PROMETHEUS_MULTIPROC_DIR 이 설정되면 여러 워커의 지표를 합산해서 내보냅니다.
+    """
+
+    # 단계별 소요 시간 버킷 (초): 캐시 적중 수준 ~ LLM 응답 수준
+    STAGE_BUCKETS = (
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+    )
+
+    STAGE_SECONDS = Histogram(
+        "kestrel_stage_duration_seconds",
+        "요청 처리 단계별 소요 시간 (하위 단계 제외)",
+        ["stage"],
+        buckets=STAGE_BUCKETS,
+    )
+    REQUEST_SECONDS = Histogram(
+        "kestrel_http_request_duration_seconds",
+        "HTTP 요청 처리 시간",
+        ["method", "route", "status"],
+        buckets=STAGE_BUCKETS,
+    )
+    EXCHANGE_CALLS = Counter(
+        "kestrel_exchange_api_calls_total",
+        "거래소 API 호출 수",
+        ["endpoint", "outcome"],
+    )
+    CACHE_LOOKUPS = Counter(
+        "kestrel_cache_lookups_total",
+        "캐시 조회 수",
+        ["cache", "result"],
+    )
+    LLM_TOKENS = Counter(
+        "kestrel_llm_tokens_total",
+        "LLM 사용 토큰 수",
+        ["kind"],
+    )
+    LLM_COST = Counter(
+        "kestrel_llm_cost_usd_total",
+        "LLM 사용 비용 (USD)",
+    )
+    ORDERS = Counter(
+        "kestrel_orders_total",
+        "매매 실행 결과",
+        ["decision", "outcome"],
+    )
+
+    SIGNAL_SUBSCRIBERS = Gauge(
+        "kestrel_signal_stream_subscribers",
+        "신호 스트림 구독자 수",
+        multiprocess_mode="livesum",
+    )
+    SIGNAL_EVENTS = Counter(
+        "kestrel_signal_stream_events_total",
+        "신호 스트림 이벤트 수 (coalesced: 느린 구독자 버퍼에서 최신 값으로 대체)",
+        ["event"],
+    )
+
+    @classmethod
+    def observe_stage(cls, stage: str, seconds: float):
+        cls.STAGE_SECONDS.labels(stage=stage).observe(seconds)
+
+    @classmethod
+    def observe_request(cls, method: str, route: str, status: int, seconds: float):
+        cls.REQUEST_SECONDS.labels(
+            method=method, route=route, status=str(status)
+        ).observe(seconds)
+
+    @classmethod
+    @contextmanager
+    def exchange_call(cls, endpoint: str):
+        """
+        거래소 API 호출 수를 결과별로 집계 (with 문 또는 데코레이터로 사용)
+        - ok: 정상 반환, error: 예외 발생
+        """
+        try:
+            yield
+        except Exception:
+            cls.EXCHANGE_CALLS.labels(endpoint=endpoint, outcome="error").inc()
+            raise
+        cls.EXCHANGE_CALLS.labels(endpoint=endpoint, outcome="ok").inc()
+
+    @classmethod
+    def cache_lookup(cls, cache: str, hit: bool):
+        cls.CACHE_LOOKUPS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+    @classmethod
+    def llm_usage(cls, answer: dict):
+        """KestrelAiAgent 응답의 토큰/비용 누적"""
+        cls.LLM_TOKENS.labels(kind="prompt").inc(answer.get("prompt_tokens") or 0)
+        cls.LLM_TOKENS.labels(kind="completion").inc(
+            answer.get("completion_tokens") or 0
+        )
+        cls.LLM_COST.inc(answer.get("total_cost") or 0)
+
+    @classmethod
+    def order(cls, decision: str, outcome: str):
+        cls.ORDERS.labels(decision=decision.upper(), outcome=outcome).inc()
+
+    @classmethod
+    def signal_event(cls, event: str, count: int = 1):
+        cls.SIGNAL_EVENTS.labels(event=event).inc(count)
+
+    @staticmethod
+    def export() -> tuple[bytes, str]:
+        """
+        Prometheus 텍스트 포맷으로 지표를 내보냅니다.
+
+        Returns:
+            tuple[bytes, str]: (본문, Content-Type)
+        """
+        if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+            registry = CollectorRegistry()
+            multiprocess.MultiProcessCollector(registry)
+            return generate_latest(registry), CONTENT_TYPE_LATEST
+        return generate_latest(), CONTENT_TYPE_LATEST
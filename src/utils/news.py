@@ -1,27 +1,49 @@
 import os
-import requests
 
+import httpx
 
-class News:
-    @staticmethod
-    def get_google_news(query: str):
+from typing import Hashable, Tuple
+
+from config import NEWS_TTL
+from src.utils.cached_provider import CachedProvider
+
+
+class NewsProvider(CachedProvider[list]):
+    """검색어별 Google 뉴스 헤드라인 (SerpApi, NEWS_TTL 동안 캐시)"""
+
+    name = "news"
+
+    async def _fetch(
+        self, client: httpx.AsyncClient, key: Hashable
+    ) -> Tuple[list, float]:
         serpapi_key = os.getenv("SERPAPI_API_KEY")
+        if not serpapi_key:
+            raise ValueError("SERPAPI_API_KEY is not set")
+
         url = "https://serpapi.com/search.json"
-        params = {"engine": "google_news", "q": query, "api_key": serpapi_key}
-
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()  # Raises a HTTPError if the status is 4xx, 5xx
-            data = response.json()
-
-            news_results = data.get("news_results", [])
-            headlines = []
-            for item in news_results:
-                headlines.append(
-                    {"title": item.get("title", ""), "date": item.get("date", "")}
-                )
-
-            return headlines[:5]  # 최신 5개의 뉴스 헤드라인만 반환
-        except requests.RequestException as e:
-            print(f"Error fetching news: {e}")
-            return []
+        params = {"engine": "google_news", "q": key, "api_key": serpapi_key}
+
+        response = await client.get(url, params=params)
+        response.raise_for_status()  # Raises a HTTPError if the status is 4xx, 5xx
+        data = response.json()
+
+        news_results = data.get("news_results", [])
+        headlines = []
+        for item in news_results:
+            headlines.append(
+                {"title": item.get("title", ""), "date": item.get("date", "")}
+            )
+
+        return headlines[:5], self.ttl  # 최신 5개의 뉴스 헤드라인만 반환
+
+
+class News:
+    provider = NewsProvider(ttl=NEWS_TTL)
+
+    @staticmethod
+    def get_google_news(query: str) -> list | None:
+        """
+        백그라운드에서 갱신된 검색어의 최신 뉴스 헤드라인 (I/O 없음)
+        처음 요청한 검색어는 갱신 대상에 등록되고 값이 준비될 때까지 None 을 반환합니다.
+        """
+        return News.provider.peek(query)
@@ -0,0 +1,164 @@
+import json
+import os
+import re
+import sys
+import threading
+import time
+import uuid
+
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from types import CodeType, FrameType
+from typing import Dict, Iterator, List
+
+from config import PROFILE_DIR, PROFILE_INTERVAL, PROFILE_MAX_FILES
+
+
+class SamplingProfiler:
+    """
+    대상 스레드의 호출 스택을 주기적으로 샘플링하는 프로파일러
+    - 별도 스레드에서 sys._current_frames() 로 스택만 읽으므로 대상 코드에는 계측이 없음
+    - 결과는 folded stack 포맷 ("a;b;c 샘플수") 으로 flamegraph.pl / speedscope 에서 열 수 있음
+    - 이벤트 루프 스레드를 샘플링하면 같은 시간에 처리된 다른 요청의 스택도 포함될 수 있음
+    """
+
+    def __init__(
+        self, thread_id: int | None = None, interval: float = PROFILE_INTERVAL
+    ):
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.duration = 0.0
+        self._labels: Dict[CodeType, str] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._started = 0.0
+
+    def start(self):
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(
+            target=self._run, name="kestrel-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.duration = time.perf_counter() - self._started
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._fold(frame)] += 1
+
+    def _fold(self, frame: FrameType | None) -> str:
+        stack: List[str] = []
+        while frame is not None:
+            code = frame.f_code
+            label = self._labels.get(code)
+            if label is None:
+                module = frame.f_globals.get("__name__", "?")
+                label = self._labels[code] = f"{module}:{code.co_qualname}"
+            stack.append(label)
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    def folded(self) -> str:
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.samples.most_common()
+        )
+
+
+class Profiler:
+    """
+    요청/백테스트 단위 온디맨드 프로파일링
+    - capture() 구간 동안 샘플링 후 PROFILE_DIR 에 {id}.folded 와 메타데이터 {id}.json 저장
+    - 최근 PROFILE_MAX_FILES 개만 보관
+    """
+
+    _ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+
+    @staticmethod
+    def new_id() -> str:
+        return uuid.uuid4().hex
+
+    @staticmethod
+    def is_valid_id(profile_id: str) -> bool:
+        return bool(Profiler._ID_PATTERN.match(profile_id))
+
+    @staticmethod
+    @contextmanager
+    def capture(name: str, profile_id: str | None = None) -> Iterator[str]:
+        """
+        구간 실행 중 현재 스레드를 샘플링하고 프로파일을 저장합니다.
+
+        Args:
+            name (str): 프로파일 이름 (예: "GET /v1/trade/agent", "backtest")
+            profile_id (str): 프로파일 ID (요청 ID/작업 ID, 미지정 시 생성)
+
+        Yields:
+            str: 프로파일 ID
+        """
+        if profile_id is None or not Profiler.is_valid_id(profile_id):
+            profile_id = Profiler.new_id()
+        profiler = SamplingProfiler()
+        created_at = datetime.now()
+        profiler.start()
+        try:
+            yield profile_id
+        finally:
+            profiler.stop()
+            Profiler.save(profile_id, name, created_at, profiler)
+
+    @staticmethod
+    def save(
+        profile_id: str, name: str, created_at: datetime, profiler: SamplingProfiler
+    ):
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        with open(Profiler.path(profile_id), "w", encoding="utf-8") as f:
+            f.write(profiler.folded())
+        meta = {
+            "id": profile_id,
+            "name": name,
+            "created_at": created_at.isoformat(),
+            "duration": round(profiler.duration, 6),
+            "interval": profiler.interval,
+            "samples": sum(profiler.samples.values()),
+        }
+        with open(
+            os.path.join(PROFILE_DIR, f"{profile_id}.json"), "w", encoding="utf-8"
+        ) as f:
+            json.dump(meta, f)
+        Profiler._prune()
+
+    @staticmethod
+    def path(profile_id: str) -> str:
+        return os.path.join(PROFILE_DIR, f"{profile_id}.folded")
+
+    @staticmethod
+    def list() -> List[dict]:
+        """저장된 프로파일 메타데이터 (최신순)"""
+        if not os.path.isdir(PROFILE_DIR):
+            return []
+        profiles = []
+        for filename in os.listdir(PROFILE_DIR):
+            if not filename.endswith(".json"):
+                continue
+            try:
+                with open(os.path.join(PROFILE_DIR, filename), encoding="utf-8") as f:
+                    profiles.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return sorted(profiles, key=lambda meta: meta["created_at"], reverse=True)
+
+    @staticmethod
+    def _prune():
+        for meta in Profiler.list()[PROFILE_MAX_FILES:]:
+            for ext in (".folded", ".json"):
+                try:
+                    os.remove(os.path.join(PROFILE_DIR, f"{meta['id']}{ext}"))
+                except OSError:
+                    pass
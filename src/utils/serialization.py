@@ -0,0 +1,104 @@
+import orjson
+import numpy as np
+import pandas as pd
+
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+
+class Serializer:
+    """
+    JSON 직렬화 (orjson 기반, 한 번만 인코딩)
+    - DataFrame 은 문자열(to_json) 대신 중첩 객체(frame)로 넣고 전체를 한 번에 인코딩
+      (JSON 안의 JSON 문자열로 이중 인코딩/이스케이프 되지 않음)
+    - frame(): {"columns", "index", "data"} split 형태, 숫자 블록은 NumPy 배열 그대로 인코딩
+      (to_json 기본 형태처럼 값마다 타임스탬프 키를 반복하지 않음)
+    - NumPy 스칼라/배열, 날짜, pydantic 모델, Enum 지원 (그 외는 str)
+    """
+
+    OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    # DataFrame.to_json 기본 정밀도 (소수점 10자리)
+    FRAME_DECIMALS = 10
+
+    @staticmethod
+    def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+        option = Serializer.OPTIONS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=Serializer._default, option=option)
+
+    @staticmethod
+    def dumps_str(obj: Any, sort_keys: bool = False) -> str:
+        return Serializer.dumps(obj, sort_keys=sort_keys).decode()
+
+    @staticmethod
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    @staticmethod
+    def frame(df: pd.DataFrame, decimals: int | None = FRAME_DECIMALS) -> Dict:
+        """
+        DataFrame 을 split 형태의 딕셔너리로 변환합니다. (NaN -> null)
+
+        Args:
+            df (pd.DataFrame): OHLCV / 보조지표 데이터프레임
+            decimals (int): 실수 반올림 자리수 (None 이면 반올림 없음)
+
+        Returns:
+            Dict: {"columns": [...], "index": [...], "data": [[...], ...]}
+        """
+        if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is None:
+            # datetime64 배열은 ISO 8601 문자열로 바로 인코딩
+            index = df.index.to_numpy(dtype="datetime64[ns]")
+        else:
+            index = df.index.tolist()
+
+        if all(
+            is_numeric_dtype(dtype) and not is_bool_dtype(dtype) for dtype in df.dtypes
+        ):
+            # orjson 은 C 연속 배열만 바로 인코딩 (DataFrame 블록은 열 우선 배열)
+            data = np.ascontiguousarray(df.to_numpy(dtype=np.float64))
+            if decimals is not None:
+                data = np.round(data, decimals, out=data)
+        else:
+            data = df.astype(object).where(df.notna(), None).to_numpy().tolist()
+
+        return {
+            "columns": [str(column) for column in df.columns],
+            "index": index,
+            "data": data,
+        }
+
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, pd.DataFrame):
+            return Serializer.frame(obj)
+        if isinstance(obj, pd.Series):
+            return obj.where(obj.notna(), None).tolist()
+        if isinstance(obj, (pd.Timestamp, datetime, date)):
+            return obj.isoformat()
+        if isinstance(obj, BaseModel):
+            return obj.model_dump(mode="json", by_alias=True)
+        if isinstance(obj, Enum):
+            return obj.value
+        if isinstance(obj, Decimal):
+            return float(obj)
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+        if isinstance(obj, np.generic):
+            return obj.item()
+        return str(obj)
+
+
+class OrjsonResponse(JSONResponse):
+    """orjson 으로 응답 본문을 인코딩하는 JSONResponse (FastAPI 기본 응답 클래스)"""
+
+    def render(self, content: Any) -> bytes:
+        return Serializer.dumps(content)
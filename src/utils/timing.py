@@ -0,0 +1,90 @@
+import functools
+import time
+
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.metrics import Metrics
+
+
+class StageTimer:
+    """
+    요청 단위 처리 단계별 소요 시간 측정기
+    - 요청 시작 시 begin() 으로 현재 컨텍스트에 타이머를 설정
+    - 코드 곳곳의 stage()/timed() 는 활성 타이머가 있을 때만 시간을 누적 (없으면 비용 없음)
+    - 단계가 중첩되면 안쪽 단계 시간은 바깥 단계에서 제외 (단계별 합 <= 전체 시간)
+    - 측정한 단계 시간은 Prometheus 히스토그램(Metrics.STAGE_SECONDS)에도 기록
+    """
+
+    # 측정 단계 (Server-Timing 헤더 출력 순서)
+    STAGES: List[str] = ["fetch", "indicators", "strategy", "llm", "order"]
+
+    _current: ContextVar[Optional["StageTimer"]] = ContextVar(
+        "stage_timer", default=None
+    )
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}  # 단계별 누적 시간 (초)
+        self._stack: List[List] = []  # [단계 이름, 시작 시각, 하위 단계 시간]
+
+    @classmethod
+    def begin(cls) -> Tuple["StageTimer", Token]:
+        timer = cls()
+        return timer, cls._current.set(timer)
+
+    @classmethod
+    def end(cls, token: Token):
+        cls._current.reset(token)
+
+    @classmethod
+    def current(cls) -> Optional["StageTimer"]:
+        return cls._current.get()
+
+    @classmethod
+    @contextmanager
+    def stage(cls, name: str):
+        timer = cls._current.get()
+        if timer is None:
+            yield
+            return
+        frame = [name, time.perf_counter(), 0.0]
+        timer._stack.append(frame)
+        try:
+            yield
+        finally:
+            timer._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            timer.stages[name] = timer.stages.get(name, 0.0) + elapsed - frame[2]
+            Metrics.observe_stage(name, elapsed - frame[2])
+            if timer._stack:
+                timer._stack[-1][2] += elapsed
+
+    @classmethod
+    def timed(cls, name: str):
+        """메서드/함수 실행 시간을 name 단계로 측정하는 데코레이터"""
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if cls._current.get() is None:
+                    return func(*args, **kwargs)
+                with cls.stage(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+    def server_timing(self) -> str:
+        """Server-Timing 헤더 값 (단위: ms)"""
+        names = [name for name in self.STAGES if name in self.stages] + [
+            name for name in self.stages if name not in self.STAGES
+        ]
+        metrics = [f"{name};dur={self.stages[name] * 1000:.3f}" for name in names]
+        metrics.append(f"total;dur={self.total() * 1000:.3f}")
+        return ", ".join(metrics)
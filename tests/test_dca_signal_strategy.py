@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+
+from src.exchanges.strategy.registry.ensemble_strategy import EnsembleStrategy
+from src.exchanges.strategy.registry.strategy_engine import StrategyEngine
+from src.exchanges.strategy.registry.strategy_state import StrategyStateStore
+from src.exchanges.strategy.strategies.datas.types import StrategyType, TradingSignal
+
+WINDOW = 200
+
+
+def make_candles(days: int) -> pd.DataFrame:
+    index = pd.date_range("2024-01-01", periods=days, freq="D")
+    close = np.linspace(100.0, 110.0, days)
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": np.full(days, 1000.0),
+        },
+        index=index,
+    )
+
+
+def rolling_windows(df: pd.DataFrame):
+    """실시간 폴링처럼 마지막 봉이 진행 중인 200봉 윈도우를 하루씩 밀면서 반환"""
+    for end in range(WINDOW, len(df) + 1):
+        yield df.iloc[end - WINDOW : end]
+
+
+def test_dca_emits_buy_on_period_through_state_store():
+    store = StrategyStateStore()
+    df = make_candles(WINDOW + 70)
+
+    buys = [
+        window.index[-1]
+        for window in rolling_windows(df)
+        if store.evaluate("KRW-BTC", "day", StrategyType.DCA, window).signal
+        == TradingSignal.BUY
+    ]
+
+    # 평가 시작 다음 날 첫 매수 후 30일마다 매수
+    assert len(buys) == 3
+    assert all((b - a).days == 30 for a, b in zip(buys, buys[1:]))
+
+
+def test_ensemble_uses_stateful_dca_signal():
+    store = StrategyStateStore()
+    engine = StrategyEngine()
+    ensemble = EnsembleStrategy()
+    df = make_candles(WINDOW + 10)
+
+    dca_signals = []
+    for window in rolling_windows(df):
+        signals = {}
+        for member in ensemble.strategy_types:
+            signal = store.evaluate("KRW-BTC", "day", member, window)
+            if signal is not None:
+                signals[member] = signal
+        result = engine.evaluate_ensemble(window, ensemble=ensemble, signals=signals)
+        dca_signals.append(result.signals[StrategyType.DCA].signal)
+
+    assert TradingSignal.BUY in dca_signals